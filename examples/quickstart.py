@@ -6,6 +6,8 @@ This example demonstrates the basic usage of the environment
 with a simple control strategy.
 """
 
+import time
+
 import numpy as np
 from wedm import WireEDMEnv, EnvironmentConfig
 
@@ -36,22 +38,30 @@ def main():
     step_count = 0
     spark_count = 0
 
+    # Bind hot-loop lookups once (env.state is only replaced by reset())
+    state = env.state
+    step = env.step
+
+    # Throttle progress output by wall-clock time, not by step count
+    print_interval = 0.5  # s
+    next_print = time.monotonic() + print_interval
+
     print("Running simulation...")
     for i in range(100000):
-        obs, reward, terminated, truncated, info = env.step(action)
+        obs, reward, terminated, truncated, info = step(action)
 
         # Count sparks
         if info.get("spark_state", 0) == 1:
             spark_count += 1
 
-        # Print progress every 10 control steps
+        # Print progress at most every print_interval seconds
         if info.get("control_step", False):
             step_count += 1
-            if step_count % 10 == 0:
-                gap = env.state.workpiece_position - env.state.wire_position
-                progress = (
-                    env.state.workpiece_position / env.state.target_position
-                ) * 100
+            now = time.monotonic()
+            if now >= next_print:
+                next_print = now + print_interval
+                gap = state.workpiece_position - state.wire_position
+                progress = (state.workpiece_position / state.target_position) * 100
                 print(
                     f"Step {step_count}: Gap={gap:.1f}µm, Progress={progress:.1f}%, Sparks={spark_count}"
                 )
@@ -9,6 +9,8 @@ Note: Requires pygame to be installed:
     pip install pygame
 """
 
+import time
+
 import numpy as np
 
 try:
@@ -52,34 +54,42 @@ def main():
 
     # Run simulation
     step_count = 0
+    sim_step = 0
     running = True
     clock = pygame.time.Clock()
+    event_interval = 1000  # Pump window events once per simulated ms
+    print_interval = 2.0  # s, wall-clock throttle for progress output
+    next_print = time.monotonic() + print_interval
 
     print("Running simulation with visualization...")
     print("Press ESC or close window to exit\n")
 
     while running:
-        # Handle pygame events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
+        # Handle pygame events (not every µs: SDL calls are costly)
+        if sim_step % event_interval == 0:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        running = False
 
         # Step environment
         obs, reward, terminated, truncated, info = env.step(action)
+        sim_step += 1
 
-        # Render the environment
-        env.render()
+        # Render and print progress only on control steps (every 1 ms simulated);
+        # rendering every µs would tie simulated time to the 60 FPS cap
+        if info.get("control_step", False):
+            env.render()
 
-        # Control frame rate (optional, for smoother visualization)
-        clock.tick(60)  # 60 FPS
+            # Control frame rate (optional, for smoother visualization)
+            clock.tick(60)  # 60 FPS
 
-        # Print progress occasionally
-        if info.get("control_step", False):
             step_count += 1
-            if step_count % 50 == 0:
+            now = time.monotonic()
+            if now >= next_print:
+                next_print = now + print_interval
                 gap = env.state.workpiece_position - env.state.wire_position
                 progress = (
                     env.state.workpiece_position / env.state.target_position
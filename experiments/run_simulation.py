@@ -21,9 +21,31 @@ from src.wedm.envs import WireEDMEnv
 from src.wedm.utils.logger import SimulationLogger, LoggerConfig
 
 
+def _clamp(x: float, lo: float, hi: float) -> float:
+    """Scalar clamp; avoids np.clip's ufunc dispatch on every controller call."""
+    return lo if x < lo else hi if x > hi else x
+
+
 def create_gap_controller(desired_gap: float = 5.0):  # µm
     """Create adaptive gap controller that works with both control modes."""
 
+    # Allocated once and updated in place: env.step consumes the arrays before
+    # the controller is called again, so aliasing is safe
+    action = {
+        "servo": np.zeros(1, dtype=np.float32),
+        "generator_control": {
+            "target_voltage": np.array([80.0], dtype=np.float32),
+            # Current mode selection (1-19 maps directly to I1-I19):
+            # Mode 13 = I13 = 215A machine current → mapped to 5A crater data
+            # Other options: 5=I5(60A→1A), 9=I9(110A→3A), 17=I17(425A→11A), 19=I19(600A→17A)
+            "current_mode": np.array(
+                [7], dtype=np.int32
+            ),  # I13 mode - good balance for general machining
+            "ON_time": np.array([2.0], dtype=np.float32),
+            "OFF_time": np.array([33.0], dtype=np.float32),
+        },
+    }
+
     def controller(env: WireEDMEnv) -> Dict[str, Any]:
         gap = env.state.workpiece_position - env.state.wire_position
         error = gap - desired_gap
@@ -34,22 +56,10 @@ def create_gap_controller(desired_gap: float = 5.0):  # µm
         else:  # velocity control
             # Velocity control: return target velocity [µm/s]
             delta = error * 50.0  # Higher gain for velocity control
-            delta = np.clip(delta, -1000.0, 1000.0)  # Limit velocity command
+            delta = _clamp(delta, -1000.0, 1000.0)  # Limit velocity command
 
-        return {
-            "servo": np.array([delta], dtype=np.float32),
-            "generator_control": {
-                "target_voltage": np.array([80.0], dtype=np.float32),
-                # Current mode selection (1-19 maps directly to I1-I19):
-                # Mode 13 = I13 = 215A machine current → mapped to 5A crater data
-                # Other options: 5=I5(60A→1A), 9=I9(110A→3A), 17=I17(425A→11A), 19=I19(600A→17A)
-                "current_mode": np.array(
-                    [7], dtype=np.int32
-                ),  # I13 mode - good balance for general machining
-                "ON_time": np.array([2.0], dtype=np.float32),
-                "OFF_time": np.array([33.0], dtype=np.float32),
-            },
-        }
+        action["servo"][0] = delta
+        return action
 
     return controller
 
@@ -64,11 +74,25 @@ def create_voltage_controller(target_voltage: float = 30.0):  # V
     Kp = 0.05  # Proportional gain
     Ki = 0.1  # Integral gain
 
-    def controller(env: WireEDMEnv, voltage_history: list = None) -> Dict[str, Any]:
+    # Allocated once and updated in place (see create_gap_controller)
+    action = {
+        "servo": np.zeros(1, dtype=np.float32),
+        "generator_control": {
+            "target_voltage": np.array([80.0], dtype=np.float32),
+            "current_mode": np.array([7], dtype=np.int32),
+            "ON_time": np.array([2.0], dtype=np.float32),
+            "OFF_time": np.array([33.0], dtype=np.float32),
+        },
+    }
+
+    def controller(
+        env: WireEDMEnv, voltage_history: Optional[np.ndarray] = None
+    ) -> Dict[str, Any]:
         nonlocal integral_error
 
-        # Calculate average voltage over the provided history (last 1ms of data)
-        if voltage_history and len(voltage_history) > 0:
+        # Calculate average voltage over the provided history (last 1ms of data);
+        # a contiguous float64 view, so np.mean needs no list->array conversion
+        if voltage_history is not None and len(voltage_history) > 0:
             avg_voltage = np.mean(voltage_history)
         else:
             # Fallback to current voltage if no history provided
@@ -79,7 +103,7 @@ def create_voltage_controller(target_voltage: float = 30.0):  # V
         integral_error += error
 
         # Integral windup protection
-        integral_error = np.clip(integral_error, -100.0, 100.0)
+        integral_error = _clamp(integral_error, -100.0, 100.0)
 
         # PI output - FIXED SIGN: when voltage is too high (negative error),
         # we want positive delta to move wire closer and reduce gap
@@ -90,21 +114,14 @@ def create_voltage_controller(target_voltage: float = 30.0):  # V
         if env.mechanics.control_mode == "position":
             # Position control: return position increment [µm]
             delta = pi_output
-            delta = np.clip(delta, -5.0, 5.0)  # Limit position command
+            delta = _clamp(delta, -5.0, 5.0)  # Limit position command
         else:  # velocity control
             # Velocity control: return target velocity [µm/s]
             delta = pi_output * 100.0  # Scale for velocity control
-            delta = np.clip(delta, -1000.0, 1000.0)  # Limit velocity command
+            delta = _clamp(delta, -1000.0, 1000.0)  # Limit velocity command
 
-        return {
-            "servo": np.array([delta], dtype=np.float32),
-            "generator_control": {
-                "target_voltage": np.array([80.0], dtype=np.float32),
-                "current_mode": np.array([7], dtype=np.int32),
-                "ON_time": np.array([2.0], dtype=np.float32),
-                "OFF_time": np.array([33.0], dtype=np.float32),
-            },
-        }
+        action["servo"][0] = delta
+        return action
 
     return controller
 
@@ -114,6 +131,7 @@ def setup_logger(
     log_to_file: bool = True,
     log_strategy: str = "full_field",
     enable_plotting: bool = False,
+    log_interval: int = 1,
 ) -> LoggerConfig:
     """
     Setup logger configuration with flexible temperature logging strategy.
@@ -123,6 +141,7 @@ def setup_logger(
         log_to_file: Whether to log to file
         log_strategy: "full_field", "zone_mean", or "both"
         enable_plotting: Whether plotting will be used (affects memory logging)
+        log_interval: Log every N µs steps (1 = every step, 1000 = once per control step)
     """
     base_signals = [
         "time",
@@ -148,10 +167,16 @@ def setup_logger(
     else:
         raise ValueError(f"Unknown log_strategy: {log_strategy}")
 
+    # Downsample at the source: logging every µs is only needed for raw voltage traces
+    if log_interval > 1:
+        log_frequency = {"type": "interval", "value": log_interval}
+    else:
+        log_frequency = {"type": "every_step"}
+
     if log_to_file:
         return {
             "signals_to_log": signals_to_log,
-            "log_frequency": {"type": "every_step"},
+            "log_frequency": log_frequency,
             "backend": {
                 "type": "numpy",
                 "filepath": f"logs/smoke_test_{control_mode}_control.npz",
@@ -163,9 +188,9 @@ def setup_logger(
         memory_signals = signals_to_log if enable_plotting else ["time"]
         return {
             "signals_to_log": memory_signals,
-            "log_frequency": {
-                "type": "every_step" if enable_plotting else "control_step"
-            },
+            "log_frequency": (
+                log_frequency if enable_plotting else {"type": "control_step"}
+            ),
             "backend": {"type": "memory"},
         }
 
@@ -199,7 +224,7 @@ def initialize_environment(
     env.state.workpiece_position = 70.0  # µm
     env.state.wire_position = 10.0  # µm
     env.state.target_position = 5_000.0  # µm
-    env.state.spark_status = [0, None, 0]
+    env.state.spark_state = 0  # No spark in progress
     env.state.dielectric_temperature = 293.15  # Room temperature in K
 
     # Initialize wire temperature array
@@ -238,52 +263,65 @@ def run_simulation(
     else:  # voltage
         controller = create_voltage_controller(target_voltage)
 
-    # For voltage controller, maintain voltage history over last 1ms
-    voltage_history = []
-    time_history = []
+    # For voltage controller, keep the last 1ms (1000 µs at 1 µs/step) of
+    # voltages in a fixed-size ring buffer with a running sum: O(1) per step
+    window_len = 1000
+    voltage_buf = np.zeros(window_len, dtype=np.float64)
+    head = 0  # Next slot to overwrite (oldest sample once the window is full)
+    count = 0  # Number of valid samples in the window
+    running_sum = 0.0
 
     action = (
         controller(env)
         if controller_type == "gap"
-        else controller(env, voltage_history)
+        else controller(env, voltage_buf[:count])
     )
 
     # Print simulation start message
     print(f"🚀 Starting simulation for {max_steps:,} µs...")
     start_time = time.time()
 
+    # Bind hot-loop lookups once (env.state is only replaced by reset())
+    state = env.state
+    env_step = env.step
+    collect = logger.collect
+    track_voltage = controller_type == "voltage"
+
     for step in range(max_steps):
         # Run the simulation step
-        obs, reward, terminated, truncated, info = env.step(action)
-        logger.collect(env.state, info)
+        obs, reward, terminated, truncated, info = env_step(action)
+        collect(state, info)
 
         # For voltage controller, collect voltage history every µs
-        if controller_type == "voltage":
-            current_voltage = (
-                env.state.voltage if env.state.voltage is not None else 0.0
-            )
-            voltage_history.append(current_voltage)
-            time_history.append(env.state.time)
+        if track_voltage:
+            current_voltage = state.voltage
+            if current_voltage is None:
+                current_voltage = 0.0
+            # Overwrite the oldest sample once the 1ms window is full
+            running_sum += current_voltage - voltage_buf[head]
+            voltage_buf[head] = current_voltage
+            head = (head + 1) % window_len
+            if count < window_len:
+                count += 1
 
-            # Keep only last 1ms of data (1000 µs)
-            cutoff_time = env.state.time - 1000.0
-            while time_history and time_history[0] < cutoff_time:
-                voltage_history.pop(0)
-                time_history.pop(0)
+        try:
+            control_step = info["control_step"]
+        except KeyError:  # Wire-break info only carries "wire_broken"
+            control_step = False
 
         # Update action on control steps
-        if info.get("control_step", False):
+        if control_step:
             if controller_type == "gap":
                 action = controller(env)
             else:  # voltage - pass the collected voltage history
-                action = controller(
-                    env, voltage_history.copy()
-                )  # Pass copy to avoid modification
+                # Pass a view: the controller only reads the window, and the
+                # ring buffer is not written again until the next env step
+                action = controller(env, voltage_buf[:count])
 
             if verbose:
                 # Calculate true average for display
-                if controller_type == "voltage" and voltage_history:
-                    true_avg_voltage = np.mean(voltage_history)
+                if controller_type == "voltage" and count:
+                    true_avg_voltage = running_sum / count
                     print_step_info(
                         env, step, controller_type, target_voltage, true_avg_voltage
                     )
@@ -779,6 +817,13 @@ def main():
         help="Target average voltage for voltage controller in V (default: 30.0)",
     )
 
+    parser.add_argument(
+        "--log-interval",
+        type=int,
+        default=1,
+        help="Log every N µs (default: 1; use 1000 to log once per control step)",
+    )
+
     args = parser.parse_args()
 
     # Setup
@@ -787,6 +832,7 @@ def main():
         log_to_file=not args.no_log,
         log_strategy=args.log_strategy,
         enable_plotting=args.plot,
+        log_interval=args.log_interval,
     )
     env = initialize_environment(args.mode, seed=0, log_strategy=args.log_strategy)
 
@@ -7,6 +7,11 @@ Records 1ms of simulation time with high-frequency logging to capture thermal dy
 Usage:
     python experiments/single_spark_animation.py --save --out single_spark.mp4
     python experiments/single_spark_animation.py  # Just show live animation
+
+The temperature summary helper is compiled with cache=NUMBA_CACHE, so the JIT
+cost is paid once per machine: compiled code is stored next to this file in
+__pycache__/ (or under $NUMBA_CACHE_DIR when set, e.g. for read-only checkouts).
+Set WEDM_NUMBA_CACHE=0 to disable the on-disk cache.
 """
 from __future__ import annotations
 
@@ -16,17 +21,32 @@ import pathlib
 from typing import Dict, Any, Tuple, Optional
 
 import numpy as np
+import matplotlib as mpl
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+from numba import njit
 import sys
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 
+from src.wedm.core.jit import NUMBA_CACHE
 from src.wedm.envs import WireEDMEnv
-from src.wedm.utils.logger import SimulationLogger, LoggerConfig
+from src.wedm.utils.logger import SimulationLogger, LoggerConfig, load_npy_log
 from src.wedm.modules.wire import WireModuleParameters
 
 
+@njit(cache=NUMBA_CACHE, fastmath=True)
+def _mean_max(a):
+    """Mean and maximum of a 1-D array in a single pass."""
+    total = 0.0
+    peak = a[0]
+    for x in a:
+        total += x
+        if x > peak:
+            peak = x
+    return total / a.size, peak
+
+
 def create_single_spark_controller(
     spark_time_us: float = 50.0,  # Time when spark occurs (µs)
     spark_duration_us: float = 2.0,  # Duration of spark (µs)
@@ -46,43 +66,65 @@ def create_single_spark_controller(
         current_mode: Generator current mode setting
 
     Returns:
-        Controller function that returns actions to keep wire stationary
+        Controller function that returns the (shared, static) action that keeps
+        the wire stationary
     """
 
+    # Nothing in the action changes during the experiment: build it once
+    action = {
+        "servo": np.array([0.0], dtype=np.float32),  # Keep wire stationary
+        "generator_control": {
+            "target_voltage": np.array([voltage], dtype=np.float32),
+            "current_mode": np.array([current_mode], dtype=np.int32),
+            "ON_time": np.array([spark_duration_us], dtype=np.float32),
+            "OFF_time": np.array([1000.0], dtype=np.float32),  # Long OFF time
+        },
+    }
+
     def controller(env: WireEDMEnv) -> Dict[str, Any]:
-        """Generate action to keep wire stationary with appropriate generator settings."""
-        return {
-            "servo": np.array([0.0], dtype=np.float32),  # Keep wire stationary
-            "generator_control": {
-                "target_voltage": np.array([voltage], dtype=np.float32),
-                "current_mode": np.array([current_mode], dtype=np.int32),
-                "ON_time": np.array([spark_duration_us], dtype=np.float32),
-                "OFF_time": np.array([1000.0], dtype=np.float32),  # Long OFF time
-            },
-        }
+        """Return the static action that keeps the wire stationary."""
+        return action
 
     return controller
 
 
-def setup_single_spark_logger() -> LoggerConfig:
-    """Setup logger for high-frequency wire temperature recording."""
-    return {
+def setup_single_spark_logger(
+    log_format: str = "npy", preallocate: Optional[int] = None
+) -> LoggerConfig:
+    """
+    Setup logger for high-frequency wire temperature recording.
+
+    Args:
+        log_format: "npy" (default) for a directory with one .npy file per signal
+            (memory-mappable on load), or "npz" for a single uncompressed archive
+        preallocate: Expected number of logged steps; columns are sized once up
+            front ("npy" writes them straight into memory-mapped files)
+    """
+    if log_format == "npy":
+        backend = {"type": "npy", "filepath": "logs/single_spark_temperature_npy"}
+    else:
+        # Uncompressed: zlib dominates finalize time and the data is short-lived
+        backend = {
+            "type": "numpy",
+            "filepath": "logs/single_spark_temperature.npz",
+            "compress": False,
+        }
+    config: LoggerConfig = {
         "signals_to_log": [
             "time",
             "wire_temperature",  # Full temperature field
             "voltage",
             "current",
-            "spark_status",
+            "spark_state",
             "wire_position",
             "workpiece_position",
         ],
         "log_frequency": {"type": "every_step"},  # Log every microsecond
-        "backend": {
-            "type": "numpy",
-            "filepath": "logs/single_spark_temperature.npz",
-            "compress": True,
-        },
+        "backend": backend,
     }
+    if preallocate is not None:
+        config["preallocate"] = preallocate
+    return config
 
 
 def initialize_single_spark_environment(
@@ -106,7 +148,7 @@ def initialize_single_spark_environment(
     env.state.target_position = (
         5000.0  # µm - much larger target to avoid early termination
     )
-    env.state.spark_status = [0, None, 0]  # No initial spark
+    env.state.spark_state = 0  # No initial spark
     env.state.dielectric_temperature = 293.15  # Room temperature
     env.state.wire_unwinding_velocity = 0.0  # No wire movement for cleaner observation
 
@@ -197,8 +239,9 @@ def run_single_spark_simulation(
 
     # Initial log print before loop starts, using env.state
     if 1 <= 10:  # Mimic the first few steps condition for initial state print
-        avg_temp = np.mean(env.state.wire_temperature) - 273.15
-        max_temp = np.max(env.state.wire_temperature) - 273.15
+        avg_temp, max_temp = _mean_max(env.state.wire_temperature)
+        avg_temp -= 273.15
+        max_temp -= 273.15
         spark_on_state = "OFF"  # Spark hasn't started
         voltage_in_state = env.state.voltage if env.state.voltage is not None else 0.0
         current_in_state = env.state.current if env.state.current is not None else 0.0
@@ -206,106 +249,119 @@ def run_single_spark_simulation(
             f"   t={0:4d} µs: avg_temp={avg_temp:5.1f}°C, max_temp={max_temp:5.1f}°C, spark={spark_on_state}, V={voltage_in_state:.1f}, I={current_in_state:.1f} (Initial)"
         )
 
-    for step_counter in range(simulation_duration_us):
-        current_time_us = step_counter + 1  # 1-indexed time
-
-        action = controller(env)
-
-        if step_counter == 0:
-            original_ignition_update = env.ignition.update
-
-            def disabled_ignition_update(state, dt=None):
-                pass
-
-            env.ignition.update = disabled_ignition_update
-
-        is_spark_active_this_step = (
-            spark_start_time
-            <= current_time_us
-            < (spark_start_time + spark_total_duration)
-        )
-
-        if is_spark_active_this_step:
-            # Activate spark: [active=1, location_idx, duration_remaining=1 for this step]
-            env.state.spark_status = [1, spark_config["spark_location_mm"], 1]
-
-            # Manually set spark V/I because IgnitionModule is disabled
-            OCV = spark_config["voltage"]
-            spark_burning_voltage = OCV * 0.3
-            env.state.voltage = spark_burning_voltage
-            env.state.current = 60.0
-
-            if current_time_us == spark_start_time:
-                # spark_location_idx is still useful for verification if WireModule calculates it correctly
-                print(
-                    f"🔥 Spark FORCED at t={current_time_us}µs, duration={spark_total_duration}µs, loc_cfg={spark_config['spark_location_mm']:.1f}mm (expected_idx={spark_location_idx})"
-                )
-                print(
-                    f"   Applied V={env.state.voltage:.1f}V, I={env.state.current:.1f}A for spark"
-                )
-        else:
-            env.state.spark_status = [0, None, 0]
-            env.state.voltage = spark_config["voltage"]
-            env.state.current = 0.0
-
-        state_from_step, reward, terminated, truncated, info = env.step(action)
-
-        # Log progress (use env.state as it reflects the true state after all modules run)
-        should_print_log = (
-            current_time_us % 50 == 0
-            or current_time_us <= 10
-            or (is_spark_active_this_step and current_time_us == spark_start_time)
-            or (current_time_us == (spark_start_time + spark_total_duration))
-        )
+    # The generator settings never change during the run: build the action once
+    action = controller(env)
+
+    # Bind hot-loop lookups once (env.state is only replaced by reset())
+    state = env.state
+    step_fn = env.step
+    collect = logger.collect
+    open_circuit_voltage = float(spark_config["voltage"])
+    spark_end_time = spark_start_time + spark_total_duration
+    spark_location_mm = spark_config["spark_location_mm"]
+    # The forced spark always burns at the same location
+    state.spark_y = spark_location_mm
+
+    # Precompute which steps print progress so the loop only touches the
+    # temperature statistics on those steps (index = current_time_us - 1)
+    print_mask = np.zeros(simulation_duration_us, dtype=bool)
+    print_mask[:10] = True  # First few steps
+    print_mask[49::50] = True  # Every 50 µs
+    spark_events = [spark_start_time + spark_total_duration]  # Spark end
+    if spark_total_duration > 0:
+        spark_events.append(spark_start_time)  # Spark start
+    for event_time_us in spark_events:
+        if float(event_time_us).is_integer() and 1 <= event_time_us <= len(print_mask):
+            print_mask[int(event_time_us) - 1] = True
+
+    # Spark V/I/status are forced by this loop, so the IgnitionModule is disabled
+    # for the run (patched once here, restored afterwards)
+    original_ignition_update = env.ignition.update
+    env.ignition.update = lambda state, dt=None: None
+    try:
+        for step_counter in range(simulation_duration_us):
+            current_time_us = step_counter + 1  # 1-indexed time
+
+            if spark_start_time <= current_time_us < spark_end_time:
+                # Activate spark (duration 1 so material/dielectric see no fresh crater)
+                state.spark_state = 1
+                state.spark_duration = 1
+                # Manually set spark V/I because IgnitionModule is disabled:
+                # the gap voltage drops to 30% of the open-circuit voltage
+                state.voltage = open_circuit_voltage * 0.3
+                state.current = 60.0
+
+                if current_time_us == spark_start_time:
+                    # spark_location_idx is still useful for verification if WireModule calculates it correctly
+                    print(
+                        f"🔥 Spark FORCED at t={current_time_us}µs, duration={spark_total_duration}µs, loc_cfg={spark_location_mm:.1f}mm (expected_idx={spark_location_idx})"
+                    )
+                    print(
+                        f"   Applied V={state.voltage:.1f}V, I={state.current:.1f}A for spark"
+                    )
+            else:
+                state.spark_state = 0
+                state.spark_duration = 0
+                state.voltage = open_circuit_voltage
+                state.current = 0.0
 
-        if should_print_log and current_time_us > 0:
-            # Use env.state for printing the most up-to-date information
-            avg_temp = np.mean(env.state.wire_temperature) - 273.15
-            max_temp = np.max(env.state.wire_temperature) - 273.15
-            spark_on_state = "ON" if env.state.spark_status[0] > 0 else "OFF"
-            # Voltage and current in env.state should be what WireModule used
-            voltage_in_state = (
-                env.state.voltage if env.state.voltage is not None else 0.0
-            )
-            current_in_state = (
-                env.state.current if env.state.current is not None else 0.0
-            )
-            print(
-                f"   t={current_time_us:4d} µs: avg_temp={avg_temp:5.1f}°C, max_temp={max_temp:5.1f}°C, spark={spark_on_state}, V={voltage_in_state:.1f}, I={current_in_state:.1f}"
+            state_from_step, reward, terminated, truncated, info = step_fn(
+                action
             )
 
-        # Log data to file/memory - always use env.state for microsecond-resolution logging
-        logger.collect(env.state, info)
-
-        if terminated or truncated:
-            # If termination happens, info might contain useful details like 'wire_broken'
-            term_reason = "Unknown"
-            if info and info.get("wire_broken"):
-                term_reason = "Wire Broken"
-            elif terminated:
-                term_reason = "Terminated (e.g. gap too small, target reached)"
-            elif truncated:
-                term_reason = "Truncated (e.g. time limit)"
-            print(
-                f"⚠️  Simulation terminated early at t={current_time_us} µs. Reason: {term_reason}"
-            )
-            # Log one last time if terminated, using the final env.state
-            if not (
-                should_print_log and current_time_us > 0
-            ):  # Avoid double print if already printed
-                avg_temp = np.mean(env.state.wire_temperature) - 273.15
-                max_temp = np.max(env.state.wire_temperature) - 273.15
-                spark_on_state = "ON" if env.state.spark_status[0] > 0 else "OFF"
+            # Log progress (use env.state as it reflects the true state after all modules run)
+            should_print_log = print_mask[step_counter]
+
+            if should_print_log:
+                # Use env.state for printing the most up-to-date information
+                avg_temp, max_temp = _mean_max(state.wire_temperature)
+                avg_temp -= 273.15
+                max_temp -= 273.15
+                spark_on_state = "ON" if state.spark_state > 0 else "OFF"
+                # Voltage and current in env.state should be what WireModule used
                 voltage_in_state = (
-                    env.state.voltage if env.state.voltage is not None else 0.0
+                    state.voltage if state.voltage is not None else 0.0
                 )
                 current_in_state = (
-                    env.state.current if env.state.current is not None else 0.0
+                    state.current if state.current is not None else 0.0
                 )
                 print(
-                    f"   t={current_time_us:4d} µs: avg_temp={avg_temp:5.1f}°C, max_temp={max_temp:5.1f}°C, spark={spark_on_state}, V={voltage_in_state:.1f}, I={current_in_state:.1f} (Final state on termination)"
+                    f"   t={current_time_us:4d} µs: avg_temp={avg_temp:5.1f}°C, max_temp={max_temp:5.1f}°C, spark={spark_on_state}, V={voltage_in_state:.1f}, I={current_in_state:.1f}"
                 )
-            break
+
+            # Log data to file/memory - always use env.state for microsecond-resolution logging
+            collect(state, info)
+
+            if terminated or truncated:
+                # If termination happens, info might contain useful details like 'wire_broken'
+                term_reason = "Unknown"
+                if info and info.get("wire_broken"):
+                    term_reason = "Wire Broken"
+                elif terminated:
+                    term_reason = "Terminated (e.g. gap too small, target reached)"
+                elif truncated:
+                    term_reason = "Truncated (e.g. time limit)"
+                print(
+                    f"⚠️  Simulation terminated early at t={current_time_us} µs. Reason: {term_reason}"
+                )
+                # Log one last time if terminated, using the final env.state
+                if not should_print_log:  # Avoid double print if already printed
+                    avg_temp, max_temp = _mean_max(state.wire_temperature)
+                    avg_temp -= 273.15
+                    max_temp -= 273.15
+                    spark_on_state = "ON" if state.spark_state > 0 else "OFF"
+                    voltage_in_state = (
+                        state.voltage if state.voltage is not None else 0.0
+                    )
+                    current_in_state = (
+                        state.current if state.current is not None else 0.0
+                    )
+                    print(
+                        f"   t={current_time_us:4d} µs: avg_temp={avg_temp:5.1f}°C, max_temp={max_temp:5.1f}°C, spark={spark_on_state}, V={voltage_in_state:.1f}, I={current_in_state:.1f} (Final state on termination)"
+                    )
+                break
+    finally:
+        env.ignition.update = original_ignition_update
 
     wall_time = time.time() - start_time
 
@@ -325,6 +381,45 @@ def run_single_spark_simulation(
     return log_file, wall_time
 
 
+def load_spark_data(data_path: str) -> Dict[str, np.ndarray]:
+    """
+    Load logged data from an .npz archive or an 'npy' backend directory.
+
+    Numeric .npy columns are memory-mapped read-only, so only the frames that
+    are actually rendered get paged in; .npz archives are read eagerly.
+    """
+    if pathlib.Path(data_path).is_dir():
+        return load_npy_log(data_path, mmap_mode="r")
+    return np.load(data_path)
+
+
+# Larger fonts for presentation-quality animations
+_PRESENTATION_RC = {
+    "font.size": 16,  # Base font size
+    "axes.titlesize": 20,  # Subplot titles
+    "axes.labelsize": 18,  # Axis labels
+    "xtick.labelsize": 16,  # X-axis tick labels
+    "ytick.labelsize": 16,  # Y-axis tick labels
+    "legend.fontsize": 16,  # Legend text
+    "figure.titlesize": 24,  # Main title
+}
+
+# Figure reused across create_spark_animation calls while its window is open
+_animation_figure = None
+
+
+def _get_animation_figure():
+    """Return (fig, ax_wire, ax_temp), clearing and reusing the last figure if open."""
+    global _animation_figure
+    if _animation_figure is not None and plt.fignum_exists(_animation_figure.number):
+        fig = _animation_figure
+        fig.clear()
+    else:
+        fig = _animation_figure = plt.figure(figsize=(16, 8))
+    ax_wire, ax_temp = fig.subplots(1, 2)
+    return fig, ax_wire, ax_temp
+
+
 def create_spark_animation(
     npz_filepath: str,
     save_animation: bool = False,
@@ -337,7 +432,7 @@ def create_spark_animation(
     Create animation from single spark simulation data.
 
     Args:
-        npz_filepath: Path to simulation data
+        npz_filepath: Path to simulation data (.npz file or .npy directory)
         save_animation: Whether to save animation file
         output_filename: Output filename for saved animation
         playback_speed: Playback speed multiplier (< 1.0 for slow motion)
@@ -345,7 +440,10 @@ def create_spark_animation(
         target_video_fps: Target FPS for the output video (default: 30)
     """
     try:
-        data = np.load(npz_filepath)
+        data = load_spark_data(npz_filepath)
+    except FileNotFoundError:
+        print(f"Error: Data file not found at {npz_filepath}")
+        return
     except Exception as e:
         print(f"Error loading data: {e}")
         return
@@ -362,9 +460,10 @@ def create_spark_animation(
     if wire_temp_k.ndim != 2:
         print(f"Error: Temperature data has wrong dimensions: {wire_temp_k.shape}")
         return
-    wire_temp_c = wire_temp_k - 273.15
+    # wire_temp_k may be a read-only memmap: only the rendered rows are
+    # converted to °C below, so the rest of the log is never copied into RAM
     time_ms = time_us / 1000.0
-    n_timesteps_data, n_segments = wire_temp_c.shape
+    n_timesteps_data, n_segments = wire_temp_k.shape
 
     # Get actual physical dimensions from WireModuleParameters
     # Use the same values as plot_temperature_heatmap.py for consistency
@@ -380,25 +479,29 @@ def create_spark_animation(
     workpiece_height_mm = 10.0  # mm - use same value as heatmap script
     total_length_mm = buffer_bottom_mm + workpiece_height_mm + buffer_top_mm
 
+    # Diagnostics are collected and written in one go below, rather than
+    # flushing stdout line by line while the animation is set up
+    lines = []
+
     # Verify this matches the actual data
     expected_total_segments = int(total_length_mm / segment_len_mm)
     if abs(expected_total_segments - n_segments) > 5:  # Allow some tolerance
-        print(
+        lines.append(
             f"⚠️  Segment count mismatch: expected {expected_total_segments}, got {n_segments}"
         )
-        print(f"   Adjusting total_length_mm to match actual data")
+        lines.append(f"   Adjusting total_length_mm to match actual data")
         total_length_mm = n_segments * segment_len_mm
         workpiece_height_mm = total_length_mm - buffer_bottom_mm - buffer_top_mm
 
     wire_diameter_mm = 0.2
 
-    print(f"🔧 Using actual wire parameters:")
-    print(f"   Buffer bottom: {buffer_bottom_mm} mm")
-    print(f"   Workpiece height: {workpiece_height_mm} mm")
-    print(f"   Buffer top: {buffer_top_mm} mm")
-    print(f"   Segment length: {segment_len_mm} mm")
-    print(f"   Total length: {total_length_mm} mm")
-    print(
+    lines.append(f"🔧 Using actual wire parameters:")
+    lines.append(f"   Buffer bottom: {buffer_bottom_mm} mm")
+    lines.append(f"   Workpiece height: {workpiece_height_mm} mm")
+    lines.append(f"   Buffer top: {buffer_top_mm} mm")
+    lines.append(f"   Segment length: {segment_len_mm} mm")
+    lines.append(f"   Total length: {total_length_mm} mm")
+    lines.append(
         f"   Total segments: {n_segments} (expected: {int(total_length_mm / segment_len_mm)})"
     )
 
@@ -409,9 +512,9 @@ def create_spark_animation(
     contact_bottom_pos_mm = buffer_bottom_mm - contact_offset_bottom
     contact_top_pos_mm = buffer_bottom_mm + workpiece_height_mm + contact_offset_top
 
-    print(f"🔌 Contact positions:")
-    print(f"   Bottom contact: {contact_bottom_pos_mm} mm")
-    print(f"   Top contact: {contact_top_pos_mm} mm")
+    lines.append(f"🔌 Contact positions:")
+    lines.append(f"   Bottom contact: {contact_bottom_pos_mm} mm")
+    lines.append(f"   Top contact: {contact_top_pos_mm} mm")
 
     # Animation parameters for live preview (based on playback_speed)
     sim_duration_ms_data = time_ms[-1] - time_ms[0] if n_timesteps_data > 1 else 0.0
@@ -421,10 +524,11 @@ def create_spark_animation(
             10, (sim_duration_ms_data / n_timesteps_data) / playback_speed
         )
 
-    print(f"\n📽️  Animation data:")
-    print(f"   Total data timesteps: {n_timesteps_data}")
-    print(f"   Wire segments: {n_segments}")
-    print(f"   Simulation duration recorded: {sim_duration_ms_data:.1f} ms")
+    lines.append("")
+    lines.append(f"📽️  Animation data:")
+    lines.append(f"   Total data timesteps: {n_timesteps_data}")
+    lines.append(f"   Wire segments: {n_segments}")
+    lines.append(f"   Simulation duration recorded: {sim_duration_ms_data:.1f} ms")
 
     animation_frame_indices = np.arange(n_timesteps_data)
     num_animation_render_frames = n_timesteps_data
@@ -450,14 +554,14 @@ def create_spark_animation(
             actual_save_fps = min(
                 actual_save_fps, 20
             )  # Cap GIF FPS for targeted duration
-            print(
+            lines.append(
                 f"   Subsampling for {target_video_duration_s}s GIF at {actual_save_fps} FPS (capped for GIF):"
             )
         else:
-            print(
+            lines.append(
                 f"   Subsampling for {target_video_duration_s}s video at {actual_save_fps} FPS:"
             )
-        print(f"     Rendering {num_animation_render_frames} frames from data.")
+        lines.append(f"     Rendering {num_animation_render_frames} frames from data.")
     elif (
         save_animation
     ):  # Saving, but no specific duration target, derive FPS from playback_speed
@@ -467,220 +571,248 @@ def create_spark_animation(
         else:  # MP4 default
             actual_save_fps = min(actual_save_fps, 30.0)
         actual_save_fps = max(5.0, actual_save_fps)
-        print(
+        lines.append(
             f"   Saving with FPS derived from playback_speed: {actual_save_fps:.1f} FPS"
         )
 
-    # Setup figure with larger fonts for presentation
-    plt.rcParams.update(
-        {
-            "font.size": 16,  # Base font size
-            "axes.titlesize": 20,  # Subplot titles
-            "axes.labelsize": 18,  # Axis labels
-            "xtick.labelsize": 16,  # X-axis tick labels
-            "ytick.labelsize": 16,  # Y-axis tick labels
-            "legend.fontsize": 16,  # Legend text
-            "figure.titlesize": 24,  # Main title
-        }
-    )
-
-    fig, (ax_wire, ax_temp) = plt.subplots(1, 2, figsize=(16, 8))
-    fig.patch.set_facecolor("white")
-    visual_thickness = wire_diameter_mm * 5
-
-    # Wire extent: [left, right, bottom, top]
-    # With origin='upper', row 0 is at the top, so Y goes from total_length_mm (top) down to 0 (bottom)
-    wire_extent = [-visual_thickness / 2, visual_thickness / 2, total_length_mm, 0]
-    temp_min_c = 20
-    temp_max_c = min(500, np.max(wire_temp_c))
-    img = ax_wire.imshow(
-        wire_temp_c[animation_frame_indices[0], :].reshape(n_segments, 1),
-        cmap="hot",
-        origin="upper",  # Changed to 'upper'
-        vmin=temp_min_c,
-        vmax=temp_max_c,
-        extent=wire_extent,
-        interpolation="bilinear",
-        aspect="auto",  # Ensure it fills the axes box correctly with new origin
-    )
-    workpiece_bottom_display = total_length_mm - (
-        buffer_bottom_mm + workpiece_height_mm
-    )  # Position from top
-    workpiece_top_display = total_length_mm - buffer_bottom_mm  # Position from top
-
-    ax_wire.set_ylim(0, total_length_mm)
-    # Recalculate extent for imshow to match this new y-axis orientation for ax_wire
-    img.set_extent([-visual_thickness / 2, visual_thickness / 2, 0, total_length_mm])
-
-    # Workpiece lines on wire plot (y from bottom)
-    ax_wire.axhline(
-        buffer_bottom_mm,
-        color="gray",
-        linestyle="--",
-        alpha=0.8,
-        label="Workpiece Bottom",
-        linewidth=2,  # Make lines thicker too
-    )
-    ax_wire.axhline(
-        buffer_bottom_mm + workpiece_height_mm,
-        color="gray",
-        linestyle="--",
-        alpha=0.8,
-        label="Workpiece Top",
-        linewidth=2,
-    )
+    print("\n".join(lines))
 
-    # Contact lines on wire plot
-    ax_wire.axhline(
-        contact_bottom_pos_mm,
-        color="gray",
-        linestyle=":",
-        alpha=0.6,
-        label="Bottom Contact",
-        linewidth=2,
-    )
-    ax_wire.axhline(
-        contact_top_pos_mm,
-        color="gray",
-        linestyle=":",
-        alpha=0.6,
-        label="Top Contact",
-        linewidth=2,
-    )
+    # Gather the rendered frames and their titles once, so update_animation
+    # only indexes precomputed data (no fancy-index/reshape/format per frame)
+    if num_animation_render_frames == n_timesteps_data:
+        rendered_k = wire_temp_k  # Every row is rendered
+    else:
+        rendered_k = wire_temp_k[animation_frame_indices]  # Reads only these rows
+    # One contiguous float32 °C block: display needs no float64 precision and
+    # every frame read below touches half the bytes
+    frames_c = np.subtract(rendered_k, np.float32(273.15), dtype=np.float32)
+    frames = frames_c.reshape(-1, n_segments, 1)
+    frame_titles = [
+        f"Single Spark Evolution - Sim Time: {time_ms[data_idx]:.3f} ms (Frame {k+1}/{num_animation_render_frames})"
+        for k, data_idx in enumerate(animation_frame_indices)
+    ]
+
+    # Setup figure with larger fonts for presentation; the style is scoped to
+    # this animation instead of mutating the global rcParams
+    with mpl.rc_context(_PRESENTATION_RC):
+        fig, ax_wire, ax_temp = _get_animation_figure()
+        fig.patch.set_facecolor("white")
+        visual_thickness = wire_diameter_mm * 5
+
+        # Wire extent: [left, right, bottom, top]
+        # With origin='upper', row 0 is at the top, so Y goes from total_length_mm (top) down to 0 (bottom)
+        wire_extent = [-visual_thickness / 2, visual_thickness / 2, total_length_mm, 0]
+        temp_min_c = 20
+        # Same value as the max over the converted field (the conversion is
+        # monotonic), from one streaming pass over the raw log
+        temp_max_c = min(
+            500, np.subtract(np.max(wire_temp_k), np.float32(273.15), dtype=np.float32)
+        )
+        img = ax_wire.imshow(
+            frames[0],
+            cmap="hot",
+            origin="upper",  # Changed to 'upper'
+            vmin=temp_min_c,
+            vmax=temp_max_c,
+            extent=wire_extent,
+            interpolation="bilinear",
+            aspect="auto",  # Ensure it fills the axes box correctly with new origin
+        )
+        workpiece_bottom_display = total_length_mm - (
+            buffer_bottom_mm + workpiece_height_mm
+        )  # Position from top
+        workpiece_top_display = total_length_mm - buffer_bottom_mm  # Position from top
+
+        ax_wire.set_ylim(0, total_length_mm)
+        # Recalculate extent for imshow to match this new y-axis orientation for ax_wire
+        img.set_extent([-visual_thickness / 2, visual_thickness / 2, 0, total_length_mm])
+
+        # Workpiece lines on wire plot (y from bottom)
+        ax_wire.axhline(
+            buffer_bottom_mm,
+            color="gray",
+            linestyle="--",
+            alpha=0.8,
+            label="Workpiece Bottom",
+            linewidth=2,  # Make lines thicker too
+        )
+        ax_wire.axhline(
+            buffer_bottom_mm + workpiece_height_mm,
+            color="gray",
+            linestyle="--",
+            alpha=0.8,
+            label="Workpiece Top",
+            linewidth=2,
+        )
 
-    ax_wire.set_xlim(-visual_thickness * 4, visual_thickness * 4)
-    ax_wire.set_xticks([])
-    ax_wire.set_xlabel("")
-    ax_wire.set_ylabel("Position along wire (mm from bottom)")
-    ax_wire.set_title("Wire Temperature Field")
+        # Contact lines on wire plot
+        ax_wire.axhline(
+            contact_bottom_pos_mm,
+            color="gray",
+            linestyle=":",
+            alpha=0.6,
+            label="Bottom Contact",
+            linewidth=2,
+        )
+        ax_wire.axhline(
+            contact_top_pos_mm,
+            color="gray",
+            linestyle=":",
+            alpha=0.6,
+            label="Top Contact",
+            linewidth=2,
+        )
 
-    fig.colorbar(
-        img, ax=ax_wire, orientation="vertical", label="Temperature (°C)", shrink=0.8
-    )
+        ax_wire.set_xlim(-visual_thickness * 4, visual_thickness * 4)
+        ax_wire.set_xticks([])
+        ax_wire.set_xlabel("")
+        ax_wire.set_ylabel("Position along wire (mm from bottom)")
+        ax_wire.set_title("Wire Temperature Field")
 
-    # Y positions for the line plot
-    y_positions_lineplot = np.linspace(total_length_mm, 0, n_segments)
-    (line_temp,) = ax_temp.plot(
-        wire_temp_c[animation_frame_indices[0], :],
-        y_positions_lineplot,
-        "r-",
-        linewidth=3,  # Make line thicker
-    )
+        fig.colorbar(
+            img, ax=ax_wire, orientation="vertical", label="Temperature (°C)", shrink=0.8
+        )
 
-    # Workpiece shaded region on temperature profile plot
-    ax_temp.axhspan(
-        buffer_bottom_mm,
-        buffer_bottom_mm + workpiece_height_mm,
-        alpha=0.2,
-        color="gray",
-        label="Workpiece",
-    )
+        # Y positions for the line plot
+        y_positions_lineplot = np.linspace(total_length_mm, 0, n_segments)
+        (line_temp,) = ax_temp.plot(
+            frames[0, :, 0],
+            y_positions_lineplot,
+            "r-",
+            linewidth=3,  # Make line thicker
+        )
 
-    # Contact lines on temperature profile plot
-    ax_temp.axhline(
-        contact_bottom_pos_mm,
-        color="gray",
-        linestyle=":",
-        alpha=0.6,
-        label="Bottom Contact",
-        linewidth=2,
-    )
-    ax_temp.axhline(
-        contact_top_pos_mm,
-        color="gray",
-        linestyle=":",
-        alpha=0.6,
-        label="Top Contact",
-        linewidth=2,
-    )
+        # Workpiece shaded region on temperature profile plot
+        ax_temp.axhspan(
+            buffer_bottom_mm,
+            buffer_bottom_mm + workpiece_height_mm,
+            alpha=0.2,
+            color="gray",
+            label="Workpiece",
+        )
 
-    ax_temp.set_xlabel("Temperature (°C)")
-    ax_temp.set_ylabel("Position along wire (mm from bottom)")
-    ax_temp.set_ylim(0, total_length_mm)
-    ax_temp.set_title("Temperature Profile")
-    ax_temp.grid(True, alpha=0.3)
-    ax_temp.legend(loc="upper right")
-    ax_temp.set_xlim(temp_min_c, temp_max_c)
-
-    title_obj = fig.suptitle(
-        f"Single Spark Evolution - Sim Time: {time_ms[animation_frame_indices[0]]:.3f} ms",
-        fontsize=24,  # Explicit large font size for title
-        fontweight="bold",
-    )
+        # Contact lines on temperature profile plot
+        ax_temp.axhline(
+            contact_bottom_pos_mm,
+            color="gray",
+            linestyle=":",
+            alpha=0.6,
+            label="Bottom Contact",
+            linewidth=2,
+        )
+        ax_temp.axhline(
+            contact_top_pos_mm,
+            color="gray",
+            linestyle=":",
+            alpha=0.6,
+            label="Top Contact",
+            linewidth=2,
+        )
 
-    def update_animation(frame_k):
-        actual_data_idx = animation_frame_indices[frame_k]
-        current_temp_field = wire_temp_c[actual_data_idx, :].reshape(n_segments, 1)
-        img.set_data(current_temp_field)
-        # The line plot - keep the same temperature data, y_positions_lineplot is now correct
-        line_temp.set_xdata(wire_temp_c[actual_data_idx, :])
-        title_obj.set_text(
-            f"Single Spark Evolution - Sim Time: {time_ms[actual_data_idx]:.3f} ms (Frame {frame_k+1}/{num_animation_render_frames})"
+        ax_temp.set_xlabel("Temperature (°C)")
+        ax_temp.set_ylabel("Position along wire (mm from bottom)")
+        ax_temp.set_ylim(0, total_length_mm)
+        ax_temp.set_title("Temperature Profile")
+        ax_temp.grid(True, alpha=0.3)
+        ax_temp.legend(loc="upper right")
+        ax_temp.set_xlim(temp_min_c, temp_max_c)
+
+        title_obj = fig.suptitle(
+            f"Single Spark Evolution - Sim Time: {time_ms[animation_frame_indices[0]]:.3f} ms",
+            fontsize=24,  # Explicit large font size for title
+            fontweight="bold",
         )
-        return [img, line_temp, title_obj]
-
-    ani = animation.FuncAnimation(
-        fig,
-        update_animation,
-        frames=num_animation_render_frames,
-        interval=live_preview_interval_ms,
-        blit=True,
-        repeat=True,
-    )
 
-    if save_animation:
-        writer_name = None
-        save_dpi = 150
+        # Reused per-frame buffer shared by the image and the line plot: each frame
+        # is read from frames_c exactly once (no per-frame allocation)
+        frame_buf = np.empty((n_segments, 1), dtype=frames.dtype)
+        frame_profile = frame_buf[:, 0]  # 1-D view for the temperature profile line
+
+        def update_animation(frame_k):
+            np.copyto(frame_buf, frames[frame_k])
+            img.set_array(frame_buf)
+            # The line plot - keep the same temperature data, y_positions_lineplot is now correct
+            line_temp.set_xdata(frame_profile)
+            title_obj.set_text(frame_titles[frame_k])
+            return [img, line_temp, title_obj]
+
+        def show_live_preview():
+            ani = animation.FuncAnimation(
+                fig,
+                update_animation,
+                frames=num_animation_render_frames,
+                interval=live_preview_interval_ms,
+                blit=True,
+                repeat=True,
+            )
+            plt.show()
+            return ani
 
-        if is_gif_output:
-            writer_name = "pillow"
-            save_dpi = 100  # GIFs are better with lower DPI
-        else:  # Try ffmpeg for MP4
-            if animation.writers["ffmpeg"].isAvailable():
-                writer_name = "ffmpeg"
-            else:
-                print(
-                    "⚠️ FFmpeg writer not available. Trying to save as GIF with Pillow instead."
-                )
-                # Fallback to GIF if ffmpeg isn't there for MP4
-                output_filename = str(
-                    output_path.with_suffix(".gif")
-                )  # Change extension
-                is_gif_output = True  # Update flag
-                writer_name = "pillow"
-                save_dpi = 100
-                # Recalculate actual_save_fps if it was for MP4 and now it's GIF
-                if target_video_duration_s is not None:  # If duration was targeted
-                    actual_save_fps = min(target_video_fps, 20)  # Cap for GIF
-                else:  # FPS derived from playback_speed
-                    derived_fps = 1000.0 / live_preview_interval_ms
-                    actual_save_fps = min(derived_fps, 15.0)
-                    actual_save_fps = max(5.0, actual_save_fps)
-                print(
-                    f"   New output: {output_filename}, Fallback FPS for GIF: {actual_save_fps:.1f}"
-                )
+        if save_animation:
+            writer_name = None
+            save_dpi = 150
 
-        if writer_name:
-            try:
-                print(
-                    f"💾 Saving animation to {output_filename} (FPS: {actual_save_fps:.1f}, Writer: {writer_name}, DPI: {save_dpi})..."
-                )
-                ani.save(
-                    output_filename,
-                    writer=writer_name,
-                    fps=actual_save_fps,
-                    dpi=save_dpi,
-                )
-                print("✅ Animation saved successfully!")
-            except Exception as e:
-                print(f"❌ Error saving animation with {writer_name}: {e}")
-                print("Showing live preview instead (if possible)...")
-                plt.show()
+            if is_gif_output:
+                writer_name = "pillow"
+                save_dpi = 100  # GIFs are better with lower DPI
+            else:  # Try ffmpeg for MP4
+                if animation.writers["ffmpeg"].isAvailable():
+                    writer_name = "ffmpeg"
+                else:
+                    print(
+                        "⚠️ FFmpeg writer not available. Trying to save as GIF with Pillow instead."
+                    )
+                    # Fallback to GIF if ffmpeg isn't there for MP4
+                    output_filename = str(
+                        output_path.with_suffix(".gif")
+                    )  # Change extension
+                    is_gif_output = True  # Update flag
+                    writer_name = "pillow"
+                    save_dpi = 100
+                    # Recalculate actual_save_fps if it was for MP4 and now it's GIF
+                    if target_video_duration_s is not None:  # If duration was targeted
+                        actual_save_fps = min(target_video_fps, 20)  # Cap for GIF
+                    else:  # FPS derived from playback_speed
+                        derived_fps = 1000.0 / live_preview_interval_ms
+                        actual_save_fps = min(derived_fps, 15.0)
+                        actual_save_fps = max(5.0, actual_save_fps)
+                    print(
+                        f"   New output: {output_filename}, Fallback FPS for GIF: {actual_save_fps:.1f}"
+                    )
+
+            if writer_name:
+                try:
+                    print(
+                        f"💾 Saving animation to {output_filename} (FPS: {actual_save_fps:.1f}, Writer: {writer_name}, DPI: {save_dpi})..."
+                    )
+                    if writer_name == "ffmpeg":
+                        # Raw RGBA frames are piped straight into ffmpeg's
+                        # stdin: no per-frame PNG encode/decode round trip
+                        writer = animation.FFMpegWriter(
+                            fps=actual_save_fps,
+                            codec="libx264",
+                            extra_args=["-pix_fmt", "yuv420p"],
+                        )
+                    else:
+                        writer = animation.PillowWriter(fps=actual_save_fps)
+                    # Stream frames to the writer one at a time, redrawing the
+                    # same artists in place; no FuncAnimation frame bookkeeping
+                    with mpl.rc_context({"savefig.bbox": None}), writer.saving(
+                        fig, output_filename, save_dpi
+                    ):
+                        for frame_k in range(num_animation_render_frames):
+                            update_animation(frame_k)
+                            writer.grab_frame()
+                    print("✅ Animation saved successfully!")
+                except Exception as e:
+                    print(f"❌ Error saving animation with {writer_name}: {e}")
+                    print("Showing live preview instead (if possible)...")
+                    show_live_preview()
+            else:
+                print("No suitable animation writer found. Showing live preview...")
+                show_live_preview()
         else:
-            print("No suitable animation writer found. Showing live preview...")
-            plt.show()
-    else:
-        plt.show()
+            show_live_preview()
 
 
 def main():
@@ -729,6 +861,13 @@ def main():
         default=1000,
         help="Total simulation duration (µs, default: 1000 for 1ms)",
     )
+    sim_group.add_argument(
+        "--log-format",
+        type=str,
+        choices=["npz", "npy"],
+        default="npy",
+        help="Simulation log format: a directory of .npy files or an uncompressed .npz archive (default: npy)",
+    )
 
     # Arguments for loading existing data
     load_group = parser.add_argument_group("Data Loading Parameters")
@@ -736,7 +875,7 @@ def main():
         "--load-data",
         type=str,
         default=None,
-        help="Path to an existing .npz file to load for animation. If provided, simulation parameters are ignored.",
+        help="Path to an existing .npz file or .npy log directory to load for animation. If provided, simulation parameters are ignored.",
     )
 
     # Arguments for animation (common to both modes)
@@ -780,9 +919,6 @@ def main():
 
     if args.load_data:
         print(f"Attempting to load data from: {args.load_data}")
-        if not pathlib.Path(args.load_data).exists():
-            print(f"Error: Data file not found at {args.load_data}")
-            return
         log_file_path = args.load_data
         # If loading data, we must not be in data_only mode for animation
         if args.data_only:
@@ -806,24 +942,23 @@ def main():
         env = initialize_single_spark_environment(
             plasma_efficiency=current_plasma_efficiency
         )
-        logger_config = setup_single_spark_logger()
+        logger_config = setup_single_spark_logger(
+            args.log_format, preallocate=args.duration
+        )
         # Use a unique name for the data file if running a new sim, based on output anim name
         sim_data_identifier = pathlib.Path(args.out).stem
+        suffix = ".npz" if args.log_format == "npz" else "_npy"
         logger_config["backend"][
             "filepath"
-        ] = f"logs/{sim_data_identifier}_sim_data.npz"
+        ] = f"logs/{sim_data_identifier}_sim_data{suffix}"
 
         log_file_path, wall_time = run_single_spark_simulation(
             env, logger_config, spark_config, args.duration
         )
 
     if not args.data_only and log_file_path:
-        if not pathlib.Path(log_file_path).exists():
-            print(
-                f"Error: Log file {log_file_path} not found or was not created. Cannot create animation."
-            )
-            return
-
+        # A missing data file is reported by create_spark_animation when it
+        # fails to load, so no separate exists() check is needed here
         output_is_gif = pathlib.Path(args.out).suffix.lower() == ".gif"
         effective_target_fps = args.target_video_fps
         if output_is_gif and args.target_video_fps > 20:
@@ -53,6 +53,11 @@ setup(
         "visualization": [
             "pygame>=2.1.0",
         ],
+        "logging": [
+            "orjson>=3.6.0",
+            "msgpack>=1.0.0",
+            "blosc2>=2.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -1,22 +1,47 @@
 # src/wedm/__init__.py
-from importlib.metadata import version, PackageNotFoundError
+import importlib
+from typing import TYPE_CHECKING
 
-from .core import (
-    EDMState,
-    EnvironmentConfig,
-    MaterialDatabase,
-    WireMaterial,
-    get_material_db,
-)
-
-from .envs.wire_edm import WireEDMEnv
+# Public names are resolved lazily (PEP 562): ``import wedm`` stays cheap and
+# ``from wedm import X`` only imports the submodule that defines X.
+_LAZY_IMPORTS = {
+    # Core classes
+    "EDMState": ".core",
+    "EnvironmentConfig": ".core",
+    "MaterialDatabase": ".core",
+    "WireMaterial": ".core",
+    "get_material_db": ".core",
+    # Environment
+    "WireEDMEnv": ".envs.wire_edm",
+    # Modules and their parameters
+    "IgnitionModule": ".modules.ignition",
+    "IgnitionModuleParameters": ".modules.ignition",
+    "WireModule": ".modules.wire",
+    "WireModuleParameters": ".modules.wire",
+    "MaterialRemovalModule": ".modules.material",
+    "MaterialModuleParameters": ".modules.material",
+    "DielectricModule": ".modules.dielectric",
+    "DielectricModuleParameters": ".modules.dielectric",
+    "MechanicsModule": ".modules.mechanics",
+    "MechanicsModuleParameters": ".modules.mechanics",
+}
 
-from .modules.ignition import IgnitionModule, IgnitionModuleParameters
-from .modules.wire import WireModule, WireModuleParameters
-from .modules.material import MaterialRemovalModule, MaterialModuleParameters
-from .modules.dielectric import DielectricModule, DielectricModuleParameters
-from .modules.mechanics import MechanicsModule, MechanicsModuleParameters
+if TYPE_CHECKING:
+    from .core import (
+        EDMState,
+        EnvironmentConfig,
+        MaterialDatabase,
+        WireMaterial,
+        get_material_db,
+    )
+    from .envs.wire_edm import WireEDMEnv
+    from .modules.ignition import IgnitionModule, IgnitionModuleParameters
+    from .modules.wire import WireModule, WireModuleParameters
+    from .modules.material import MaterialRemovalModule, MaterialModuleParameters
+    from .modules.dielectric import DielectricModule, DielectricModuleParameters
+    from .modules.mechanics import MechanicsModule, MechanicsModuleParameters
 
+# Kept in sync with pyproject.toml / setup.py (distribution "wedm-learning-environment")
 __version__ = "0.2.0"
 
 __all__ = [
@@ -41,7 +66,16 @@ __all__ = [
     "MechanicsModuleParameters",
 ]
 
-try:
-    __version__ = version("wedm") if "__package__" in globals() else "0.dev"
-except PackageNotFoundError:
-    __version__ = "0.dev"
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
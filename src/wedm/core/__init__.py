@@ -1,6 +1,6 @@
 # src/wedm/core/__init__.py
 
-from .state import EDMState, crater_dtype
+from .state import EDMState, crater_dtype, edm_state_dtype
 from .env_config import EnvironmentConfig
 from .material_db import MaterialDatabase, WireMaterial, get_material_db
 from .module import EDMModule
@@ -8,6 +8,7 @@ from .module import EDMModule
 __all__ = [
     "EDMState",
     "crater_dtype",
+    "edm_state_dtype",
     "EnvironmentConfig",
     "MaterialDatabase",
     "WireMaterial",
@@ -1,17 +1,25 @@
 # src/wedm/core/env_config.py
 from __future__ import annotations
 
+import dataclasses
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Any
 import json
 from pathlib import Path
 
+from .state import _DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class EnvironmentConfig:
     """
     Fixed environment configuration parameters that don't change during simulation.
     These define the physical setup and constraints of the EDM environment.
+
+    Instances are immutable (use ``dataclasses.replace`` to derive a variant),
+    which makes them hashable and lets ``to_dict`` be cached per value.
+    Fields are slots, so the config reads in ``step`` skip an instance dict.
     """
 
     # ── Workpiece Properties ──
@@ -51,18 +59,8 @@ class EnvironmentConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert EnvironmentConfig to dictionary."""
-        return {
-            "workpiece_height": self.workpiece_height,
-            "wire_diameter": self.wire_diameter,
-            "wire_material": self.wire_material,
-            "dt": self.dt,
-            "servo_interval": self.servo_interval,
-            "initial_gap": self.initial_gap,
-            "target_cutting_distance": self.target_cutting_distance,
-            "max_wire_temperature": self.max_wire_temperature,
-            "min_gap_for_operation": self.min_gap_for_operation,
-            "max_cutting_force": self.max_cutting_force,
-        }
+        # Shallow copy of the cached dict, so callers may modify the result
+        return dict(_config_as_dict(self))
 
     def to_json(self, json_path: str | Path) -> None:
         """Save EnvironmentConfig to JSON file."""
@@ -88,3 +86,9 @@ class EnvironmentConfig:
             raise ValueError(
                 "max_wire_temperature must be greater than room temperature"
             )
+
+
+@lru_cache(maxsize=128)
+def _config_as_dict(config: EnvironmentConfig) -> Dict[str, Any]:
+    """dataclasses.asdict, computed once per distinct (immutable) config value."""
+    return dataclasses.asdict(config)
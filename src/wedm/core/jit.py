@@ -0,0 +1,12 @@
+# src/wedm/core/jit.py
+from __future__ import annotations
+
+import os
+
+# Numba kernels are cached on disk (next to their module, in __pycache__), so
+# only the first process pays the JIT compile. Numba keys each cache entry on
+# the kernel's own source file: a kernel calling one defined in another file
+# (e.g. fast_exp, or the module kernels inlined by fused_ticks) is not
+# recompiled when only the callee changes. Set WEDM_NUMBA_CACHE=0 while
+# editing kernels, or delete the stale *.nbi / *.nbc files afterwards.
+NUMBA_CACHE = os.environ.get("WEDM_NUMBA_CACHE", "1") != "0"
@@ -39,15 +39,16 @@ class MaterialDatabase:
     def _load_wire_materials(self) -> None:
         """Load wire material properties."""
         wire_file = self.data_dir / "wire_materials.json"
-        if wire_file.exists():
+        try:
             with open(wire_file, "r") as f:
                 data = json.load(f)
-
-            for name, props in data.items():
-                self._wire_materials[name] = WireMaterial(name=name, **props)
-        else:
+        except FileNotFoundError:
             # Create default wire materials if file doesn't exist
             self._create_default_wire_materials()
+            return
+
+        for name, props in data.items():
+            self._wire_materials[name] = WireMaterial(name=name, **props)
 
     def _create_default_wire_materials(self) -> None:
         """Create default wire material database."""
@@ -1,7 +1,9 @@
 # src/edm_env/core/state.py
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import List, Optional, Tuple
 
 import numpy as np
@@ -18,15 +20,85 @@ crater_dtype = np.dtype(
     ]
 )
 
+# Flat record of every scalar EDMState field, for handing the state to
+# compiled kernels as one contiguous struct. Optional fields map None <-> NaN.
+# Array and tuple fields (wire_temperature, ionized_channel) are not part of
+# the record.
+edm_state_dtype = np.dtype(
+    [
+        ("time", "i8"),  # [µs]
+        ("time_since_servo", "i8"),  # [µs]
+        ("time_since_open_voltage", "i8"),  # [µs]
+        ("time_since_spark_ignition", "i8"),  # [µs]
+        ("time_since_spark_end", "i8"),  # [µs]
+        ("voltage", "f8"),  # [V]
+        ("current", "f8"),  # [A]
+        ("target_voltage", "f8"),  # [V]
+        ("current_mode", "i1"),  # n of "In"; 0 = not set
+        ("OFF_time", "f8"),  # [µs]
+        ("ON_time", "f8"),  # [µs]
+        ("workpiece_position", "f8"),  # [µm]
+        ("wire_position", "f8"),  # [µm]
+        ("wire_velocity", "f8"),  # [µm s⁻¹]
+        ("wire_unwinding_velocity", "f8"),  # [µm µs⁻¹]
+        ("time_in_critical_temp", "i8"),  # [µs]
+        ("wire_average_temperature", "f8"),  # [K]
+        ("spark_state", "i1"),  # 0=idle, 1=spark, -1=short, -2=rest
+        ("spark_y", "f8"),  # [mm]
+        ("spark_duration", "i8"),  # [µs]
+        ("dielectric_conductivity", "f8"),  # [S m⁻¹]
+        ("dielectric_temperature", "f8"),  # [K]
+        ("debris_concentration", "f8"),  # [kg m⁻³]
+        ("dielectric_flow_rate", "f8"),  # [m³ s⁻¹]
+        ("debris_volume", "f8"),  # [mm³]
+        ("debris_density", "f8"),  # [-]
+        ("cavity_volume", "f8"),  # [mm³]
+        ("flow_rate", "f8"),  # [-]
+        ("last_crater_volume", "f8"),  # [mm³]
+        ("is_short_circuit", "?"),
+        ("is_wire_broken", "?"),
+        ("is_wire_colliding", "?"),
+        ("is_target_distance_reached", "?"),
+        ("target_delta", "f8"),  # [µm]
+        ("target_position", "f8"),  # [µm]
+    ]
+)
+
+_OPTIONAL_RECORD_FIELDS = frozenset(
+    (
+        "voltage",
+        "current",
+        "target_voltage",
+        "OFF_time",
+        "ON_time",
+        "wire_average_temperature",
+    )
+)
+
+
+# Reads every record field off an EDMState in edm_state_dtype order, as a tuple
+_record_fields_getter = attrgetter(*edm_state_dtype.names)
+# Positions of the optional (None <-> NaN) fields within that tuple
+_OPTIONAL_RECORD_INDICES = tuple(
+    i for i, name in enumerate(edm_state_dtype.names) if name in _OPTIONAL_RECORD_FIELDS
+)
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # EDM Process State - Only variables that change during simulation
 # ──────────────────────────────────────────────────────────────────────────────
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class EDMState:
     """
     EDM Process State Variables - Only contains state that changes during simulation.
     Configuration parameters and module parameters are handled elsewhere.
+
+    On Python 3.10+ the class uses ``__slots__``, so assigning an undeclared
+    attribute raises AttributeError.
     """
 
     # ── Time Tracking (µs) ──
@@ -42,7 +114,7 @@ class EDMState:
 
     # ── Generator Settings (can be changed by control actions) ──
     target_voltage: Optional[float] = None  # [V] Target voltage setting
-    current_mode: Optional[str] = None  # Current mode like "I1", "I2", ..., "I19"
+    current_mode: int = 0  # Current mode n of "In" (1-19); 0 = not set
     OFF_time: Optional[float] = None  # [µs] OFF time setting
     ON_time: Optional[float] = None  # [µs] ON time setting
 
@@ -60,9 +132,9 @@ class EDMState:
     wire_average_temperature: float | None = None  # Average temperature in cutting zone
 
     # ── Spark/Discharge State ──
-    # Format: [state, y-location, duration]
-    # state: 0=idle, 1=spark, -1=short, -2=rest
-    spark_status: List[Optional[float]] = field(default_factory=lambda: [0, None, 0])
+    spark_state: int = 0  # 0=idle, 1=spark, -1=short, -2=rest
+    spark_y: float = float("nan")  # [mm] Spark location (NaN when no spark)
+    spark_duration: int = 0  # [µs] Time spent in the current spark state
 
     # ── Dielectric State ──
     dielectric_conductivity: float = 0.0  # [S m⁻¹] Current dielectric conductivity
@@ -89,3 +161,42 @@ class EDMState:
     # ── Servo Control State ──
     target_delta: float = 0.0  # [µm] Target position change for next servo action
     target_position: float = 500.0  # [µm] Target final position
+
+    # ── Labels ──
+    @property
+    def current_mode_str(self) -> Optional[str]:
+        """Current mode as its "In" label (None when not set), for logs and JSON."""
+        return f"I{self.current_mode}" if self.current_mode else None
+
+    # ── Legacy Spark Triple ──
+    @property
+    def spark_status(self) -> List[Optional[float]]:
+        """Legacy [state, y-location, duration] view of the spark fields."""
+        spark_y = None if np.isnan(self.spark_y) else self.spark_y
+        return [self.spark_state, spark_y, self.spark_duration]
+
+    @spark_status.setter
+    def spark_status(self, value) -> None:
+        spark_state, spark_y, spark_duration = value
+        self.spark_state = int(spark_state)
+        self.spark_y = float("nan") if spark_y is None else float(spark_y)
+        self.spark_duration = int(spark_duration)
+
+    # ── Record Conversion ──
+    def to_record(self) -> np.ndarray:
+        """Pack the scalar fields into a 0-d array of ``edm_state_dtype``."""
+        values = list(_record_fields_getter(self))
+        for i in _OPTIONAL_RECORD_INDICES:
+            if values[i] is None:
+                values[i] = np.nan
+        return np.array(tuple(values), dtype=edm_state_dtype)
+
+    def load_record(self, record: np.ndarray) -> None:
+        """Write the fields of an ``edm_state_dtype`` record back into the state."""
+        values = record.item()  # One tuple of Python scalars, in field order
+        for name, value in zip(edm_state_dtype.names, values):
+            setattr(self, name, value)
+        for i in _OPTIONAL_RECORD_INDICES:
+            value = values[i]
+            if value != value:  # NaN -> None
+                setattr(self, edm_state_dtype.names[i], None)
@@ -20,7 +20,7 @@ def is_short_circuited(state: EDMState, dielectric_module: Optional = None) -> b
         True if a short-circuit condition exists, False otherwise.
     """
     # Check for explicit short circuit state
-    if state.spark_status[0] == -1:
+    if state.spark_state == -1:
         return True
 
     # Use simple gap-based detection updated by ignition module
@@ -0,0 +1,468 @@
+# src/wedm/envs/fused_ticks.py
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+from ..core.jit import NUMBA_CACHE
+from ..modules.dielectric import DielectricModule, _dielectric_update
+from ..modules.ignition import (
+    IgnitionModule,
+    _ignition_step,
+    _MAX_UNIFORMS_PER_STEP,
+    _UNIFORM_BLOCK_SIZE,
+)
+from ..modules.material import MaterialRemovalModule, _crater_removal
+from ..modules.mechanics import MechanicsModule, _mechanics_step
+from ..modules.wire import WireModule, _wire_step
+
+# Outcome codes of WireEDMEnv._run_ticks (and of _fused_ticks)
+TICK_OK = 0
+TICK_WIRE_BROKEN = 1
+TICK_TERMINATED = 2
+# _fused_ticks only: a fresh spark needs crater data the current mode lacks
+_TICK_NO_CRATER_DATA = 3
+
+_FUSED_MODULE_TYPES = {
+    "ignition": IgnitionModule,
+    "material": MaterialRemovalModule,
+    "dielectric": DielectricModule,
+    "wire": WireModule,
+    "mechanics": MechanicsModule,
+}
+
+
+# The per-µs module updates and _fused_ticks call the same compiled step
+# helpers (some with fastmath, some without), so each tick rounds identically
+# on either path. The glue here is left without fastmath.
+@njit(cache=NUMBA_CACHE, boundscheck=False, error_model="numpy")
+def _end_tick(
+    dt,
+    spark_state,
+    time,
+    time_since_servo,
+    time_since_open_voltage,
+    time_since_spark_ignition,
+    time_since_spark_end,
+    wire_position,
+    workpiece_position,
+    target_position,
+):
+    """
+    Time bookkeeping and termination checks closing one µs tick.
+
+    Returns (time, time_since_servo, time_since_open_voltage,
+    time_since_spark_ignition, time_since_spark_end, wire_ran_past,
+    target_reached). The wire far past the workpiece counts as a break;
+    otherwise the episode ends once the target position is reached.
+    """
+    time += dt
+    time_since_servo += dt
+    time_since_open_voltage += dt
+    if spark_state == 1:
+        time_since_spark_ignition += dt
+        time_since_spark_end = 0
+    else:
+        time_since_spark_end += dt
+        time_since_spark_ignition = 0
+
+    wire_ran_past = wire_position > workpiece_position + 100
+    target_reached = not wire_ran_past and workpiece_position >= target_position
+    return (
+        time,
+        time_since_servo,
+        time_since_open_voltage,
+        time_since_spark_ignition,
+        time_since_spark_end,
+        wire_ran_past,
+        target_reached,
+    )
+
+
+@njit(cache=NUMBA_CACHE, boundscheck=False, error_model="numpy")
+def _fused_ticks(
+    n_ticks,
+    dt,
+    record,
+    T,
+    rng,
+    uniforms,
+    uniform_index,
+    lambda_lut,
+    short_counters,
+    carry,
+    craters,
+    ignition_params,
+    generator_params,
+    has_crater_data,
+    crater_params,
+    dielectric_params,
+    wire_params,
+    mechanics_params,
+):
+    """
+    Run up to ``n_ticks`` µs of ignition, material, dielectric, wire and
+    mechanics updates, in WireEDMEnv._run_ticks order, without leaving
+    compiled code.
+
+    Each stage is the step helper its module's ``update`` calls
+    (_ignition_step, _crater_removal, _dielectric_update, _wire_step,
+    _mechanics_step, then _end_tick); this loop only threads the values
+    between them. ``record`` is a 1-element ``edm_state_dtype`` array; its
+    fields are read into locals once and written back once.
+    ``short_counters`` holds [random_short_remaining, debris_short_remaining]
+    and ``carry`` the float module state [debris_volume, debris_density,
+    cavity_volume, flow_condition, ion_y, ion_remaining, last_flow_condition,
+    prev_accel, h_eff_base, h_eff_enhanced] (ion_remaining 0 means no ionized
+    channel); both are updated in place, as are T and ``craters`` (sampled
+    crater volumes [µm³]).
+
+    Returns (status, uniforms, uniform_index, n_craters).
+    """
+    (
+        target_voltage,
+        peak_current,
+        on_time,
+        off_time,
+    ) = generator_params
+    dielectric_temperature = dielectric_params[0]
+
+    s = record[0]
+    time = s.time
+    time_since_servo = s.time_since_servo
+    time_since_open_voltage = s.time_since_open_voltage
+    time_since_spark_ignition = s.time_since_spark_ignition
+    time_since_spark_end = s.time_since_spark_end
+    voltage = s.voltage
+    current = s.current
+    workpiece_position = s.workpiece_position
+    wire_position = s.wire_position
+    wire_velocity = s.wire_velocity
+    wire_unwinding_velocity = s.wire_unwinding_velocity
+    time_in_critical_temp = s.time_in_critical_temp
+    spark_state = s.spark_state
+    spark_y = s.spark_y
+    spark_duration = s.spark_duration
+    debris_density = s.debris_density
+    dielectric_flow_rate = s.dielectric_flow_rate
+    last_crater_volume = s.last_crater_volume
+    is_short_circuit = s.is_short_circuit
+    is_wire_broken = s.is_wire_broken
+    is_target_distance_reached = s.is_target_distance_reached
+    target_delta = s.target_delta
+    target_position = s.target_position
+
+    random_short_remaining = short_counters[0]
+    debris_short_remaining = short_counters[1]
+    debris_volume = carry[0]
+    cavity_volume = carry[2]
+    flow_condition = carry[3]
+    ion_y = carry[4]
+    ion_remaining = carry[5]
+    last_flow_condition = carry[6]
+    prev_accel = carry[7]
+    h_eff_base = carry[8]
+    h_eff_enhanced = carry[9]
+
+    status = TICK_OK
+    n_craters = 0
+    for _ in range(n_ticks):
+        # ── Ignition ──
+        if uniform_index + _MAX_UNIFORMS_PER_STEP > len(uniforms):
+            uniforms = np.concatenate(
+                (uniforms[uniform_index:], rng.random(_UNIFORM_BLOCK_SIZE))
+            )
+            uniform_index = 0
+        (
+            spark_state,
+            spark_y,
+            spark_duration,
+            voltage,
+            current,
+            is_short_circuit,
+            random_short_remaining,
+            debris_short_remaining,
+            uniform_index,
+        ) = _ignition_step(
+            spark_state,
+            spark_y,
+            spark_duration,
+            voltage,
+            current,
+            random_short_remaining,
+            debris_short_remaining,
+            workpiece_position - wire_position,
+            debris_density,
+            target_voltage,
+            peak_current,
+            on_time,
+            off_time,
+            uniforms,
+            uniform_index,
+            lambda_lut,
+            ignition_params,
+        )
+
+        # ── Material removal ──
+        fresh_spark = spark_state == 1 and spark_duration == 0
+        if fresh_spark:
+            if not has_crater_data:
+                status = _TICK_NO_CRATER_DATA
+                break
+            (
+                craters[n_craters],
+                last_crater_volume,
+                workpiece_position,
+            ) = _crater_removal(rng, workpiece_position, crater_params)
+            n_craters += 1
+        else:
+            last_crater_volume = 0.0
+
+        # ── Dielectric ──
+        (
+            debris_volume,
+            debris_density,
+            cavity_volume,
+            flow_condition,
+            dielectric_flow_rate,
+            ion_y,
+            ion_remaining,
+        ) = _dielectric_update(
+            workpiece_position - wire_position,
+            fresh_spark,
+            spark_y,
+            last_crater_volume,
+            debris_volume,
+            ion_y,
+            ion_remaining,
+            dielectric_params,
+        )
+
+        # ── Wire ──
+        if not is_wire_broken:
+            (
+                time_in_critical_temp,
+                above_breaking,
+                h_eff_base,
+                h_eff_enhanced,
+                last_flow_condition,
+            ) = _wire_step(
+                T,
+                current,
+                voltage,
+                spark_state,
+                spark_y,
+                flow_condition,
+                wire_unwinding_velocity,
+                dielectric_temperature,
+                time_in_critical_temp,
+                h_eff_base,
+                h_eff_enhanced,
+                last_flow_condition,
+                wire_params,
+            )
+            if above_breaking:
+                is_wire_broken = True
+
+        if is_wire_broken:
+            status = TICK_WIRE_BROKEN
+            break
+
+        # ── Mechanics ──
+        wire_position, wire_velocity, prev_accel = _mechanics_step(
+            wire_position, wire_velocity, target_delta, prev_accel, mechanics_params
+        )
+
+        # ── Time bookkeeping and termination ──
+        (
+            time,
+            time_since_servo,
+            time_since_open_voltage,
+            time_since_spark_ignition,
+            time_since_spark_end,
+            wire_ran_past,
+            target_reached,
+        ) = _end_tick(
+            dt,
+            spark_state,
+            time,
+            time_since_servo,
+            time_since_open_voltage,
+            time_since_spark_ignition,
+            time_since_spark_end,
+            wire_position,
+            workpiece_position,
+            target_position,
+        )
+        if wire_ran_past:
+            is_wire_broken = True
+            status = TICK_TERMINATED
+            break
+        if target_reached:
+            is_target_distance_reached = True
+            status = TICK_TERMINATED
+            break
+
+    s.time = time
+    s.time_since_servo = time_since_servo
+    s.time_since_open_voltage = time_since_open_voltage
+    s.time_since_spark_ignition = time_since_spark_ignition
+    s.time_since_spark_end = time_since_spark_end
+    s.voltage = voltage
+    s.current = current
+    s.workpiece_position = workpiece_position
+    s.wire_position = wire_position
+    s.wire_velocity = wire_velocity
+    s.time_in_critical_temp = time_in_critical_temp
+    s.spark_state = spark_state
+    s.spark_y = spark_y
+    s.spark_duration = spark_duration
+    s.last_crater_volume = last_crater_volume
+    s.is_short_circuit = is_short_circuit
+    s.is_wire_broken = is_wire_broken
+    s.is_target_distance_reached = is_target_distance_reached
+    s.dielectric_temperature = dielectric_temperature
+    s.debris_volume = debris_volume
+    s.debris_density = debris_density
+    s.cavity_volume = cavity_volume
+    s.flow_rate = flow_condition
+    s.debris_concentration = debris_density
+    s.dielectric_flow_rate = dielectric_flow_rate
+
+    short_counters[0] = random_short_remaining
+    short_counters[1] = debris_short_remaining
+    carry[0] = debris_volume
+    carry[1] = debris_density
+    carry[2] = cavity_volume
+    carry[3] = flow_condition
+    carry[4] = ion_y
+    carry[5] = ion_remaining
+    carry[6] = last_flow_condition
+    carry[7] = prev_accel
+    carry[8] = h_eff_base
+    carry[9] = h_eff_enhanced
+
+    return status, uniforms, uniform_index, n_craters
+
+
+def supports_fused_ticks(env) -> bool:
+    """
+    True if ``env`` runs the stock modules, so _fused_ticks reproduces its
+    per-µs update sequence.
+
+    Subclassed or patched modules (an ``update`` set on the instance) and the
+    wire zone mean (not computed by the kernel) keep the per-module path.
+    """
+    for name, module_type in _FUSED_MODULE_TYPES.items():
+        module = getattr(env, name)
+        if type(module) is not module_type or "update" in vars(module):
+            return False
+    return not env.wire.params.compute_zone_mean
+
+
+def run_fused_ticks(env, n_ticks: int) -> int:
+    """
+    Advance ``env`` by up to ``n_ticks`` base steps with one _fused_ticks call.
+
+    Same contract as WireEDMEnv._run_ticks; the state and module internals
+    are marshalled in before the call and synced back after it.
+    """
+    state = env.state
+    ignition = env.ignition
+    material = env.material
+    dielectric = env.dielectric
+    wire = env.wire
+    mechanics = env.mechanics
+
+    # ── Constant inputs for this batch (actions only change between calls) ──
+    current_mode = state.current_mode
+    peak_current = ignition._get_current_from_mode(current_mode)
+    ignition_defaults = ignition.params
+    generator_params = (
+        float(state.target_voltage or ignition_defaults.default_target_voltage),
+        peak_current,
+        float(state.ON_time or ignition_defaults.default_on_time),
+        float(state.OFF_time or ignition_defaults.default_off_time),
+    )
+
+    crater_params = material._crater_params_for_mode(current_mode)
+    has_crater_data = crater_params is not None
+    if not has_crater_data:
+        crater_params = (0.0, 0.0, 0.0)
+
+    # ── Mutable state in ──
+    if len(state.wire_temperature) != wire.n_segments:
+        state.wire_temperature = np.full(
+            wire.n_segments, wire.params.spool_T, dtype=np.float32
+        )
+    record = state.to_record().reshape(1)
+    uniforms = ignition._uniforms_for_step()
+    short_counters = np.array(
+        [ignition.random_short_remaining, ignition.debris_short_remaining],
+        dtype=np.int64,
+    )
+    ion_y, ion_remaining = dielectric.ion_channel or (np.nan, 0)
+    carry = np.array(
+        [
+            dielectric.debris_volume,
+            dielectric.debris_density,
+            dielectric.cavity_volume,
+            dielectric.flow_condition,
+            ion_y,
+            ion_remaining,
+            wire._last_flow_condition,
+            mechanics.prev_accel,
+            wire.h_eff_base,
+            wire.h_eff_enhanced,
+        ],
+        dtype=np.float64,
+    )
+    craters = np.empty(n_ticks, dtype=np.float64)
+
+    status, uniforms, uniform_index, n_craters = _fused_ticks(
+        n_ticks,
+        env.dt,
+        record,
+        state.wire_temperature,
+        env.np_random,
+        uniforms,
+        ignition._uniform_index,
+        ignition._lambda_lut,
+        short_counters,
+        carry,
+        craters,
+        ignition._step_params,
+        generator_params,
+        has_crater_data,
+        crater_params,
+        dielectric._step_params,
+        wire._step_params,
+        mechanics._step_params,
+    )
+
+    # ── Mutable state out ──
+    state.load_record(record[0])
+    ignition._uniform_buffer = uniforms
+    ignition._uniform_index = uniform_index
+    ignition.random_short_remaining = int(short_counters[0])
+    ignition.debris_short_remaining = int(short_counters[1])
+    material.crater_volumes_um3.extend(craters[:n_craters].tolist())
+    (
+        dielectric.debris_volume,
+        dielectric.debris_density,
+        dielectric.cavity_volume,
+        dielectric.flow_condition,
+        ion_y,
+        ion_remaining,
+        wire._last_flow_condition,
+        mechanics.prev_accel,
+        wire.h_eff_base,
+        wire.h_eff_enhanced,
+    ) = carry.tolist()
+    dielectric.ion_channel = (ion_y, int(ion_remaining)) if ion_remaining > 0 else None
+    state.ionized_channel = dielectric.ion_channel
+
+    if status == _TICK_NO_CRATER_DATA:
+        # Raises the per-µs path's ValueError for the missing crater data
+        material.update(state)
+    return status
@@ -10,8 +10,20 @@ from ..core.env_config import EnvironmentConfig
 from ..modules.dielectric import DielectricModule, DielectricModuleParameters
 from ..modules.ignition import IgnitionModule, IgnitionModuleParameters
 from ..modules.material import MaterialRemovalModule, MaterialModuleParameters
-from ..modules.mechanics import MechanicsModule, MechanicsModuleParameters
+from ..modules.mechanics import (
+    CONTROL_MODES,
+    MechanicsModule,
+    MechanicsModuleParameters,
+)
 from ..modules.wire import WireModule, WireModuleParameters
+from .fused_ticks import (
+    TICK_OK as _TICK_OK,
+    TICK_TERMINATED as _TICK_TERMINATED,
+    TICK_WIRE_BROKEN as _TICK_WIRE_BROKEN,
+    _end_tick,
+    run_fused_ticks,
+    supports_fused_ticks,
+)
 
 
 class WireEDMEnv(gym.Env):
@@ -25,6 +37,7 @@ class WireEDMEnv(gym.Env):
         render_mode: str | None = None,
         mechanics_control_mode: str = "position",
         config: EnvironmentConfig = None,
+        flat_action_space: bool = False,
         # Module parameter overrides
         ignition_params: IgnitionModuleParameters = None,
         wire_params: WireModuleParameters = None,
@@ -36,7 +49,7 @@ class WireEDMEnv(gym.Env):
         self.render_mode = render_mode
 
         # Validate mechanics control mode
-        if mechanics_control_mode not in ["position", "velocity"]:
+        if mechanics_control_mode not in CONTROL_MODES:
             raise ValueError(
                 f"mechanics_control_mode must be 'position' or 'velocity', got {mechanics_control_mode}"
             )
@@ -57,6 +70,16 @@ class WireEDMEnv(gym.Env):
         # ── Global State ────────────────────────────────────────────────
         self.state = EDMState()
 
+        # Info dict for plain µs steps (not a control step, not terminal); it
+        # is updated in place rather than rebuilt on every call to step()
+        self._tick_info = {
+            "wire_broken": False,
+            "target_reached": False,
+            "spark_state": 0,
+            "time": 0,
+            "control_step": False,
+        }
+
         # ── Initialize Modules with Parameters ──────────────────────────
         # All modules now use the new parameter organization structure
 
@@ -81,21 +104,32 @@ class WireEDMEnv(gym.Env):
         # Note: target_delta interpretation depends on control mode:
         # - position: relative position increment [µm]
         # - velocity: target velocity [µm/s]
-        self.action_space = spaces.Dict(
-            {
-                "servo": spaces.Box(low=-1.0, high=1.0, shape=(1,), dtype=np.float32),
-                "generator_control": spaces.Dict(
-                    {
-                        "target_voltage": spaces.Box(0.0, 200.0, (1,), np.float32),
-                        "current_mode": spaces.Box(
-                            1, 19, (1,), dtype=np.int32
-                        ),  # I1 to I19 (1-19 maps directly to I1-I19)
-                        "ON_time": spaces.Box(0.0, 5.0, (1,), np.float32),
-                        "OFF_time": spaces.Box(0.0, 100.0, (1,), np.float32),
-                    }
-                ),
-            }
-        )
+        # flat_action_space=True exposes the same five controls as one Box,
+        # ordered [servo, target_voltage, current_mode, ON_time, OFF_time]
+        if flat_action_space:
+            self.action_space = spaces.Box(
+                low=np.array([-1.0, 0.0, 1.0, 0.0, 0.0], dtype=np.float32),
+                high=np.array([1.0, 200.0, 19.0, 5.0, 100.0], dtype=np.float32),
+                dtype=np.float32,
+            )
+        else:
+            self.action_space = spaces.Dict(
+                {
+                    "servo": spaces.Box(
+                        low=-1.0, high=1.0, shape=(1,), dtype=np.float32
+                    ),
+                    "generator_control": spaces.Dict(
+                        {
+                            "target_voltage": spaces.Box(0.0, 200.0, (1,), np.float32),
+                            "current_mode": spaces.Box(
+                                1, 19, (1,), dtype=np.int32
+                            ),  # I1 to I19 (1-19 maps directly to I1-I19)
+                            "ON_time": spaces.Box(0.0, 5.0, (1,), np.float32),
+                            "OFF_time": spaces.Box(0.0, 100.0, (1,), np.float32),
+                        }
+                    ),
+                }
+            )
 
         # observation space placeholder (define as needed)
         self.observation_space = spaces.Dict({})
@@ -111,9 +145,20 @@ class WireEDMEnv(gym.Env):
         self.state.workpiece_position = self.config.initial_gap
         self.state.target_position = self.config.target_cutting_distance
 
+        # Size the wire temperature field once; WireModule updates it in place
+        self.state.wire_temperature = np.full(
+            self.wire.n_segments, self.wire.params.spool_T, dtype=np.float32
+        )
+
         return self._get_obs(), {}
 
     def step(self, action):
+        """
+        Advance the simulation by one base step (1 µs).
+
+        On steps that are neither control steps nor terminal, the returned
+        info dict is reused between calls; copy it if it must be kept.
+        """
         is_ctrl_step = self.state.time_since_servo >= self.servo_interval
 
         if is_ctrl_step:
@@ -121,63 +166,155 @@ class WireEDMEnv(gym.Env):
             self.state.time_since_servo = 0
 
         # physics advance 1 µs
-        self.ignition.update(self.state)
-        self.material.update(self.state)
-        self.dielectric.update(self.state)
-        self.wire.update(self.state)
-
-        if self.state.is_wire_broken:
+        status = self._run_ticks(1)
+        if status == _TICK_WIRE_BROKEN:
             return None, 0.0, True, False, {"wire_broken": True}
 
-        self.mechanics.update(self.state)
-
-        # time bookkeeping
-        self.state.time += self.dt
-        self.state.time_since_servo += self.dt
-        self.state.time_since_open_voltage += self.dt
+        terminated = status == _TICK_TERMINATED
+        if not (is_ctrl_step or terminated):
+            info = self._tick_info
+            info["spark_state"] = self.state.spark_state
+            info["time"] = self.state.time
+            return None, 0.0, False, False, info
 
-        if self.state.spark_status[0] == 1:
-            self.state.time_since_spark_ignition += self.dt
-            self.state.time_since_spark_end = 0
-        else:
-            self.state.time_since_spark_end += self.dt
-            self.state.time_since_spark_ignition = 0
-
-        terminated = self._check_termination()
         obs = self._get_obs() if is_ctrl_step else None
         reward = self._calc_reward() if is_ctrl_step else 0.0
 
         info = {
             "wire_broken": self.state.is_wire_broken,
             "target_reached": self.state.is_target_distance_reached,
-            "spark_state": int(self.state.spark_status[0]),
+            "spark_state": self.state.spark_state,
             "time": self.state.time,
             "control_step": is_ctrl_step,
         }
         return obs, reward, terminated, False, info
 
+    def step_interval(self, action):
+        """
+        Advance the simulation to the next servo tick in one call.
+
+        Equivalent to calling :meth:`step` once per base step until the next
+        control step is due, but without returning to Python between µs steps.
+        ``action`` is applied if the interval starts on a servo tick, exactly
+        as :meth:`step` would apply it. :meth:`step` remains the µs-level API.
+        """
+        is_ctrl_step = self.state.time_since_servo >= self.servo_interval
+
+        if is_ctrl_step:
+            self._apply_action(action)
+            self.state.time_since_servo = 0
+
+        # Base steps until time_since_servo reaches the servo interval again
+        remaining = self.servo_interval - self.state.time_since_servo
+        n_ticks = max(1, -(-remaining // self.dt))
+
+        status = self._run_ticks(n_ticks)
+        if status == _TICK_WIRE_BROKEN:
+            return None, 0.0, True, False, {"wire_broken": True}
+
+        info = {
+            "wire_broken": self.state.is_wire_broken,
+            "target_reached": self.state.is_target_distance_reached,
+            "spark_state": self.state.spark_state,
+            "time": self.state.time,
+            "control_step": is_ctrl_step,
+        }
+        return (
+            self._get_obs(),
+            self._calc_reward(),
+            status == _TICK_TERMINATED,
+            False,
+            info,
+        )
+
     # ------------------------------------------------------------------ #
     # Helpers
     # ------------------------------------------------------------------ #
+    def _run_ticks(self, n_ticks: int) -> int:
+        """
+        Advance the physics by up to ``n_ticks`` base steps in one call.
+
+        Batches of more than one tick on an env with the stock modules run in
+        a single compiled call (see fused_ticks); otherwise state and module
+        update methods are bound once per call and each µs goes through the
+        modules' update methods.
+
+        Returns:
+            _TICK_OK if all ticks ran, _TICK_WIRE_BROKEN if the wire broke
+            during a tick (mechanics and time bookkeeping are skipped for that
+            tick), or _TICK_TERMINATED if the episode ended after a tick.
+        """
+        if n_ticks > 1 and supports_fused_ticks(self):
+            return run_fused_ticks(self, n_ticks)
+
+        state = self.state
+        dt = self.dt
+        ignition_update = self.ignition.update
+        material_update = self.material.update
+        dielectric_update = self.dielectric.update
+        wire_update = self.wire.update
+        mechanics_update = self.mechanics.update
+
+        for _ in range(n_ticks):
+            ignition_update(state)
+            material_update(state)
+            dielectric_update(state)
+            wire_update(state)
+
+            if state.is_wire_broken:
+                return _TICK_WIRE_BROKEN
+
+            mechanics_update(state)
+
+            # Time bookkeeping and termination checks
+            (
+                state.time,
+                state.time_since_servo,
+                state.time_since_open_voltage,
+                state.time_since_spark_ignition,
+                state.time_since_spark_end,
+                wire_ran_past,
+                target_reached,
+            ) = _end_tick(
+                dt,
+                state.spark_state,
+                state.time,
+                state.time_since_servo,
+                state.time_since_open_voltage,
+                state.time_since_spark_ignition,
+                state.time_since_spark_end,
+                state.wire_position,
+                state.workpiece_position,
+                state.target_position,
+            )
+            if wire_ran_past:
+                state.is_wire_broken = True
+                return _TICK_TERMINATED
+            if target_reached:
+                state.is_target_distance_reached = True
+                return _TICK_TERMINATED
+
+        return _TICK_OK
+
     def _apply_action(self, action):
+        if isinstance(action, np.ndarray):
+            # Flat Box action: one conversion to Python floats, indexed by position
+            target_delta, target_voltage, mode, on_time, off_time = action.tolist()
+            self.state.target_delta = target_delta
+            self.state.target_voltage = target_voltage
+            self.state.current_mode = int(round(mode))
+            self.state.ON_time = on_time
+            self.state.OFF_time = off_time
+            return
+
         self.state.target_delta = float(action["servo"][0])
         gc = action["generator_control"]
         self.state.target_voltage = float(gc["target_voltage"][0])
-        # Convert integer mode (1-19) to I-mode string ("I1"-"I19")
-        mode_int = int(gc["current_mode"][0])
-        self.state.current_mode = f"I{mode_int}"
+        # Integer mode 1-19 selects I1-I19; modules index their tables by it
+        self.state.current_mode = int(gc["current_mode"][0])
         self.state.ON_time = float(gc["ON_time"][0])
         self.state.OFF_time = float(gc["OFF_time"][0])
 
-    def _check_termination(self) -> bool:
-        if self.state.wire_position > self.state.workpiece_position + 100:
-            self.state.is_wire_broken = True
-            return True
-        if self.state.workpiece_position >= self.state.target_position:
-            self.state.is_target_distance_reached = True
-            return True
-        return False
-
     def _get_obs(self):
         # TODO: design vector/Dict obs
         return {}
@@ -5,14 +5,15 @@ import numpy as np
 from numba import njit
 from dataclasses import dataclass
 
+from ..core.jit import NUMBA_CACHE
 from ..core.module import EDMModule
-from ..core.state import EDMState
+from ..core.state import EDMState, _DATACLASS_SLOTS
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Dielectric Module Parameters - Defined within module
 # ──────────────────────────────────────────────────────────────────────────────
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DielectricModuleParameters:
     """Dielectric module specific parameters."""
 
@@ -31,14 +32,153 @@ class DielectricModuleParameters:
     ion_channel_duration: int = 6  # [μs] Ionized channel deionization time
 
 
-@njit(cache=False, fastmath=True)  # Disable cache to avoid corruption
+# (y-location, remaining µs) standing in for "no ionized channel"
+_NO_ION_CHANNEL = (np.nan, 0)
+
+
+@njit(cache=NUMBA_CACHE, fastmath=True, boundscheck=False, error_model="numpy")
 def fast_exp(x):
-    """Fast approximation of exp(-x) for x >= 0."""
-    # Use Padé approximation for small x
-    if x < 0.5:
-        return (1 - 0.5 * x) / (1 + 0.5 * x)
-    # Use standard exp for larger values
-    return np.exp(-x)
+    """
+    Fast approximation of exp(-x) for x >= 0.
+
+    Relative error is below 1e-7 for x <= 2 and grows with each squaring,
+    peaking near 3.5e-6 around x = 512; it stays below 4e-6 up to the 700 cutoff.
+    """
+    if x > 700.0:
+        return 0.0
+    # Halve x into [0, 0.5], evaluate there, then square the result back up
+    n_halvings = 0
+    while x > 0.5:
+        x *= 0.5
+        n_halvings += 1
+    # Degree-8 Taylor polynomial of exp(x) in Horner form, scaled by 8!
+    p = 40320.0 + x * (
+        40320.0
+        + x
+        * (
+            20160.0
+            + x * (6720.0 + x * (1680.0 + x * (336.0 + x * (56.0 + x * (8.0 + x)))))
+        )
+    )
+    result = 40320.0 / p
+    for _ in range(n_halvings):
+        result *= result
+    return result
+
+
+@njit(cache=NUMBA_CACHE, fastmath=True, boundscheck=False, error_model="numpy")
+def _dielectric_step(
+    gap_um,
+    debris_volume,
+    cavity_volume_coeff,
+    inv_reference_gap,
+    debris_obstruction_coeff,
+    debris_removal_per_us,
+    crater_volume,
+):
+    """
+    One µs of debris bookkeeping.
+
+    Returns (debris_volume, debris_density, cavity_volume, flow_condition).
+    ``crater_volume`` is the debris added this step (0 when no fresh spark).
+    """
+    # Cavity volume with the gap converted to mm
+    cavity_volume = cavity_volume_coeff * (gap_um * 0.001)
+
+    if crater_volume > 0:
+        debris_volume += crater_volume
+
+    if cavity_volume > 0:
+        debris_density = min(1.0, debris_volume / cavity_volume)
+    else:
+        debris_density = 0.0
+
+    # Gap-dependent factor (Poiseuille-like flow, saturating at the reference
+    # gap) times debris obstruction
+    gap_ratio = gap_um * inv_reference_gap
+    gap_factor = 1.0 if gap_ratio >= 1.0 else gap_ratio * gap_ratio * gap_ratio
+    flow_condition = gap_factor * fast_exp(debris_obstruction_coeff * debris_density)
+
+    # Remove debris via flow: β * f * dt, where f = flow_condition * f0
+    if flow_condition > 0.001 and debris_volume > 0.001:
+        debris_volume = max(0.0, debris_volume - debris_removal_per_us * flow_condition)
+
+    return debris_volume, debris_density, cavity_volume, flow_condition
+
+
+# Shared with the fused tick loop (envs/fused_ticks). No fastmath, so it rounds
+# like the plain-Python update it was extracted from
+@njit(cache=NUMBA_CACHE, boundscheck=False, error_model="numpy")
+def _dielectric_update(
+    gap_um,
+    fresh_spark,
+    spark_y,
+    crater_volume,
+    debris_volume,
+    ion_y,
+    ion_remaining,
+    step_params,
+):
+    """
+    One µs of the dielectric module: gap clamp, debris from a fresh spark,
+    flow, and the legacy ionized channel countdown.
+
+    ``crater_volume`` is the material module's last crater volume [mm³];
+    ``ion_remaining`` 0 means no ionized channel. ``step_params`` is
+    DielectricModule._step_params.
+
+    Returns (debris_volume, debris_density, cavity_volume, flow_condition,
+    dielectric_flow_rate, ion_y, ion_remaining).
+    """
+    (
+        _,
+        cavity_volume_coeff,
+        inv_reference_gap,
+        debris_obstruction_coeff,
+        debris_removal_per_us,
+        ion_channel_duration,
+        base_flow_rate,
+    ) = step_params
+
+    # Minimum gap for numerical stability
+    if not gap_um > 0.001:
+        gap_um = 0.001
+
+    # Only fresh real sparks (not short circuits) add debris
+    if not fresh_spark:
+        crater_volume = 0.0
+    elif crater_volume > 0:
+        ion_y = spark_y
+        ion_remaining = ion_channel_duration
+
+    (
+        debris_volume,
+        debris_density,
+        cavity_volume,
+        flow_condition,
+    ) = _dielectric_step(
+        gap_um,
+        debris_volume,
+        cavity_volume_coeff,
+        inv_reference_gap,
+        debris_obstruction_coeff,
+        debris_removal_per_us,
+        crater_volume,
+    )
+
+    if ion_remaining > 0:
+        ion_remaining = ion_remaining - 1 if ion_remaining > 1 else 0
+
+    dielectric_flow_rate = (flow_condition * base_flow_rate) / 1e9
+    return (
+        debris_volume,
+        debris_density,
+        cavity_volume,
+        flow_condition,
+        dielectric_flow_rate,
+        ion_y,
+        ion_remaining,
+    )
 
 
 class DielectricModule(EDMModule):
@@ -60,11 +200,22 @@ class DielectricModule(EDMModule):
 
         # ── Pre-compute Constants ──
         self.cavity_volume_coeff = np.pi * self.wire_radius * self.workpiece_height
-        self.g_ref_cubed = self.params.reference_gap**3
+        self.inv_reference_gap = 1.0 / self.params.reference_gap
         self.debris_removal_per_us = (
             self.params.debris_removal_efficiency * self.params.base_flow_rate * 1e-6
         )  # Pre-compute for μs timestep
 
+        # Constant scalars unpacked at the top of update(), one tuple read per µs
+        self._step_params = (
+            self.params.dielectric_temperature,
+            self.cavity_volume_coeff,
+            self.inv_reference_gap,
+            self.params.debris_obstruction_coeff,
+            self.debris_removal_per_us,
+            self.params.ion_channel_duration,
+            self.params.base_flow_rate,
+        )
+
         # ── Internal State ──
         self.debris_volume = 0.0  # [mm³]
         self.cavity_volume = 0.0  # [mm³]
@@ -74,80 +225,39 @@ class DielectricModule(EDMModule):
         # ── Legacy Compatibility ──
         self.ion_channel = None  # (y, remaining μs)
 
-        # ── Cache for Performance ──
-        self._last_gap_um = -1.0
-        self._last_debris_density = -1.0
-        self._last_flow_condition = 0.0
+        # Returned by get_debris_statistics, updated in place on each call
+        self._debris_statistics = {
+            "debris_volume_mm3": 0.0,
+            "debris_density": 0.0,
+            "cavity_volume_mm3": 0.0,
+            "flow_condition": 0.0,
+            "debris_fill_percentage": 0.0,
+        }
 
     def update(self, state: EDMState) -> None:
-        """Optimized update with caching and reduced calculations."""
-        # Update basic properties
-        state.dielectric_temperature = self.params.dielectric_temperature
-
-        # Calculate current gap with minimum value for numerical stability
-        gap_um = max(0.001, state.workpiece_position - state.wire_position)  # [μm]
-
-        # Fast cavity volume calculation (gap already in mm for this calc)
-        gap_mm = gap_um * 0.001  # Convert to mm
-        self.cavity_volume = self.cavity_volume_coeff * gap_mm
-
-        # Add debris from fresh spark events (only real sparks, not short circuits)
-        if state.spark_status[0] == 1 and state.spark_status[2] == 0:
-            # Use crater volume from material module if available
-            crater_volume = state.last_crater_volume
-            if crater_volume > 0:
-                self.debris_volume += crater_volume
-                # Set up ionized channel for legacy compatibility
-                self.ion_channel = (
-                    state.spark_status[1],
-                    self.params.ion_channel_duration,
-                )
-
-        # Update debris density
-        if self.cavity_volume > 0:
-            self.debris_density = min(1.0, self.debris_volume / self.cavity_volume)
-        else:
-            self.debris_density = 0.0
-
-        # Calculate flow condition with caching
-        if (
-            abs(gap_um - self._last_gap_um) > 0.01
-            or abs(self.debris_density - self._last_debris_density) > 0.001
-        ):
-
-            # Gap-dependent factor (Poiseuille-like flow)
-            gap_factor = min(1.0, (gap_um / self.params.reference_gap) ** 3)
-
-            # Debris obstruction factor using fast exponential
-            if self.params.debris_obstruction_coeff * self.debris_density < 2.0:
-                debris_factor = fast_exp(
-                    self.params.debris_obstruction_coeff * self.debris_density
-                )
-            else:
-                debris_factor = np.exp(
-                    -self.params.debris_obstruction_coeff * self.debris_density
-                )
-
-            self.flow_condition = gap_factor * debris_factor
-
-            # Update cache
-            self._last_gap_um = gap_um
-            self._last_debris_density = self.debris_density
-            self._last_flow_condition = self.flow_condition
-        else:
-            # Use cached value
-            self.flow_condition = self._last_flow_condition
-
-        # Remove debris via flow (optimized with pre-computed rate)
-        if self.flow_condition > 0.001 and self.debris_volume > 0.001:
-            # Debris removed = β * f * dt, where f = flow_condition * f0
-            debris_removed = self.debris_removal_per_us * self.flow_condition
-            self.debris_volume = max(0.0, self.debris_volume - debris_removed)
-
-        # Update ionized channel (legacy compatibility)
-        if self.ion_channel:
-            y_loc, t_left = self.ion_channel
-            self.ion_channel = (y_loc, t_left - 1) if t_left > 1 else None
+        """Advance debris tracking by one µs (arithmetic in _dielectric_update)."""
+        state.dielectric_temperature = self._step_params[0]
+
+        ion_y, ion_remaining = self.ion_channel or _NO_ION_CHANNEL
+        (
+            self.debris_volume,
+            self.debris_density,
+            self.cavity_volume,
+            self.flow_condition,
+            dielectric_flow_rate,
+            ion_y,
+            ion_remaining,
+        ) = _dielectric_update(
+            state.workpiece_position - state.wire_position,
+            state.spark_state == 1 and state.spark_duration == 0,
+            state.spark_y,
+            state.last_crater_volume,
+            self.debris_volume,
+            ion_y,
+            ion_remaining,
+            self._step_params,
+        )
+        self.ion_channel = (ion_y, ion_remaining) if ion_remaining > 0 else None
 
         # Sync to global state
         state.debris_volume = self.debris_volume
@@ -157,9 +267,7 @@ class DielectricModule(EDMModule):
 
         # Legacy compatibility
         state.debris_concentration = self.debris_density
-        state.dielectric_flow_rate = (
-            self.flow_condition * self.params.base_flow_rate
-        ) / 1e9
+        state.dielectric_flow_rate = dielectric_flow_rate
         state.ionized_channel = self.ion_channel
 
     def reset_debris(self) -> None:
@@ -168,15 +276,18 @@ class DielectricModule(EDMModule):
         self.debris_density = 0.0
         self.cavity_volume = 0.0
         self.flow_condition = 0.0
-        self._last_gap_um = -1.0
-        self._last_debris_density = -1.0
 
     def get_debris_statistics(self) -> dict:
-        """Get current debris tracking statistics."""
-        return {
-            "debris_volume_mm3": self.debris_volume,
-            "debris_density": self.debris_density,
-            "cavity_volume_mm3": self.cavity_volume,
-            "flow_condition": self.flow_condition,
-            "debris_fill_percentage": self.debris_density * 100.0,
-        }
+        """
+        Get current debris tracking statistics.
+
+        The same dict is updated and returned on every call; copy it if it
+        must be kept.
+        """
+        stats = self._debris_statistics
+        stats["debris_volume_mm3"] = self.debris_volume
+        stats["debris_density"] = self.debris_density
+        stats["cavity_volume_mm3"] = self.cavity_volume
+        stats["flow_condition"] = self.flow_condition
+        stats["debris_fill_percentage"] = self.debris_density * 100.0
+        return stats
@@ -3,18 +3,31 @@ from __future__ import annotations
 
 import json
 import numpy as np
+from numba import njit
 from pathlib import Path
 from dataclasses import dataclass
 
+from ..core.jit import NUMBA_CACHE
 from ..core.module import EDMModule
-from ..core.state import EDMState
+from ..core.state import EDMState, _DATACLASS_SLOTS
 from ..core.state_utils import is_short_circuited
+from .dielectric import fast_exp
+
+# Uniform draws fetched from the generator per refill; a µs step uses at most
+# _MAX_UNIFORMS_PER_STEP of them (two short rolls, ignition roll, location)
+_UNIFORM_BLOCK_SIZE = 4096
+_MAX_UNIFORMS_PER_STEP = 4
+
+# Ignition probability lookup table: gaps [0, 200) μm in 0.1 μm bins
+_LAMBDA_LUT_MAX_GAP = 200.0  # [μm]
+_LAMBDA_LUT_BINS_PER_UM = 10
+_LN2 = 0.6931471805599453  # ln(2), the median-to-rate factor of the λ model
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Ignition Module Parameters - Defined within module
 # ──────────────────────────────────────────────────────────────────────────────
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class IgnitionModuleParameters:
     """Ignition module specific parameters."""
 
@@ -57,6 +70,196 @@ class IgnitionModuleParameters:
     )
 
 
+@njit(cache=NUMBA_CACHE, fastmath=True, boundscheck=False, error_model="numpy")
+def _debris_short_probability(
+    gap,
+    debris_density,
+    hard_short_gap,
+    base_critical_density,
+    gap_coefficient,
+    max_critical_density,
+    sigmoid_steepness,
+):
+    """Sigmoid debris short probability; see _get_debris_short_probability."""
+    # Hard short circuit for very small gaps
+    if gap < hard_short_gap:
+        return 1.0
+
+    critical_density = min(
+        base_critical_density + gap_coefficient * gap, max_critical_density
+    )
+
+    # P = 1 / (1 + exp(-x)), evaluated with exp of a non-negative argument only
+    x = sigmoid_steepness * (debris_density - critical_density)
+    if x >= 0.0:
+        return 1.0 / (1.0 + fast_exp(x))
+    e = fast_exp(-x)
+    return e / (1.0 + e)
+
+
+@njit(cache=NUMBA_CACHE, fastmath=True, boundscheck=False, error_model="numpy")
+def _ignition_step(
+    spark_state,
+    spark_y,
+    spark_duration,
+    voltage,
+    current,
+    random_short_remaining,
+    debris_short_remaining,
+    gap,
+    debris_density,
+    target_voltage,
+    peak_current,
+    on_time,
+    off_time,
+    uniforms,
+    uniform_index,
+    lambda_lut,
+    step_params,
+):
+    """
+    One µs of short circuit detection followed by the spark state machine.
+
+    ``voltage``/``current`` are NaN when unset and come back unchanged from
+    branches that do not drive them. ``uniforms[uniform_index:]`` must hold
+    at least _MAX_UNIFORMS_PER_STEP U[0, 1) draws, consumed in order.
+    ``step_params`` is IgnitionModule._step_params.
+
+    Returns (spark_state, spark_y, spark_duration, voltage, current,
+    is_short_circuit, random_short_remaining, debris_short_remaining,
+    uniform_index).
+    """
+    (
+        hard_short_gap,
+        base_critical_density,
+        gap_coefficient,
+        max_critical_density,
+        sigmoid_steepness,
+        random_short_inv_span,
+        random_short_max_gap,
+        random_short_max_probability,
+        debris_short_duration,
+        random_short_duration,
+        spark_voltage_factor,
+        workpiece_height,
+        lut_bins_per_um,
+    ) = step_params
+
+    # ── Short circuit detection ──
+    if random_short_remaining > 0:
+        random_short_remaining -= 1
+        is_short_circuit = True
+    elif debris_short_remaining > 0:
+        debris_short_remaining -= 1
+        is_short_circuit = True
+    else:
+        clamped_gap = max(0.0, gap)
+        debris_short_prob = _debris_short_probability(
+            clamped_gap,
+            debris_density,
+            hard_short_gap,
+            base_critical_density,
+            gap_coefficient,
+            max_critical_density,
+            sigmoid_steepness,
+        )
+
+        # Linear: max probability below min_gap, zero above max_gap, as a
+        # saturating clamp of (max_gap - gap) / (max_gap - min_gap)
+        gap_factor = (random_short_max_gap - clamped_gap) * random_short_inv_span
+        random_short_prob = random_short_max_probability * min(
+            max(gap_factor, 0.0), 1.0
+        )
+
+        # Roll for debris short circuit, then for random short circuit
+        is_short_circuit = False
+        roll = uniforms[uniform_index]
+        uniform_index += 1
+        if roll < debris_short_prob:
+            debris_short_remaining = debris_short_duration
+            is_short_circuit = True
+        else:
+            roll = uniforms[uniform_index]
+            uniform_index += 1
+            if roll < random_short_prob:
+                random_short_remaining = random_short_duration
+                is_short_circuit = True
+
+    if is_short_circuit:
+        voltage = 0.0
+
+    # ── State machine ──
+    if spark_state == 0:
+        # Idle
+        current = 0.0
+        if is_short_circuit:
+            # Short circuit during idle → deliver pulse
+            spark_state = -1
+            spark_y = np.nan
+            spark_duration = 0
+            current = peak_current
+        else:
+            # Normal idle → set voltage and check for ignition
+            voltage = target_voltage
+            index = min(max(int(gap * lut_bins_per_um), 0), len(lambda_lut) - 1)
+            roll = uniforms[uniform_index]
+            uniform_index += 1
+            if roll < lambda_lut[index]:
+                # Start normal spark at a random height
+                spark_state = 1
+                spark_y = uniforms[uniform_index] * workpiece_height
+                uniform_index += 1
+                spark_duration = 0
+                voltage = target_voltage * spark_voltage_factor
+                current = peak_current
+    elif spark_state == 1:
+        # Active spark
+        spark_duration += 1
+        if spark_duration >= on_time:
+            # Spark finished → go to rest
+            spark_state = -2
+            current = 0.0
+            if not is_short_circuit:
+                voltage = 0.0
+        else:
+            current = peak_current
+            if not is_short_circuit:
+                voltage = target_voltage * spark_voltage_factor
+    elif spark_state == -1:
+        # Short circuit pulse
+        spark_duration += 1
+        if spark_duration >= on_time:
+            spark_state = -2
+            current = 0.0
+        else:
+            current = peak_current
+    elif spark_state == -2:
+        # Rest/off time
+        spark_duration += 1
+        current = 0.0
+        if spark_duration >= on_time + off_time:
+            # Rest finished → back to idle
+            spark_state = 0
+            spark_y = np.nan
+            spark_duration = 0
+            if not is_short_circuit:
+                voltage = target_voltage
+        elif not is_short_circuit:
+            voltage = 0.0
+
+    return (
+        spark_state,
+        spark_y,
+        spark_duration,
+        voltage,
+        current,
+        is_short_circuit,
+        random_short_remaining,
+        debris_short_remaining,
+        uniform_index,
+    )
+
+
 class IgnitionModule(EDMModule):
     """Stochastic plasma-channel ignition model with critical debris short circuit detection."""
 
@@ -71,17 +274,69 @@ class IgnitionModule(EDMModule):
         self.params = parameters or IgnitionModuleParameters()
 
         # ── Internal State ──
-        self.lambda_cache: dict[float, float] = {}
+        self._lambda_lut = self._build_lambda_lut()
         self.random_short_remaining = 0  # Remaining microseconds of random short
         self.debris_short_remaining = 0  # Remaining microseconds of debris short
 
+        # Returned by get_short_circuit_status, updated in place on each call
+        self._short_circuit_status = {
+            "has_random_short": False,
+            "random_short_remaining_us": 0,
+            "has_debris_short": False,
+            "debris_short_remaining_us": 0,
+            "total_short_remaining_us": 0,
+        }
+
         # ── Current Mapping Data ──
         self.currents_data = self._load_currents_data()
 
+        # Peak current per integer mode (index n <-> "In"); modes without data,
+        # including 0 (not set), fall back to the default mode's current
+        default_current = self.currents_data[self.params.default_current_mode][
+            "Current"
+        ]
+        self.current_by_mode = np.full(20, default_current, dtype=np.float64)
+        for label, entry in self.currents_data.items():
+            mode = int(label[1:])
+            if 0 <= mode < len(self.current_by_mode):
+                self.current_by_mode[mode] = entry["Current"]
+
         # ── Caching for Performance ──
-        self._cached_current_mode: str | None = None
+        self._cached_current_mode: int | None = None
         self._cached_current_value: float = 60.0  # Default to I5 current
 
+        # ── Buffered Uniform Draws ──
+        # Filled in blocks from env.np_random; refilled when exhausted or when
+        # the env's generator is replaced (reset(seed=...))
+        self._uniform_rng: np.random.Generator | None = None
+        self._uniform_buffer = np.empty(0)
+        self._uniform_index = 0
+
+        # 1 / (max_gap - min_gap) of the random short ramp; an empty or
+        # inverted ramp is a step at max_gap, so its slope is made huge
+        params = self.params
+        random_short_span = params.random_short_max_gap - params.random_short_min_gap
+        random_short_inv_span = (
+            1.0 / random_short_span if random_short_span > 0 else 1e300
+        )
+
+        # Constant scalars handed to _ignition_step each µs, in its unpack order
+        self._step_params = (
+            float(params.hard_short_gap),
+            float(params.base_critical_density),
+            float(params.gap_coefficient),
+            float(params.max_critical_density),
+            float(params.sigmoid_steepness),
+            float(random_short_inv_span),
+            float(params.random_short_max_gap),
+            float(params.random_short_max_probability),
+            int(params.debris_short_duration),
+            int(params.random_short_duration),
+            float(params.spark_voltage_factor),
+            float(env.config.workpiece_height),
+            float(_LAMBDA_LUT_BINS_PER_UM),
+        )
+
     def _load_currents_data(self) -> dict:
         """Load current mode mappings from currents.json."""
         # Get the path relative to this module
@@ -95,19 +350,49 @@ class IgnitionModule(EDMModule):
         except FileNotFoundError:
             raise FileNotFoundError(f"Could not find currents data file at {json_path}")
 
-    def _get_current_from_mode(self, current_mode: str | None) -> float:
+    def _build_lambda_lut(self) -> np.ndarray:
+        """λ = ln(2) / (a*gap² + b*gap + c), sampled at the centre of each gap bin."""
+        n_bins = int(_LAMBDA_LUT_MAX_GAP * _LAMBDA_LUT_BINS_PER_UM)
+        gap = (np.arange(n_bins) + 0.5) / _LAMBDA_LUT_BINS_PER_UM
+        denominator = (
+            self.params.ignition_a_coeff * gap**2
+            + self.params.ignition_b_coeff * gap
+            + self.params.ignition_c_coeff
+        )
+        return _LN2 / denominator
+
+    def _uniforms_for_step(self) -> np.ndarray:
+        """
+        Uniform block holding enough unread draws for one _ignition_step call.
+
+        Unread draws are carried over when the block is topped up, so no draw
+        is skipped at a block boundary.
+        """
+        rng = self.env.np_random
+        buffer = self._uniform_buffer
+        if rng is not self._uniform_rng:
+            self._uniform_rng = rng
+            buffer = rng.random(_UNIFORM_BLOCK_SIZE)
+            self._uniform_index = 0
+        elif self._uniform_index + _MAX_UNIFORMS_PER_STEP > len(buffer):
+            buffer = np.concatenate(
+                (buffer[self._uniform_index :], rng.random(_UNIFORM_BLOCK_SIZE))
+            )
+            self._uniform_index = 0
+        self._uniform_buffer = buffer
+        return buffer
+
+    def _get_current_from_mode(self, current_mode: int) -> float:
         """Get actual current value from current mode with caching."""
         # Only recalculate if current_mode has changed
         if current_mode != self._cached_current_mode:
-            if current_mode is None:
-                current_mode = self.params.default_current_mode
-
-            # Get actual current from current mode (0-18 maps to I1-I19)
-            if current_mode not in self.currents_data:
+            if 0 <= current_mode < len(self.current_by_mode):
+                current = self.current_by_mode[current_mode]
+            else:
                 # Fallback to default if invalid mode
-                current_mode = self.params.default_current_mode
+                current = self.current_by_mode[0]
 
-            self._cached_current_value = self.currents_data[current_mode]["Current"]
+            self._cached_current_value = float(current)
             self._cached_current_mode = current_mode
 
         return self._cached_current_value
@@ -122,28 +407,16 @@ class IgnitionModule(EDMModule):
         The sigmoid function: P = 1 / (1 + exp(-k * (ρ - ρ_crit)))
         where k is the steepness parameter.
         """
-        # Hard short circuit for very small gaps
-        if gap < self.params.hard_short_gap:
-            return 1.0
-
-        # Calculate critical debris density for this gap
-        critical_density = (
-            self.params.base_critical_density + self.params.gap_coefficient * gap
+        params = self.params
+        return _debris_short_probability(
+            gap,
+            debris_density,
+            params.hard_short_gap,
+            params.base_critical_density,
+            params.gap_coefficient,
+            params.max_critical_density,
+            params.sigmoid_steepness,
         )
-        critical_density = min(critical_density, self.params.max_critical_density)
-
-        # Calculate sigmoid probability
-        # P = 1 / (1 + exp(-k * (ρ - ρ_crit)))
-        delta_density = debris_density - critical_density
-        exponent = -self.params.sigmoid_steepness * delta_density
-
-        # Prevent overflow for very large negative exponents
-        if exponent > 500:
-            return 0.0
-        elif exponent < -500:
-            return 1.0
-        else:
-            return 1.0 / (1.0 + np.exp(exponent))
 
     def _detect_critical_debris_short(self, gap: float, debris_density: float) -> bool:
         """
@@ -173,174 +446,52 @@ class IgnitionModule(EDMModule):
     # Public
     # ------------------------------------------------------------------ #
     def update(self, state: EDMState) -> None:
-        """Update ignition state with clear, simple logic."""
-
-        # Step 1: Update short circuit detection with debris consideration
-        self._update_short_circuit_detection(state)
-
-        # Step 2: Force voltage to 0 if short circuit
-        if state.is_short_circuit:
-            state.voltage = 0
-
-        # Step 3: Handle state machine
-        spark_state = state.spark_status[0]
-
-        if spark_state == 0:
-            self._handle_idle_state(state)
-        elif spark_state == 1:
-            self._handle_spark_state(state)
-        elif spark_state == -1:
-            self._handle_short_state(state)
-        elif spark_state == -2:
-            self._handle_rest_state(state)
-
-    def _update_short_circuit_detection(self, state: EDMState) -> None:
-        """Update short circuit flag based on gap and debris density using sigmoid probability."""
-        gap = max(0.0, state.workpiece_position - state.wire_position)
-
-        # Get debris density from state (default to 0 if not available)
-        debris_density = getattr(state, "debris_density", 0.0)
-
-        # Check for active short circuits first (either type)
-        if self.random_short_remaining > 0:
-            self.random_short_remaining -= 1
-            state.is_short_circuit = True
-            return
-
-        if self.debris_short_remaining > 0:
-            self.debris_short_remaining -= 1
-            state.is_short_circuit = True
-            return
-
-        # Calculate probabilities for new short circuits
-        # Use sigmoid model for debris-based short circuit probability
-        debris_short_prob = self._get_debris_short_probability(gap, debris_density)
-
-        # Check for random gap-dependent short circuit
-        # Linear probability: 0% at gap > max_gap, max_probability at gap < min_gap, linear in between
-        if gap >= self.params.random_short_max_gap:
-            random_short_prob = 0.0
-        elif gap <= self.params.random_short_min_gap:
-            random_short_prob = self.params.random_short_max_probability
-        else:
-            # Linear interpolation between max_probability and 0%
-            gap_factor = 1.0 - (gap - self.params.random_short_min_gap) / (
-                self.params.random_short_max_gap - self.params.random_short_min_gap
-            )
-            random_short_prob = gap_factor * self.params.random_short_max_probability
-
-        # Roll for debris short circuit
-        if self.env.np_random.random() < debris_short_prob:
-            self.debris_short_remaining = self.params.debris_short_duration
-            state.is_short_circuit = True
-            return
-
-        # Roll for random short circuit
-        if self.env.np_random.random() < random_short_prob:
-            self.random_short_remaining = self.params.random_short_duration
-            state.is_short_circuit = True
-            return
-
-        # No short circuit
-        state.is_short_circuit = False
-
-    def _handle_idle_state(self, state: EDMState) -> None:
-        """Handle idle state (state 0)."""
-        state.current = 0
-
-        if state.is_short_circuit:
-            # Short circuit during idle → deliver pulse
-            state.spark_status = [-1, None, 0]
-            state.current = self._get_peak_current(state)
-        else:
-            # Normal idle → set voltage and check for ignition
-            state.voltage = self._get_target_voltage(state)
-
-            if self._should_ignite(state):
-                # Start normal spark
-                spark_location = self.env.np_random.uniform(
-                    0, self.env.config.workpiece_height
-                )
-                state.spark_status = [1, spark_location, 0]
-                state.voltage = (
-                    self._get_target_voltage(state) * self.params.spark_voltage_factor
-                )
-                state.current = self._get_peak_current(state)
-
-    def _handle_spark_state(self, state: EDMState) -> None:
-        """Handle active spark state (state 1)."""
-        duration = state.spark_status[2] + 1
-        state.spark_status[2] = duration
-
-        if duration >= self._get_on_time(state):
-            # Spark finished → go to rest
-            state.spark_status[0] = -2
-            state.current = 0
-            if not state.is_short_circuit:
-                state.voltage = 0
-        else:
-            # Continue spark
-            state.current = self._get_peak_current(state)
-            if not state.is_short_circuit:
-                state.voltage = (
-                    self._get_target_voltage(state) * self.params.spark_voltage_factor
-                )
-
-    def _handle_short_state(self, state: EDMState) -> None:
-        """Handle short circuit pulse state (state -1)."""
-        duration = state.spark_status[2] + 1
-        state.spark_status[2] = duration
-
-        if duration >= self._get_on_time(state):
-            # Short pulse finished → go to rest
-            state.spark_status[0] = -2
-            state.current = 0
-        else:
-            # Continue short pulse
-            state.current = self._get_peak_current(state)
-
-    def _handle_rest_state(self, state: EDMState) -> None:
-        """Handle rest/off state (state -2)."""
-        duration = state.spark_status[2] + 1
-        state.spark_status[2] = duration
-
-        total_cycle_time = self._get_on_time(state) + self._get_off_time(state)
-
-        if duration >= total_cycle_time:
-            # Rest finished → back to idle
-            state.spark_status = [0, None, 0]
-            state.current = 0
-            if not state.is_short_circuit:
-                state.voltage = self._get_target_voltage(state)
+        """Advance short circuit detection and the spark state machine by 1 µs."""
+        params = self.params
+        uniforms = self._uniforms_for_step()
+        voltage = state.voltage
+        current = state.current
+
+        # Peak current only changes with the current mode (i.e. on control steps)
+        current_mode = state.current_mode
+        if current_mode == self._cached_current_mode:
+            peak_current = self._cached_current_value
         else:
-            # Continue rest
-            state.current = 0
-            if not state.is_short_circuit:
-                state.voltage = 0
-
-    def _should_ignite(self, state: EDMState) -> bool:
-        """Check if normal ignition should occur."""
-        if state.is_short_circuit:
-            return False
-
-        ignition_probability = self.get_lambda(state)
-        return self.env.np_random.random() < ignition_probability
-
-    def _get_target_voltage(self, state: EDMState) -> float:
-        """Get target voltage with default."""
-        return state.target_voltage or self.params.default_target_voltage
-
-    def _get_peak_current(self, state: EDMState) -> float:
-        """Get peak current for current mode."""
-        return self._get_current_from_mode(state.current_mode)
-
-    def _get_on_time(self, state: EDMState) -> float:
-        """Get ON time with default."""
-        return state.ON_time or self.params.default_on_time
+            peak_current = self._get_current_from_mode(current_mode)
+
+        (
+            state.spark_state,
+            state.spark_y,
+            state.spark_duration,
+            voltage,
+            current,
+            state.is_short_circuit,
+            self.random_short_remaining,
+            self.debris_short_remaining,
+            self._uniform_index,
+        ) = _ignition_step(
+            state.spark_state,
+            state.spark_y,
+            state.spark_duration,
+            np.nan if voltage is None else voltage,
+            np.nan if current is None else current,
+            self.random_short_remaining,
+            self.debris_short_remaining,
+            state.workpiece_position - state.wire_position,
+            state.debris_density,
+            state.target_voltage or params.default_target_voltage,
+            peak_current,
+            state.ON_time or params.default_on_time,
+            state.OFF_time or params.default_off_time,
+            uniforms,
+            self._uniform_index,
+            self._lambda_lut,
+            self._step_params,
+        )
 
-    def _get_off_time(self, state: EDMState) -> float:
-        """Get OFF time with default."""
-        return state.OFF_time or self.params.default_off_time
+        # NaN comes back only for a value that was unset and left untouched
+        state.voltage = None if voltage != voltage else voltage
+        state.current = None if current != current else current
 
     # ------------------------------------------------------------------ #
     # Internals
@@ -352,16 +503,10 @@ class IgnitionModule(EDMModule):
 
         gap = state.workpiece_position - state.wire_position
 
-        if gap not in self.lambda_cache:
-            # λ = ln(2) / (a*gap² + b*gap + c)
-            denominator = (
-                self.params.ignition_a_coeff * gap**2
-                + self.params.ignition_b_coeff * gap
-                + self.params.ignition_c_coeff
-            )
-            self.lambda_cache[gap] = np.log(2) / denominator
-
-        return self.lambda_cache[gap]
+        # Gaps beyond the table use its last bin
+        lut = self._lambda_lut
+        index = int(gap * _LAMBDA_LUT_BINS_PER_UM)
+        return float(lut[min(max(index, 0), len(lut) - 1)])
 
     def get_critical_density_for_gap(self, gap: float) -> float:
         """
@@ -387,13 +532,16 @@ class IgnitionModule(EDMModule):
         """
         Get detailed short circuit status.
         Returns dict with type of short circuit and remaining duration.
+
+        The same dict is updated and returned on every call; copy it if it
+        must be kept.
         """
-        return {
-            "has_random_short": self.random_short_remaining > 0,
-            "random_short_remaining_us": self.random_short_remaining,
-            "has_debris_short": self.debris_short_remaining > 0,
-            "debris_short_remaining_us": self.debris_short_remaining,
-            "total_short_remaining_us": max(
-                self.random_short_remaining, self.debris_short_remaining
-            ),
-        }
+        random_remaining = self.random_short_remaining
+        debris_remaining = self.debris_short_remaining
+        status = self._short_circuit_status
+        status["has_random_short"] = random_remaining > 0
+        status["random_short_remaining_us"] = random_remaining
+        status["has_debris_short"] = debris_remaining > 0
+        status["debris_short_remaining_us"] = debris_remaining
+        status["total_short_remaining_us"] = max(random_remaining, debris_remaining)
+        return status
@@ -7,6 +7,9 @@ import numpy as np
 from pathlib import Path
 from dataclasses import dataclass
 
+from numba import njit
+
+from ..core.jit import NUMBA_CACHE
 from ..core.module import EDMModule
 from ..core.state import EDMState
 
@@ -22,6 +25,34 @@ class MaterialModuleParameters:
     base_overcut: float = 0.12  # [mm] Base overcut (0.06mm per side)
 
 
+# Shared with the fused tick loop (envs/fused_ticks). No fastmath, so it rounds
+# like the plain-Python update it was extracted from
+@njit(cache=NUMBA_CACHE, boundscheck=False, error_model="numpy")
+def _crater_removal(rng, workpiece_position, crater_params):
+    """
+    Sample one crater and advance the workpiece by the material it removes.
+
+    ``crater_params`` is (mean, std) of the crater volume [μm³] and the kerf
+    cross-section [mm²] (0 for no advance), from
+    MaterialRemovalModule._crater_params_for_mode.
+
+    Returns (crater volume [μm³], crater volume [mm³], workpiece_position [μm]).
+    """
+    mean_volume, std_volume, kerf_area = crater_params
+
+    # Gaussian sample, clamped to a non-negative volume
+    volume_um3 = rng.normal(mean_volume, std_volume)
+    if not volume_um3 > 0.0:
+        volume_um3 = 0.0
+    volume_mm3 = volume_um3 / 1e9
+
+    # ΔXw = Vc / (k * hw), converted from mm to μm
+    if volume_mm3 > 0 and kerf_area > 0:
+        workpiece_position += volume_mm3 / kerf_area * 1000.0
+
+    return volume_um3, volume_mm3, workpiece_position
+
+
 class MaterialRemovalModule(EDMModule):
     """Material removal module using empirical crater volume distributions."""
 
@@ -41,10 +72,20 @@ class MaterialRemovalModule(EDMModule):
         # Load machine current modes data
         self.currents_data = self._load_currents_data()
 
+        # Crater distribution per integer mode (index n <-> "In"), None where
+        # no data exists; mode 0 (not set) uses I1
+        self.crater_info_by_mode: list[dict | None] = [None] * 20
+        for label, info in self.crater_data.items():
+            mode = int(label[1:])
+            if 0 <= mode < len(self.crater_info_by_mode):
+                self.crater_info_by_mode[mode] = info
+        self.crater_info_by_mode[0] = self.crater_data["I1"]
+
         # ── Caching for Performance ──
         # Cache for efficiency - avoid repeated current mode lookups
-        self._cached_current_mode: str | None = None
+        self._cached_current_mode: int | None = None
         self._cached_crater_info: dict = self.crater_data["I1"]  # Default crater data
+        self._cached_crater_params: tuple | None = None
 
         # ── Analysis Tracking ──
         # Track crater volumes for analysis
@@ -79,99 +120,68 @@ class MaterialRemovalModule(EDMModule):
     def update(self, state: EDMState) -> None:
         """Update material removal based on spark events and crater volumes."""
         # Only remove material during fresh REAL sparks (state 1), not short circuits (state -1)
-        # Skip material removal during short circuits (state -1)
-        if state.spark_status[0] == 1 and state.spark_status[2] == 0:
-            # Fresh real spark just ignited, calculate material removal
-            crater_volume = self._sample_crater_volume(state)
-
-            # Make crater volume available to dielectric module for debris tracking
-            state.last_crater_volume = crater_volume
-
-            if crater_volume > 0:
-                # Calculate workpiece position increment
-                delta_x = self._calculate_position_increment(crater_volume, state)
-                state.workpiece_position += delta_x
-        else:
-            # No fresh real spark, reset crater volume
-            state.last_crater_volume = 0.0
-
-    def _sample_crater_volume(self, state: EDMState) -> float:
-        """Sample crater volume from empirical distribution based on current mode."""
-        current_mode = state.current_mode
-
-        # Only recalculate if current_mode has changed
-        if current_mode != self._cached_current_mode:
-            if current_mode is None:
-                current_mode = "I1"  # Default to I1 if not specified
-
-            # Check if current mode has crater data available
-            if current_mode not in self.crater_data:
+        if state.spark_state == 1 and state.spark_duration == 0:
+            current_mode = state.current_mode
+            crater_params = self._crater_params_for_mode(current_mode)
+            if crater_params is None:
                 available_modes = list(self.crater_data.keys())
                 raise ValueError(
-                    f"Current mode {current_mode} is not available in crater data. "
+                    f"Current mode I{current_mode} is not available in crater data. "
                     f"Available modes: {available_modes}"
                 )
 
-            # Get distribution parameters directly from current mode
-            self._cached_crater_info = self.crater_data[current_mode]
-            self._cached_current_mode = current_mode
-
-        # Use cached crater info
-        mean_volume = self._cached_crater_info[
-            "ellipsoid_volume_half"
-        ]  # Using half volume as it's more realistic
-        std_volume = self._cached_crater_info["ellipsoid_volume_std"]
-
-        # Sample from Gaussian distribution
-        # Convert from micrometers³ to mm³ (divide by 1e9)
-        sampled_volume_um3 = self.env.np_random.normal(mean_volume, std_volume)
-
-        # Ensure non-negative volume
-        sampled_volume_um3 = max(0, sampled_volume_um3)
-
-        # Store the crater volume for analysis
-        self.crater_volumes_um3.append(sampled_volume_um3)
-
-        # Convert to mm³
-        sampled_volume_mm3 = sampled_volume_um3 / 1e9
-
-        return sampled_volume_mm3
-
-    def _calculate_position_increment(
-        self, crater_volume: float, state: EDMState
-    ) -> float:
-        """Calculate workpiece position increment from crater volume.
-
-        Args:
-            crater_volume: Crater volume in mm³
-            state: Current EDM state
+            # Crater volume [mm³] is also read by the dielectric module for
+            # debris tracking
+            (
+                volume_um3,
+                state.last_crater_volume,
+                state.workpiece_position,
+            ) = _crater_removal(
+                self.env.np_random, state.workpiece_position, crater_params
+            )
+
+            # Store the crater volume for analysis
+            self.crater_volumes_um3.append(volume_um3)
+        else:
+            # No fresh real spark, reset crater volume
+            state.last_crater_volume = 0.0
 
-        Returns:
-            Position increment in μm (same units as state positions)
+    def _crater_params_for_mode(self, current_mode: int) -> tuple | None:
         """
-        # Calculate kerf width: k = base_overcut + wire_diameter + crater_depth
-        wire_diameter_mm = self.env.config.wire_diameter  # mm
-
-        # Get crater depth from cached crater info (convert from μm to mm)
-        crater_depth_um = self._cached_crater_info["depth"]  # μm
-        crater_depth_mm = crater_depth_um / 1000.0  # Convert μm to mm
-
-        kerf_width_mm = (
-            self.params.base_overcut + wire_diameter_mm + crater_depth_mm
-        )  # mm
+        Crater parameters for _crater_removal under a current mode.
 
-        # Workpiece height
-        workpiece_height_mm = self.env.config.workpiece_height  # mm
-
-        # Calculate position increment: ΔXw = Vc / (k * hw)
-        # Result will be in mm, then convert to μm
-        if kerf_width_mm > 0 and workpiece_height_mm > 0:
-            delta_x_mm = crater_volume / (kerf_width_mm * workpiece_height_mm)  # mm
-            delta_x_um = delta_x_mm * 1000.0  # Convert mm to μm to match state units
-        else:
-            delta_x_um = 0.0
+        Returns (mean volume [μm³], volume std [μm³], kerf area [mm²]), or None
+        if the mode has no crater data.
+        """
+        # Only recalculate if current_mode has changed
+        if current_mode != self._cached_current_mode:
+            crater_info = None
+            if 0 <= current_mode < len(self.crater_info_by_mode):
+                crater_info = self.crater_info_by_mode[current_mode]
+            if crater_info is None:
+                return None
+
+            # Kerf width: k = base_overcut + wire_diameter + crater_depth [mm]
+            kerf_width_mm = (
+                self.params.base_overcut
+                + self.env.config.wire_diameter
+                + crater_info["depth"] / 1000.0
+            )
+            workpiece_height_mm = self.env.config.workpiece_height
+            kerf_area = 0.0
+            if kerf_width_mm > 0 and workpiece_height_mm > 0:
+                kerf_area = kerf_width_mm * workpiece_height_mm
+
+            # Half volume is used as it's more realistic
+            self._cached_crater_params = (
+                float(crater_info["ellipsoid_volume_half"]),
+                float(crater_info["ellipsoid_volume_std"]),
+                float(kerf_area),
+            )
+            self._cached_crater_info = crater_info
+            self._cached_current_mode = current_mode
 
-        return delta_x_um
+        return self._cached_crater_params
 
     def get_crater_data_for_current_mode(self, current_mode: str) -> dict:
         """Get crater data for a specific current mode (for debugging/analysis)."""
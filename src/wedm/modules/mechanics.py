@@ -2,14 +2,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+
+from numba import njit
+
+from ..core.jit import NUMBA_CACHE
 from ..core.module import EDMModule
-from ..core.state import EDMState
+from ..core.state import EDMState, _DATACLASS_SLOTS
+
+# Servo control laws MechanicsModule (and WireEDMEnv) accept
+CONTROL_MODES = frozenset(("position", "velocity"))
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Mechanics Module Parameters - Defined within module
 # ──────────────────────────────────────────────────────────────────────────────
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MechanicsModuleParameters:
     """Mechanics module specific parameters."""
 
@@ -23,6 +30,60 @@ class MechanicsModuleParameters:
     max_speed: float = 3.0e4  # [µm/s] Maximum speed
 
 
+# Shared with the fused tick loop (envs/fused_ticks). No fastmath, so it rounds
+# like the plain-Python update it was extracted from
+@njit(cache=NUMBA_CACHE, boundscheck=False, error_model="numpy")
+def _mechanics_step(
+    wire_position, wire_velocity, target_delta, prev_accel, step_params
+):
+    """
+    One µs of the servo control law with acceleration, jerk and speed limits.
+
+    ``step_params`` is MechanicsModule._step_params.
+
+    Returns (wire_position, wire_velocity, acceleration).
+    """
+    (
+        dt,
+        position_mode,
+        damping_coeff,
+        stiffness_coeff,
+        omega_n,
+        max_acceleration,
+        max_jerk_dt,
+        max_speed,
+    ) = step_params
+
+    # Nominal acceleration from the control law
+    if position_mode:
+        # x_target = x + target_delta, so x - x_target = -target_delta
+        a_nom = damping_coeff * wire_velocity - stiffness_coeff * target_delta
+    else:
+        a_nom = -omega_n * (wire_velocity - target_delta)
+
+    if a_nom > max_acceleration:
+        a_nom = max_acceleration
+    elif a_nom < -max_acceleration:
+        a_nom = -max_acceleration
+
+    # Jerk limiting
+    da = a_nom - prev_accel
+    if da > max_jerk_dt:
+        da = max_jerk_dt
+    elif da < -max_jerk_dt:
+        da = -max_jerk_dt
+    a = prev_accel + da
+
+    # Velocity with speed limit, then position
+    v = wire_velocity + a * dt
+    if v > max_speed:
+        v = max_speed
+    elif v < -max_speed:
+        v = -max_speed
+
+    return wire_position + v * dt, v, a
+
+
 class MechanicsModule(EDMModule):
     """Optimized servo axis with configurable position or velocity control modes."""
 
@@ -35,7 +96,7 @@ class MechanicsModule(EDMModule):
         super().__init__(env)
 
         # Validate control mode
-        if control_mode not in ["position", "velocity"]:
+        if control_mode not in CONTROL_MODES:
             raise ValueError(
                 f"control_mode must be 'position' or 'velocity', got {control_mode}"
             )
@@ -48,7 +109,9 @@ class MechanicsModule(EDMModule):
         # ── Pre-compute Constants for Performance ──
         self.dt = env.config.dt * 1e-6  # Pre-compute dt conversion from µs to s
 
-        # Pre-compute control law constants
+        # Pre-compute control law constants (damping/stiffness: position only)
+        self.damping_coeff = 0.0
+        self.stiffness_coeff = 0.0
         if self.control_mode == "position":
             self.damping_coeff = -2.0 * self.params.zeta * self.params.omega_n
             self.stiffness_coeff = -(self.params.omega_n**2)
@@ -56,59 +119,31 @@ class MechanicsModule(EDMModule):
         # Pre-compute jerk limiting
         self.max_jerk_dt = self.params.max_jerk * self.dt  # Pre-compute for performance
 
+        # Constant scalars unpacked at the top of update(), one tuple read per µs
+        self._step_params = (
+            self.dt,
+            self.control_mode == "position",
+            self.damping_coeff,
+            self.stiffness_coeff,
+            self.params.omega_n,
+            self.params.max_acceleration,
+            self.max_jerk_dt,
+            self.params.max_speed,
+        )
+
         # ── Internal State ──
         self.prev_accel = 0.0
 
-        # ── Method Dispatch Setup ──
-        # Set up control law computation during init for efficiency
-        if self.control_mode == "position":
-            self._compute_nominal_accel = self._compute_position_accel
-        else:  # velocity
-            self._compute_nominal_accel = self._compute_velocity_accel
-
-    def _compute_position_accel(self, state: EDMState, x: float, v: float) -> float:
-        """Optimized position control using pre-computed coefficients."""
-        x_error = x - (x + state.target_delta)  # x - x_target
-        return self.damping_coeff * v + self.stiffness_coeff * x_error
-
-    def _compute_velocity_accel(self, state: EDMState, x: float, v: float) -> float:
-        """Optimized velocity control."""
-        v_error = v - state.target_delta
-        return -self.params.omega_n * v_error
-
     def update(self, state: EDMState) -> None:
-        x = state.wire_position
-        v = state.wire_velocity
-
-        # Compute nominal acceleration using dispatched method
-        a_nom = self._compute_nominal_accel(state, x, v)
-
-        # Scalar clipping (faster than numpy for single values)
-        if a_nom > self.params.max_acceleration:
-            a_nom = self.params.max_acceleration
-        elif a_nom < -self.params.max_acceleration:
-            a_nom = -self.params.max_acceleration
-
-        # Jerk limiting with scalar operations
-        da = a_nom - self.prev_accel
-        if da > self.max_jerk_dt:
-            da = self.max_jerk_dt
-        elif da < -self.max_jerk_dt:
-            da = -self.max_jerk_dt
-
-        a = self.prev_accel + da
-        self.prev_accel = a
-
-        # Update velocity with scalar clipping
-        v += a * self.dt
-        if v > self.params.max_speed:
-            v = self.params.max_speed
-        elif v < -self.params.max_speed:
-            v = -self.params.max_speed
-
-        # Update position
-        x += v * self.dt
-
-        # Update state
-        state.wire_velocity = v
-        state.wire_position = x
+        """Advance the servo axis by one µs (arithmetic in _mechanics_step)."""
+        (
+            state.wire_position,
+            state.wire_velocity,
+            self.prev_accel,
+        ) = _mechanics_step(
+            state.wire_position,
+            state.wire_velocity,
+            state.target_delta,
+            self.prev_accel,
+            self._step_params,
+        )
@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import numpy as np
-from numba import njit, prange
+from numba import njit
 from dataclasses import dataclass
 
+from ..core.jit import NUMBA_CACHE
 from ..core.module import EDMModule
 from ..core.state import EDMState
 from ..core.material_db import get_material_db
@@ -54,11 +55,12 @@ class WireModuleParameters:
     )
 
 
-# Numba-compiled functions for performance-critical calculations
-@njit(cache=False, fastmath=True)
+# Numba-compiled functions for performance-critical calculations. The thermal
+# update is deliberately serial: at the default ~400 segments a parallel loop
+# costs more in thread dispatch than the whole pass takes.
+@njit(cache=NUMBA_CACHE, fastmath=True, boundscheck=False, error_model="numpy")
 def compute_thermal_update(
     T,
-    dT_dt,
     n_segments,
     spool_T,
     k_cond_coeff,
@@ -70,57 +72,206 @@ def compute_thermal_update(
     plasma_idx,
     plasma_heat,
     h_eff_base,
-    h_eff_zone,
+    h_eff_enhanced,
+    zone_start,
+    zone_end,
     dielectric_temp,
     A,
     adv_coeff,
     temp_update_factor,
     contact_bottom_idx,
     contact_top_idx,
+    critical_temperature,
+    breaking_temperature,
 ):
-    """Optimized thermal update computation using Numba."""
-    # Apply boundary condition
+    """
+    Optimized thermal update computation using Numba.
+
+    Conduction, Joule, plasma, convection and advection are summed per
+    segment in a single in-place pass; the rate lives in a local, and the
+    pre-update T[i - 1] that conduction and advection read is carried in a
+    scalar, so no segment sees an already-updated neighbour. Convection uses
+    h_eff_enhanced inside the flushed zone [zone_start, zone_end) and
+    h_eff_base elsewhere.
+
+    Returns (above_critical, above_breaking): whether any segment of the
+    updated field exceeds each temperature, reduced in the same pass.
+    """
+    # Apply boundary condition (segment 0 is held at spool_T)
     T[0] = spool_T
 
-    # Reset dT/dt
-    dT_dt[:] = 0.0
+    # Joule heating only between the electrical contacts, and only with current
+    joule_on = I_squared > 1e-6
+    joule_factor = joule_geom_factor * I_squared * rho_elec
+    advection_on = abs(adv_coeff) > 1e-9
+    last = n_segments - 1
 
-    # 1) Conduction - optimized with single pass
-    if n_segments > 1:
-        # Interior points
-        for i in prange(1, n_segments - 1):
-            dT_dt[i] = k_cond_coeff * (T[i - 1] - 2 * T[i] + T[i + 1])
+    t_prev = T[0]  # T[i - 1] before this update
+    above_critical = T[0] > critical_temperature
+    above_breaking = T[0] > breaking_temperature
+    for i in range(1, n_segments):
+        t_i = T[i]
 
-        # Neumann BC at last segment
-        dT_dt[n_segments - 1] = k_cond_coeff * (T[n_segments - 2] - T[n_segments - 1])
+        # 1) Conduction (Neumann BC at last segment: the ghost neighbour
+        #    beyond the end mirrors t_i, so one stencil covers every segment)
+        t_next = T[i + 1] if i < last else t_i
+        rate = k_cond_coeff * (t_prev - 2 * t_i + t_next)
 
-    # 2) Joule heating - only between electrical contacts
-    if I_squared > 1e-6:
-        joule_factor = joule_geom_factor * I_squared * rho_elec
-        for i in prange(contact_bottom_idx, contact_top_idx + 1):
-            rho_T = 1.0 + alpha_rho * (T[i] - temp_ref)
-            dT_dt[i] += joule_factor * rho_T
+        # 2) Joule heating
+        if joule_on and contact_bottom_idx <= i <= contact_top_idx:
+            rate += joule_factor * (1.0 + alpha_rho * (t_i - temp_ref))
 
-    # 3) Plasma heating
-    if plasma_idx >= 0 and plasma_idx < n_segments:
-        dT_dt[plasma_idx] += plasma_heat
+        # 3) Plasma heating
+        if i == plasma_idx:
+            rate += plasma_heat
 
-    # 4) Convection - optimized with precomputed coefficients
-    for i in prange(n_segments):
-        conv_coeff = h_eff_zone[i] * A
-        dT_dt[i] -= conv_coeff * (T[i] - dielectric_temp)
+        # 4) Convection
+        conv_coeff = h_eff_enhanced if zone_start <= i < zone_end else h_eff_base
+        rate -= conv_coeff * A * (t_i - dielectric_temp)
 
-    # 5) Advection
-    if abs(adv_coeff) > 1e-9:
-        for i in prange(1, n_segments):
-            dT_dt[i] += adv_coeff * (T[i - 1] - T[i])
+        # 5) Advection
+        if advection_on:
+            rate += adv_coeff * (t_prev - t_i)
 
-    # 6) Temperature update
-    for i in prange(n_segments):
-        T[i] += dT_dt[i] * temp_update_factor
+        # 6) Temperature update
+        t_new = np.float32(t_i + rate * temp_update_factor)
+        T[i] = t_new
+        t_prev = t_i
 
-    # Re-apply boundary condition
-    T[0] = spool_T
+        # Threshold flags OR-reduce without serializing the loop, unlike max()
+        above_critical |= t_new > critical_temperature
+        above_breaking |= t_new > breaking_temperature
+
+    return above_critical, above_breaking
+
+
+# Shared with the fused tick loop (envs/fused_ticks). No fastmath, so it rounds
+# like the plain-Python update it was extracted from
+@njit(cache=NUMBA_CACHE, boundscheck=False, error_model="numpy")
+def _wire_step(
+    T,
+    current,
+    voltage,
+    spark_state,
+    spark_y,
+    flow_condition,
+    wire_unwinding_velocity,
+    dielectric_temperature,
+    time_in_critical_temp,
+    h_eff_base,
+    h_eff_enhanced,
+    last_flow_condition,
+    step_params,
+):
+    """
+    One µs of the wire module: convection refresh, plasma heat source,
+    thermal update of ``T`` in place and the critical-temperature counter.
+
+    ``current``/``voltage`` are NaN when unset. ``step_params`` is
+    WireModule._step_params.
+
+    Returns (time_in_critical_temp, above_breaking, h_eff_base,
+    h_eff_enhanced, last_flow_condition).
+    """
+    (
+        n_segments,
+        spool_T,
+        k_cond_coeff,
+        joule_geom_factor,
+        rho_elec,
+        alpha_rho,
+        temp_ref,
+        base_convection_coefficient,
+        convection_velocity_factor,
+        convection_flow_enhancement,
+        zone_start,
+        segment_len,
+        plasma_efficiency,
+        rho_cp,
+        S,
+        A,
+        temp_update_factor,
+        contact_bottom_idx,
+        contact_top_idx,
+        actual_zone_start,
+        actual_zone_end,
+        critical_temperature,
+        breaking_temperature,
+    ) = step_params
+
+    I = 0.0 if current != current else current
+
+    # Refresh the convection coefficients only when the flow condition
+    # changes significantly
+    if abs(flow_condition - last_flow_condition) > 0.01:
+        # Keep the velocity enhancement from making the coefficient negative
+        velocity_enhancement = max(
+            -0.9, convection_velocity_factor * wire_unwinding_velocity
+        )
+        h_eff_base = base_convection_coefficient * (1.0 + velocity_enhancement)
+        h_eff_base = max(h_eff_base, 0.1 * base_convection_coefficient)
+        h_eff_enhanced = h_eff_base * (
+            1.0 + convection_flow_enhancement * flow_condition
+        )
+        last_flow_condition = flow_condition
+
+    # Plasma heating at the spark segment while a spark is burning
+    plasma_idx = -1
+    plasma_heat = 0.0
+    if spark_state == 1 and not np.isnan(spark_y):
+        if segment_len != 0:
+            plasma_idx = zone_start + int(spark_y // segment_len)
+        else:
+            plasma_idx = zone_start
+        if 0 <= plasma_idx < n_segments:
+            plasma_voltage = 0.0 if voltage != voltage else voltage
+            plasma_heat = plasma_efficiency * plasma_voltage * I
+            if not np.isfinite(plasma_heat):
+                plasma_heat = 0.0
+
+    # Advection coefficient
+    v_wire = abs(wire_unwinding_velocity)
+    adv_coeff = rho_cp * v_wire * S if v_wire > 1e-6 else 0.0
+
+    above_critical, above_breaking = compute_thermal_update(
+        T,
+        n_segments,
+        spool_T,
+        k_cond_coeff,
+        I * I,
+        joule_geom_factor,
+        rho_elec,
+        alpha_rho,
+        temp_ref,
+        plasma_idx,
+        plasma_heat,
+        h_eff_base,
+        h_eff_enhanced,
+        actual_zone_start,
+        actual_zone_end,
+        dielectric_temperature,
+        A,
+        adv_coeff,
+        temp_update_factor,
+        contact_bottom_idx,
+        contact_top_idx,
+        critical_temperature,
+        breaking_temperature,
+    )
+
+    # Track time in the critical temperature range
+    if above_critical:
+        time_in_critical_temp += 1
+    else:
+        time_in_critical_temp = 0
+
+    return (
+        time_in_critical_temp,
+        above_breaking,
+        h_eff_base,
+        h_eff_enhanced,
+        last_flow_condition,
+    )
 
 
 class WireModule(EDMModule):
@@ -157,7 +308,9 @@ class WireModule(EDMModule):
 
         self.r_wire = env.config.wire_diameter / 2.0  # [mm]
 
-        # Initialize wire temperature field
+        # Initialize wire temperature field. float32 is the narrowest usable
+        # storage: typical per-µs changes (~1e-4 K) are far below float16's
+        # resolution at wire temperatures (0.25 K at 300 K) and would be lost
         if (
             not hasattr(env.state, "wire_temperature")
             or not isinstance(env.state.wire_temperature, np.ndarray)
@@ -184,6 +337,9 @@ class WireModule(EDMModule):
         )
         self.joule_geom_factor = self.delta_y / self.S if self.S != 0 else 0.0
 
+        # Volumetric heat capacity, cached as a plain float for the advection term
+        self.rho_cp = self.wire_material.density * self.wire_material.specific_heat
+
         # Electrical properties from material database
         self.rho_elec = self.wire_material.electrical_resistivity
         self.alpha_rho = self.wire_material.temperature_coefficient
@@ -200,9 +356,11 @@ class WireModule(EDMModule):
                 "Denominator for dT/dt is zero. Check wire/segment properties."
             )
 
-        # ── Pre-allocate Arrays ──
-        self.dT_dt = np.zeros(self.n_segments, dtype=np.float32)
-        self.h_eff_zone = np.zeros(self.n_segments, dtype=np.float32)
+        # ── Convection Coefficients ──
+        # Two values cover the whole wire: base outside the flushed zone and
+        # enhanced inside it (set on the first flow update)
+        self.h_eff_base = 0.0
+        self.h_eff_enhanced = 0.0
 
         # Zone boundaries
         self.actual_zone_start = min(self.zone_start, self.n_segments - 1)
@@ -251,12 +409,41 @@ class WireModule(EDMModule):
             self.n_segments - 1, max(self.contact_top_idx, self.zone_end)
         )
 
+        # Constant scalars handed to _wire_step, one tuple per µs
+        params = self.params
+        self._step_params = (
+            self.n_segments,
+            float(params.spool_T),
+            float(self.k_cond_coeff),
+            float(self.joule_geom_factor),
+            float(self.rho_elec),
+            float(self.alpha_rho),
+            float(self.temp_ref),
+            float(params.base_convection_coefficient),
+            float(params.convection_velocity_factor),
+            float(params.convection_flow_enhancement),
+            self.zone_start,
+            float(params.segment_len),
+            float(params.plasma_efficiency),
+            float(self.rho_cp),
+            float(self.S),
+            float(self.A),
+            float(self.temp_update_factor),
+            self.contact_bottom_idx,
+            self.contact_top_idx,
+            self.actual_zone_start,
+            self.actual_zone_end,
+            float(self.critical_temperature),
+            float(self.breaking_temperature),
+        )
+
         print(
             f"🔌 Electrical contacts: segments {self.contact_bottom_idx} to {self.contact_top_idx}"
         )
         print(f"   Workpiece zone: segments {self.zone_start} to {self.zone_end}")
 
     def update(self, state: EDMState) -> None:
+        """Advance the wire temperature field by one µs (see _wire_step)."""
         if state.is_wire_broken:
             return
 
@@ -268,72 +455,33 @@ class WireModule(EDMModule):
             )
             T = state.wire_temperature
 
-        # Cache lookups for efficiency
-        I = state.current or 0.0
-        I_squared = I * I
-        dielectric_temp = state.dielectric_temperature
-        wire_unwind_vel = state.wire_unwinding_velocity
-
-        # Update convection coefficients only when flow condition changes significantly
-        flow_condition = state.flow_rate
-        if abs(flow_condition - self._last_flow_condition) > 0.01:
-            self._update_convection_coefficients(wire_unwind_vel, flow_condition)
-            self._last_flow_condition = flow_condition
-
-        # Prepare plasma heating
-        plasma_idx = -1
-        plasma_heat = 0.0
-        if state.spark_status[0] == 1 and state.spark_status[1] is not None:
-            y_spark = state.spark_status[1]
-            plasma_idx = (
-                self.zone_start + int(y_spark // self.params.segment_len)
-                if self.params.segment_len != 0
-                else self.zone_start
-            )
-            if 0 <= plasma_idx < self.n_segments:
-                voltage = state.voltage if state.voltage is not None else 0.0
-                plasma_heat = self.params.plasma_efficiency * voltage * I
-                if not np.isfinite(plasma_heat):
-                    plasma_heat = 0.0
-
-        # Advection coefficient
-        if abs(wire_unwind_vel) > 1e-6:
-            v_wire = abs(wire_unwind_vel)  # Use absolute value - m s⁻¹
-            adv_coeff = (
-                self.wire_material.density
-                * self.wire_material.specific_heat
-                * v_wire
-                * self.S
-            )
-        else:
-            adv_coeff = 0.0
-
-        # Call optimized Numba function
-        compute_thermal_update(
+        current = state.current
+        voltage = state.voltage
+        (
+            state.time_in_critical_temp,
+            above_breaking,
+            self.h_eff_base,
+            self.h_eff_enhanced,
+            self._last_flow_condition,
+        ) = _wire_step(
             T,
-            self.dT_dt,
-            self.n_segments,
-            self.params.spool_T,
-            self.k_cond_coeff,
-            I_squared,
-            self.joule_geom_factor,
-            self.rho_elec,
-            self.alpha_rho,
-            self.temp_ref,
-            plasma_idx,
-            plasma_heat,
-            self.params.base_convection_coefficient,
-            self.h_eff_zone,
-            dielectric_temp,
-            self.A,
-            adv_coeff,
-            self.temp_update_factor,
-            self.contact_bottom_idx,
-            self.contact_top_idx,
+            np.nan if current is None else current,
+            np.nan if voltage is None else voltage,
+            state.spark_state,
+            state.spark_y,
+            state.flow_rate,
+            state.wire_unwinding_velocity,
+            state.dielectric_temperature,
+            state.time_in_critical_temp,
+            self.h_eff_base,
+            self.h_eff_enhanced,
+            self._last_flow_condition,
+            self._step_params,
         )
 
-        # ── Temperature Monitoring and Wire Breaking ──
-        self._check_wire_breaking(state, T)
+        # Wire breaks if temperature exceeds breaking point
+        if above_breaking:
+            state.is_wire_broken = True
 
         # Compute zone mean only when needed
         if self.params.compute_zone_mean:
@@ -346,47 +494,6 @@ class WireModule(EDMModule):
                 # Use cached value
                 state.wire_average_temperature = self._last_zone_mean
 
-    def _update_convection_coefficients(
-        self, wire_unwind_vel: float, flow_condition: float
-    ):
-        """Update zone-specific convection coefficients."""
-        # Ensure convection enhancement factor doesn't make coefficient negative
-        velocity_enhancement = max(
-            -0.9, self.params.convection_velocity_factor * wire_unwind_vel
-        )
-
-        h_eff_base = self.params.base_convection_coefficient * (
-            1.0 + velocity_enhancement
-        )
-
-        # Ensure minimum positive convection coefficient
-        h_eff_base = max(h_eff_base, 0.1 * self.params.base_convection_coefficient)
-
-        h_eff_enhanced = h_eff_base * (
-            1.0 + self.params.convection_flow_enhancement * flow_condition
-        )
-
-        # Fill array with appropriate values
-        self.h_eff_zone.fill(h_eff_base)
-        if self.actual_zone_start < self.actual_zone_end:
-            self.h_eff_zone[self.actual_zone_start : self.actual_zone_end] = (
-                h_eff_enhanced
-            )
-
-    def _check_wire_breaking(self, state: EDMState, T: np.ndarray) -> None:
-        """Check if wire should break due to temperature."""
-        max_temp = np.max(T)
-
-        # Track time in critical temperature range
-        if max_temp > self.critical_temperature:
-            state.time_in_critical_temp += 1
-        else:
-            state.time_in_critical_temp = 0
-
-        # Wire breaks if temperature exceeds breaking point
-        if max_temp > self.breaking_temperature:
-            state.is_wire_broken = True
-
     def _compute_zone_mean_fast(self, T: np.ndarray) -> float:
         """Fast zone mean computation."""
         if self.zone_size > 0 and self.actual_zone_end <= len(T):
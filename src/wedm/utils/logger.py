@@ -1,10 +1,27 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from typing import TYPE_CHECKING, Any, Dict, List, Literal, TypedDict, Union
+import base64
+import json
 import pathlib  # Added for path manipulation
+from operator import attrgetter
 import numpy as np  # Added for numpy backend
 
+try:  # Optional: orjson serializes numpy arrays natively and much faster
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:  # Optional: binary MessagePack backend
+    import msgpack
+except ImportError:  # pragma: no cover - depends on the environment
+    msgpack = None
+
+try:  # Optional: blosc2-compressed columns (SIMD codecs, far faster than zlib)
+    import blosc2
+except ImportError:  # pragma: no cover - depends on the environment
+    blosc2 = None
+
 if TYPE_CHECKING:
     from ..core.state import EDMState
     from ..envs import WireEDMEnv  # Assuming WireEDMEnv is the main env type
@@ -40,20 +57,263 @@ class BackendNumpy(TypedDict):
     compress: bool  # Whether to use compressed format np.savez_compressed
 
 
-# We'll add more backends like numpy, csv, hdf5 later
-BackendConfig = Union[BackendMemory, BackendNumpy]  # Added BackendNumpy
+class BackendNpy(TypedDict):
+    type: Literal["npy"]
+    filepath: str  # Directory to save one uncompressed <signal>.npy file per signal
+
+
+class BackendBlosc2(TypedDict):
+    type: Literal["blosc2"]
+    filepath: str  # Directory to save one blosc2-compressed <signal>.b2frame per signal
+
+
+class BackendJson(TypedDict):
+    type: Literal["json"]
+    filepath: str  # Path to save .json file
+
+
+class BackendMsgpack(TypedDict):
+    type: Literal["msgpack"]
+    filepath: str  # Path to save .msgpack file
+
+
+class BackendJsonl(TypedDict):
+    type: Literal["jsonl"]
+    filepath: str  # Path to stream .jsonl records to (one row per logged sample)
+
+
+# We'll add more backends like csv, hdf5 later
+BackendConfig = Union[
+    BackendMemory,
+    BackendNumpy,
+    BackendNpy,
+    BackendBlosc2,
+    BackendJson,
+    BackendMsgpack,
+    BackendJsonl,
+]
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for values the JSON serializer can't handle natively."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(data, default=_json_default).encode("utf-8")
+
+
+# Array-valued signals with more elements per sample than this (e.g. the
+# per-segment wire_temperature) are written to JSON as one base64 float32 blob
+_JSON_BASE64_MIN_ELEMENTS = 16
+
+
+def _json_column(column: np.ndarray) -> Any:
+    """Encode large float array columns as base64 typed arrays for JSON."""
+    if (
+        column.ndim > 1
+        and column.dtype.kind == "f"
+        and column[0].size > _JSON_BASE64_MIN_ELEMENTS
+    ):
+        # float32 is plenty for display; halves float64 payloads
+        data = np.ascontiguousarray(column, dtype=np.float32)
+        return {
+            "__ndarray__": base64.b64encode(data.tobytes()).decode("ascii"),
+            "dtype": "float32",
+            "shape": list(data.shape),
+        }
+    return column
+
+
+def _encode_rle(column: np.ndarray) -> Any:
+    """Run-length encode a 1-D low-cardinality column (bool flags, enum states)."""
+    if column.ndim != 1 or len(column) == 0:
+        return column
+    starts = np.concatenate(([0], np.flatnonzero(column[1:] != column[:-1]) + 1))
+    runs = np.diff(np.append(starts, len(column)))
+    return {
+        "__rle__": True,
+        "values": column[starts].tolist(),
+        "runs": runs.tolist(),
+    }
+
+
+def _encode_time(t: np.ndarray) -> Any:
+    """
+    Delta encode the monotonic time column as ``t0 + i*dt + residuals[i]``.
+
+    For regular logging (every step or a fixed interval) the residuals are all
+    zero and omitted, so the column costs a few bytes regardless of length.
+    """
+    if t.ndim != 1 or t.dtype.kind not in "iuf" or len(t) < 2:
+        return t
+    t0 = float(t[0])
+    dt = float(np.median(np.diff(t)))
+    encoded = {"__delta_time__": True, "t0": t0, "dt": dt, "n": len(t)}
+    residuals = t - (t0 + np.arange(len(t)) * dt)
+    if np.any(residuals):
+        encoded["residuals"] = residuals.astype(np.float32)
+    return encoded
+
+
+def _json_decode(obj: Dict[str, Any]) -> Any:
+    """``object_hook`` restoring base64 typed arrays and the encoded time column."""
+    if "__ndarray__" in obj:
+        return np.frombuffer(
+            base64.b64decode(obj["__ndarray__"]), dtype=obj["dtype"]
+        ).reshape(obj["shape"])
+    # Encoded columns carry a reserved tag key, so user metadata that happens
+    # to use the same field names is left alone
+    if "__rle__" in obj:
+        return np.repeat(np.asarray(obj["values"]), obj["runs"])
+    if "__delta_time__" in obj:
+        t = obj["t0"] + np.arange(obj["n"]) * obj["dt"]
+        if "residuals" in obj:
+            t += np.asarray(obj["residuals"], dtype=np.float64)
+        return t
+    return obj
+
+
+def write_json_metadata(filepath: str, metadata: Dict[str, Any]) -> None:
+    """
+    Fill the trailing ``"metadata": null`` placeholder of a 'json' log in place.
+
+    Only the metadata is serialized; the column payload is neither parsed
+    nor re-encoded.
+    """
+    placeholder = b"null}"
+    with open(filepath, "r+b") as f:
+        size = f.seek(0, 2)
+        f.seek(max(0, size - 32))
+        tail = f.read()
+        if not (tail.endswith(placeholder) and b'"metadata"' in tail):
+            raise ValueError(f"{filepath} has no metadata placeholder to fill.")
+        f.seek(size - len(placeholder))
+        f.write(_dumps_json(metadata) + b"}")
+        f.truncate()
+
+
+def load_json_log(filepath: str) -> Dict[str, Any]:
+    """Load a log written by the 'json' backend, decoding base64 arrays."""
+    with open(filepath, "rb") as f:
+        return json.loads(f.read(), object_hook=_json_decode)
+
+
+def _msgpack_column(column: np.ndarray) -> Any:
+    """Pack a numeric column as one raw ``bin`` frame plus dtype/shape."""
+    if column.dtype == object:
+        return column.tolist()
+    return {
+        "__ndarray__": np.ascontiguousarray(column).tobytes(),
+        "dtype": column.dtype.str,
+        "shape": list(column.shape),
+    }
+
+
+def _msgpack_decode(obj: Dict[str, Any]) -> Any:
+    """``object_hook`` turning packed columns back into numpy arrays."""
+    if "__ndarray__" in obj:
+        return np.frombuffer(obj["__ndarray__"], dtype=obj["dtype"]).reshape(
+            obj["shape"]
+        )
+    return obj
+
+
+def load_npy_log(dirpath: str, mmap_mode: str | None = None) -> Dict[str, np.ndarray]:
+    """
+    Load a log written by the 'npy' backend.
+
+    Args:
+        dirpath: Directory containing one ``<signal>.npy`` file per signal.
+        mmap_mode: Passed to ``np.load`` (e.g. "r") to page numeric columns in
+            lazily instead of reading them into RAM. Object columns are always
+            loaded eagerly since they cannot be memory-mapped.
+    """
+    data = {}
+    for path in sorted(pathlib.Path(dirpath).glob("*.npy")):
+        try:
+            data[path.stem] = np.load(path, mmap_mode=mmap_mode)
+        except ValueError:  # Pickled object column
+            data[path.stem] = np.load(path, allow_pickle=True)
+    return data
+
+
+def load_blosc2_log(dirpath: str) -> Dict[str, np.ndarray]:
+    """
+    Load a log written by the 'blosc2' backend.
+
+    Numeric columns are decompressed from ``<signal>.b2frame``; object
+    columns (e.g. signals that logged None) are stored as pickled ``.npy``.
+    """
+    if blosc2 is None:
+        raise ImportError("blosc2 is required to read .b2frame logs.")
+    data = {}
+    for path in sorted(pathlib.Path(dirpath).iterdir()):
+        if path.suffix == ".b2frame":
+            data[path.stem] = blosc2.load_tensor(str(path))
+        elif path.suffix == ".npy":
+            data[path.stem] = np.load(path, allow_pickle=True)
+    return data
+
+
+def load_msgpack_log(filepath: str) -> Dict[str, Any]:
+    """Load a log written by the 'msgpack' backend, restoring numpy columns."""
+    if msgpack is None:
+        raise ImportError("msgpack is required to read .msgpack logs.")
+    with open(filepath, "rb") as f:
+        return msgpack.unpackb(f.read(), object_hook=_msgpack_decode, raw=False)
 
 
 class LoggerConfig(TypedDict):
     signals_to_log: List[str]  # List of attribute names from EDMState or special keys
     log_frequency: LogFrequencyConfig
     backend: BackendConfig
-    # Optional: buffer_size for file backends, etc.
+    # Optional: buffer_size (int) - initial column capacity in samples, grown x2 on demand
+    # Optional: metadata (dict) - first record for 'jsonl', trailing key for 'json'
+    #   (left null by 'json' if absent, to be filled later by write_json_metadata)
+    # Optional: preallocate (int) - expected number of samples; sizes the columns up
+    #   front and, for the 'npy' backend, backs numeric columns with .npy memmaps
+    # Optional: signal_dtypes (dict) - signal -> numpy dtype name (e.g. "bool", "int8");
+    #   bool/integer signals declared here are run-length encoded by the 'json' backend
+
+
+_DEFAULT_BUFFER_SIZE = 1024
+_JSONL_WRITE_BUFFER = 1 << 20  # Flush streamed rows to disk in 1 MB chunks
+
+
+def _new_column(value: Any, capacity: int, dtype: Any = None) -> np.ndarray:
+    """Allocate a column whose dtype/shape is inferred from the first sample."""
+    if dtype is not None:
+        return np.empty((capacity,) + np.shape(value), dtype=dtype)
+    if isinstance(value, np.ndarray):
+        return np.empty((capacity,) + value.shape, dtype=value.dtype)
+    if isinstance(value, (bool, int, float, np.number, np.bool_)):
+        # Python ints become int64 and bools stay bool, as np.array(list) would
+        return np.empty(capacity, dtype=np.asarray(value).dtype)
+    # Strings, None, tuples (e.g. ionized_channel) etc. are stored as Python objects
+    return np.empty(capacity, dtype=object)
+
+
+def _missing_signal(state) -> None:
+    """Accessor for signal names the state does not define."""
+    return None
 
 
 class SimulationLogger:
     """
     Handles logging of simulation data based on a flexible configuration.
+
+    Samples are stored column-wise: one preallocated numpy array per signal
+    plus a shared write cursor. Capacity grows geometrically (x2) when full.
     """
 
     def __init__(self, config: LoggerConfig, env_reference: WireEDMEnv | None = None):
@@ -62,13 +322,44 @@ class SimulationLogger:
 
         self._validate_config()
 
-        self.log_data: Dict[str, List[Any]] = defaultdict(list)
+        self._initial_capacity = int(
+            self.config.get(
+                "preallocate", self.config.get("buffer_size", _DEFAULT_BUFFER_SIZE)
+            )
+        )
+        # With a known run length, the 'npy' backend writes samples straight into
+        # memory-mapped .npy files, so finalize has nothing left to copy
+        self._memmap_dir = None
+        if self.config["backend"]["type"] == "npy" and "preallocate" in self.config:
+            self._memmap_dir = pathlib.Path(self.config["backend"]["filepath"])
+        self._columns: Dict[str, np.ndarray] = {}
+        self._capacity = self._initial_capacity
+        self._size = 0  # Write cursor (number of samples stored)
+        self._stream = None  # Open file handle for the 'jsonl' backend
+        self._signal_dtypes: Dict[str, np.dtype] = {
+            name: np.dtype(dtype)
+            for name, dtype in self.config.get("signal_dtypes", {}).items()
+        }
+        # Inferred integer/bool scalar columns -> type of their first sample
+        self._narrow_columns: Dict[str, type] = {}
         self.step_counter = 0  # For interval-based logging
 
         # Placeholder for more complex signal definitions (e.g., derived values)
         # For now, signals are assumed to be direct attributes of EDMState
         self.signal_accessors: Dict[str, callable] = {}
         self._prepare_signal_accessors()
+        # collect() walks this pre-resolved tuple instead of the dict
+        self._accessors = tuple(self.signal_accessors.items())
+        self._log_interval = self.config["log_frequency"].get("value", 1)
+
+        # The frequency and backend are fixed per logger, so collect() is bound
+        # once to the matching variant instead of branching on every call
+        self._record = (
+            self._write_row
+            if self.config["backend"]["type"] == "jsonl"
+            else self._store_row
+        )
+        self.collect = getattr(self, f"_collect_{self.config['log_frequency']['type']}")
 
     def _validate_config(self):
         if not self.config.get("signals_to_log"):
@@ -77,11 +368,40 @@ class SimulationLogger:
             )
         if not self.config.get("log_frequency"):
             raise ValueError("LoggerConfig: 'log_frequency' must be provided.")
+        if self.config["log_frequency"].get("type") not in (
+            "every_step",
+            "control_step",
+            "interval",
+        ):
+            raise ValueError(
+                "LoggerConfig: 'log_frequency' type must be 'every_step', "
+                "'control_step' or 'interval'."
+            )
+        if self.config["log_frequency"]["type"] == "interval":
+            value = self.config["log_frequency"].get("value")
+            is_bool = isinstance(value, bool)
+            is_int = isinstance(value, (int, np.integer)) and not is_bool
+            if not is_int or value < 1:
+                raise ValueError(
+                    "LoggerConfig: 'interval' log_frequency needs a positive "
+                    "integer 'value'."
+                )
         if not self.config.get("backend"):
             raise ValueError("LoggerConfig: 'backend' must be provided.")
+        for key in ("buffer_size", "preallocate"):
+            if int(self.config.get(key, _DEFAULT_BUFFER_SIZE)) < 1:
+                raise ValueError(f"LoggerConfig: '{key}' must be a positive integer.")
 
         backend_type = self.config["backend"]["type"]
-        if backend_type not in ["memory", "numpy"]:
+        if backend_type not in [
+            "memory",
+            "numpy",
+            "npy",
+            "blosc2",
+            "json",
+            "msgpack",
+            "jsonl",
+        ]:
             raise NotImplementedError(
                 f"Backend type '{backend_type}' is not yet implemented."
             )
@@ -101,19 +421,101 @@ class SimulationLogger:
             ):  # Default compress to False if not specified
                 self.config["backend"]["compress"] = False
 
+        if backend_type in ("npy", "json", "jsonl"):
+            if not isinstance(self.config["backend"].get("filepath"), str):
+                raise ValueError(
+                    f"LoggerConfig: 'filepath' must be provided as a string for '{backend_type}' backend."
+                )
+
+        if backend_type == "msgpack":
+            if msgpack is None:
+                raise ImportError(
+                    "LoggerConfig: the 'msgpack' backend requires the msgpack package."
+                )
+            if not isinstance(self.config["backend"].get("filepath"), str):
+                raise ValueError(
+                    "LoggerConfig: 'filepath' must be provided as a string for 'msgpack' backend."
+                )
+
+        if backend_type == "blosc2":
+            if blosc2 is None:
+                raise ImportError(
+                    "LoggerConfig: the 'blosc2' backend requires the blosc2 package."
+                )
+            if not isinstance(self.config["backend"].get("filepath"), str):
+                raise ValueError(
+                    "LoggerConfig: 'filepath' must be provided as a string for 'blosc2' backend."
+                )
+
     def _prepare_signal_accessors(self):
         """
         Prepares functions to access signal data.
-        For now, assumes direct attribute access on EDMState.
-        Can be extended for derived signals or specific array indexing.
+
+        Signals that EDMState defines (fields or properties) are read with a
+        plain attrgetter; any other name is resolved once here and logs None.
         """
+        from ..core.state import EDMState
+
         for signal_name in self.config["signals_to_log"]:
-            # Example: if signal_name is "wire_temp_segment_0", we might parse it
-            # and create a lambda like: lambda state: state.wire_temperature[0]
-            # For now, direct access:
-            self.signal_accessors[signal_name] = (
-                lambda state, name=signal_name: getattr(state, name, None)
+            if signal_name in EDMState.__dataclass_fields__ or hasattr(
+                EDMState, signal_name
+            ):
+                self.signal_accessors[signal_name] = attrgetter(signal_name)
+            else:
+                self.signal_accessors[signal_name] = _missing_signal
+
+    def _grow(self):
+        """Double the capacity of every column, keeping the stored samples."""
+        new_capacity = self._capacity * 2
+        for name, column in self._columns.items():
+            grown = np.empty((new_capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            self._columns[name] = grown
+        self._capacity = new_capacity
+
+    def _add_column(self, name: str, value: Any) -> np.ndarray:
+        """Allocate the column for a signal from its first sample."""
+        column = _new_column(value, self._capacity, self._signal_dtypes.get(name))
+        if self._memmap_dir is not None and column.dtype != object:
+            self._memmap_dir.mkdir(parents=True, exist_ok=True)
+            column = np.lib.format.open_memmap(
+                self._memmap_dir / f"{name}.npy",
+                mode="w+",
+                dtype=column.dtype,
+                shape=column.shape,
             )
+        self._columns[name] = column
+        if name not in self._signal_dtypes and column.dtype.kind in "biu":
+            # Declared dtypes are kept as given; inferred ones may need promoting
+            self._narrow_columns[name] = type(value)
+        return column
+
+    def _promote_column(self, name: str, index: int, value: Any) -> np.ndarray:
+        """Re-type an inferred integer/bool column for a sample it would truncate."""
+        # e.g. 2.5 after ints, which column[index] = value would store as 2
+        column = self._columns[name]
+        if not isinstance(value, (bool, int, float, np.number, np.bool_)):
+            return column  # Non-numeric samples are widened by _store_row
+        dtype = np.result_type(column.dtype, np.asarray(value).dtype)
+        if dtype != column.dtype:
+            promoted = np.empty(self._capacity, dtype=dtype)
+            promoted[:index] = column[:index]
+            column = self._columns[name] = promoted
+        if dtype.kind in "biu":
+            self._narrow_columns[name] = type(value)
+        else:
+            del self._narrow_columns[name]
+        return column
+
+    def _widen_column(self, name: str, index: int, value: Any):
+        """Fall back to an object column for a sample the dtype can't hold."""
+        # e.g. None after floats, or a shape change
+        column = self._columns[name]
+        widened = np.empty(self._capacity, dtype=object)
+        widened[:index] = list(column[:index])
+        widened[index] = value
+        self._columns[name] = widened
+        self._narrow_columns.pop(name, None)
 
     def collect(self, state: EDMState, info: Dict[str, Any] | None = None):
         """
@@ -123,45 +525,71 @@ class SimulationLogger:
             state: The current EDMState object.
             info: Optional dictionary from env.step(), useful for 'control_step' frequency.
         """
+        # Replaced per instance in __init__ by the variant for the configured
+        # frequency; kept here as the documented entry point
+        getattr(self, f"_collect_{self.config['log_frequency']['type']}")(state, info)
+
+    def _collect_every_step(self, state: EDMState, info=None):
+        """Log every collected step."""
         self.step_counter += 1
-        should_log = False
-        log_freq_conf = self.config["log_frequency"]
-
-        if log_freq_conf["type"] == "every_step":
-            should_log = True
-        elif log_freq_conf["type"] == "control_step":
-            if info and info.get("control_step", False):
-                should_log = True
-        elif log_freq_conf["type"] == "interval":
-            if self.step_counter % log_freq_conf["value"] == 0:
-                should_log = True
-
-        if should_log:
-            for signal_name in self.config["signals_to_log"]:
-                accessor = self.signal_accessors.get(signal_name)
-                if accessor:
-                    value = accessor(state)
-                    # Handle cases like NumPy arrays or specific data types if needed by backend
-
-                    # If the value is a NumPy array, store a copy to avoid issues with in-place modifications
-                    # of the original array in the simulation state.
-                    processed_value = (
-                        value.copy() if isinstance(value, np.ndarray) else value
-                    )
+        self._record(state)
 
-                    if self.config["backend"]["type"] == "memory":
-                        self.log_data[signal_name].append(processed_value)
-                    elif self.config["backend"]["type"] == "numpy":
-                        # For numpy, we also append to lists first, convert to np.array in finalize
-                        self.log_data[signal_name].append(processed_value)
-                    else:
-                        # Logic for other backends would go here
-                        pass
-                else:
-                    # Optionally log a warning if an accessor isn't found
-                    print(
-                        f"Warning: No accessor found for signal '{signal_name}'. Skipping."
-                    )
+    def _collect_control_step(self, state: EDMState, info=None):
+        """Log only steps flagged as control steps in ``info``."""
+        self.step_counter += 1
+        if info and info.get("control_step", False):
+            self._record(state)
+
+    def _collect_interval(self, state: EDMState, info=None):
+        """Log every N-th collected step."""
+        self.step_counter += 1
+        if self.step_counter % self._log_interval == 0:
+            self._record(state)
+
+    def _store_row(self, state: EDMState):
+        """Write one logged sample into the columns."""
+        index = self._size
+        if index == self._capacity:
+            self._grow()
+        columns = self._columns
+        narrow_columns = self._narrow_columns
+        for signal_name, accessor in self._accessors:
+            value = accessor(state)
+            column = columns.get(signal_name)
+            if column is None:
+                column = self._add_column(signal_name, value)
+            narrow_type = narrow_columns.get(signal_name)
+            if narrow_type is not None and type(value) is not narrow_type:
+                column = self._promote_column(signal_name, index, value)
+            try:
+                # Array values are copied into the column slab, not referenced
+                column[index] = value
+            except (TypeError, ValueError):
+                self._widen_column(signal_name, index, value)
+        self._size = index + 1
+
+    def _open_stream(self):
+        """Open the .jsonl file and write the optional metadata header record."""
+        output_path = pathlib.Path(self.config["backend"]["filepath"])
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Buffered: rows reach the OS only when the 1 MB buffer fills or on finalize()
+        self._stream = open(output_path, "wb", buffering=_JSONL_WRITE_BUFFER)
+        metadata = self.config.get("metadata")
+        if metadata is not None:
+            self._stream.write(_dumps_json({"metadata": metadata}) + b"\n")
+
+    def _write_row(self, state: EDMState):
+        """Append one logged sample as a JSON Lines record."""
+        if self._stream is None:
+            self._open_stream()
+        row = {name: accessor(state) for name, accessor in self._accessors}
+        self._stream.write(_dumps_json(row) + b"\n")
+        self._size += 1
+
+    @property
+    def log_data(self) -> Dict[str, np.ndarray]:
+        """Logged columns trimmed to the number of collected samples."""
+        return {name: column[: self._size] for name, column in self._columns.items()}
 
     def finalize(self):
         """
@@ -175,30 +603,12 @@ class SimulationLogger:
             filepath_str = self.config["backend"]["filepath"]
             should_compress = self.config["backend"].get("compress", False)
 
-            if not self.log_data:
+            if not self._size:
                 print("No data collected, skipping .npz file creation.")
                 return
 
-            # Convert lists to numpy arrays
-            numpy_data = {}
-            for signal_name, data_list in self.log_data.items():
-                try:
-                    # Attempt to convert, ensuring all elements can form a consistent NumPy array
-                    # This is crucial if logged values are, e.g., mixed types or variable-length arrays themselves
-                    # For simple scalar series, this is usually fine.
-                    # If a signal itself is a list/array per step, np.array(data_list) creates an object array if ragged,
-                    # or a 2D+ array if consistent.
-                    numpy_data[signal_name] = np.array(data_list)
-                except Exception as e:
-                    print(
-                        f"Warning: Could not convert signal '{signal_name}' to NumPy array: {e}. Skipping this signal in .npz."
-                    )
-
-            if not numpy_data:
-                print(
-                    "No signals could be converted to NumPy arrays, skipping .npz file creation."
-                )
-                return
+            # Columns are already numpy arrays; only trim to the write cursor
+            numpy_data = self.log_data
 
             output_path = pathlib.Path(filepath_str)
             output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -211,21 +621,130 @@ class SimulationLogger:
                 print(f"Logged data saved to {output_path}")
             except Exception as e:
                 print(f"Error saving data to {output_path}: {e}")
+        elif self.config["backend"]["type"] == "npy":
+            if not self._size:
+                print("No data collected, skipping .npy directory creation.")
+                return
+
+            output_dir = pathlib.Path(self.config["backend"]["filepath"])
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            try:
+                # Uncompressed, one file per signal: no zlib pass at finalize and
+                # numeric columns can be memory-mapped on load
+                for signal_name in list(self._columns):
+                    column = self._columns[signal_name]
+                    if isinstance(column, np.memmap):
+                        if len(column) == self._size:
+                            column.flush()  # Preallocated file is exactly full
+                            continue
+                        # Shorter run than preallocated: rewrite the file trimmed
+                        column = self._columns[signal_name] = np.array(
+                            column[: self._size]
+                        )
+                    np.save(output_dir / f"{signal_name}.npy", column[: self._size])
+                print(f"Logged data saved to {output_dir}")
+            except Exception as e:
+                print(f"Error saving data to {output_dir}: {e}")
+        elif self.config["backend"]["type"] == "blosc2":
+            if not self._size:
+                print("No data collected, skipping .b2frame directory creation.")
+                return
+
+            output_dir = pathlib.Path(self.config["backend"]["filepath"])
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            try:
+                # One compressed frame per numeric column; blosc2's shuffle +
+                # Zstd is tens of times faster than savez_compressed's zlib
+                for signal_name, column in self.log_data.items():
+                    if column.dtype == object:
+                        np.save(output_dir / f"{signal_name}.npy", column)
+                        continue
+                    blosc2.save_tensor(
+                        np.ascontiguousarray(column),
+                        str(output_dir / f"{signal_name}.b2frame"),
+                        mode="w",
+                    )
+                print(f"Logged data saved to {output_dir}")
+            except Exception as e:
+                print(f"Error saving data to {output_dir}: {e}")
+        elif self.config["backend"]["type"] == "json":
+            if not self._size:
+                print("No data collected, skipping .json file creation.")
+                return
+
+            output_path = pathlib.Path(self.config["backend"]["filepath"])
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            try:
+                # orjson writes each numpy column directly, no .tolist() round-trip
+                columns = {
+                    name: _json_column(column) for name, column in self.log_data.items()
+                }
+                if "time" in columns:
+                    columns["time"] = _encode_time(columns["time"])
+                for name, dtype in self._signal_dtypes.items():
+                    if name in columns and dtype.kind in "biu":
+                        columns[name] = _encode_rle(columns[name])
+                # "metadata" is written last so it can be patched in place
+                payload = {"columns": columns, "metadata": self.config.get("metadata")}
+                output_path.write_bytes(_dumps_json(payload))
+                print(f"Logged data saved to {output_path}")
+            except Exception as e:
+                print(f"Error saving data to {output_path}: {e}")
+        elif self.config["backend"]["type"] == "jsonl":
+            if self._stream is None:
+                print("No data collected, skipping .jsonl file creation.")
+                return
+            self._stream.close()  # Flushes the remaining buffered rows
+            self._stream = None
+            print(f"Logged data saved to {self.config['backend']['filepath']}")
+        elif self.config["backend"]["type"] == "msgpack":
+            if not self._size:
+                print("No data collected, skipping .msgpack file creation.")
+                return
+
+            output_path = pathlib.Path(self.config["backend"]["filepath"])
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            try:
+                columns = {
+                    name: _msgpack_column(column)
+                    for name, column in self.log_data.items()
+                }
+                output_path.write_bytes(
+                    msgpack.packb(
+                        {"columns": columns},
+                        use_bin_type=True,
+                        default=_json_default,
+                    )
+                )
+                print(f"Logged data saved to {output_path}")
+            except Exception as e:
+                print(f"Error saving data to {output_path}: {e}")
 
-    def get_data(self) -> Dict[str, List[Any]] | str | None:
+    def get_data(self) -> Dict[str, np.ndarray] | str | None:
         """
         Retrieves the logged data or its location.
 
         Returns:
-            - A dictionary (signal -> list of values) if backend is "memory".
-            - A string (filepath) if backend is "numpy" and successful.
+            - A dictionary (signal -> array of values) if backend is "memory".
+            - A string (filepath) for the file backends.
             - None otherwise or if data hasn't been finalized for file backends.
         """
         if self.config["backend"]["type"] == "memory":
             return self.log_data
-        elif self.config["backend"]["type"] == "numpy":
+        elif self.config["backend"]["type"] in (
+            "numpy",
+            "npy",
+            "blosc2",
+            "json",
+            "msgpack",
+            "jsonl",
+        ):
             # Return the filepath, assuming finalize has been called.
-            # User is responsible for loading the .npz file.
+            # User is responsible for loading the .npz/.json/.msgpack file.
             return self.config["backend"].get("filepath")
         return None
 
@@ -233,7 +752,12 @@ class SimulationLogger:
         """
         Resets the logger's internal state for a new episode.
         """
-        self.log_data = defaultdict(list)
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        self._columns = {}
+        self._capacity = self._initial_capacity
+        self._size = 0
         self.step_counter = 0
 
 
@@ -0,0 +1,46 @@
+"""Tests for the dielectric module."""
+
+import numpy as np
+import pytest
+
+from wedm.modules.dielectric import _dielectric_step, fast_exp
+
+
+class TestDielectricStep:
+    """Test the jitted debris bookkeeping kernel."""
+
+    def test_crater_adds_debris_and_flow_removes_it(self):
+        """Test crater debris is added and then flushed by the flow."""
+        coeff = np.pi * 0.1 * 20.0
+        debris, density, cavity, flow = _dielectric_step(
+            50.0, 0.0, coeff, 1 / 25.0, 1.0, 1e-6, 0.01
+        )
+        assert cavity == pytest.approx(coeff * 0.05)
+        assert density == pytest.approx(min(1.0, 0.01 / cavity))
+        # Gap above the reference gap: flow limited only by debris obstruction
+        assert flow == pytest.approx(np.exp(-density), rel=1e-6)
+        assert debris == pytest.approx(0.01 - 1e-6 * flow)
+
+    def test_density_is_capped(self):
+        """Test debris density saturates at 1 in a small cavity."""
+        _, density, _, flow = _dielectric_step(
+            0.001, 1.0, 1.0, 1 / 25.0, 1.0, 1e-6, 0.0
+        )
+        assert density == 1.0
+        assert 0.0 <= flow < 1e-9
+
+    def test_gap_factor_below_reference_gap(self):
+        """Test flow scales with (gap / reference_gap)³ below the reference gap."""
+        _, _, _, flow = _dielectric_step(10.0, 0.0, 1.0, 1 / 25.0, 1.0, 1e-6, 0.0)
+        assert flow == pytest.approx((10.0 / 25.0) ** 3)
+
+    def test_fast_exp_accuracy(self):
+        """Test fast_exp tracks exp(-x) closely, including the squared range."""
+        for x in np.linspace(0.0, 2.0, 201):
+            assert fast_exp(x) == pytest.approx(np.exp(-x), rel=1e-7, abs=0.0)
+        assert fast_exp(1e6) == 0.0
+
+    @pytest.mark.parametrize("x", [100.0, 300.0, 500.0, 511.9975, 690.0])
+    def test_fast_exp_relative_error_at_large_x(self, x):
+        """Test the documented 4e-6 relative error bound holds for large x."""
+        assert fast_exp(x) == pytest.approx(np.exp(-x), rel=4e-6, abs=0.0)
@@ -0,0 +1,101 @@
+"""Tests for the ignition module."""
+
+import numpy as np
+import pytest
+
+from wedm import IgnitionModuleParameters, WireEDMEnv
+
+
+class TestIgnitionModule:
+    """Test IgnitionModule probability models."""
+
+    def test_lambda_lookup_table(self):
+        """Test get_lambda follows ln(2)/(a*gap² + b*gap + c) within a bin."""
+        env = WireEDMEnv()
+        env.reset(seed=0)
+        ignition = env.ignition
+        params = ignition.params
+
+        for gap in (2.0, 10.04, 37.5, 150.0):
+            env.state.wire_position = env.state.workpiece_position - gap
+            expected = np.log(2) / (
+                params.ignition_a_coeff * gap**2
+                + params.ignition_b_coeff * gap
+                + params.ignition_c_coeff
+            )
+            assert ignition.get_lambda(env.state) == pytest.approx(expected, rel=0.02)
+
+        # Gaps past the table reuse its last bin
+        env.state.wire_position = env.state.workpiece_position - 1000.0
+        assert ignition.get_lambda(env.state) == ignition._lambda_lut[-1]
+
+    def test_debris_short_probability_sigmoid(self):
+        """Test the jitted sigmoid matches 1 / (1 + exp(-k (ρ - ρ_crit)))."""
+        ignition = WireEDMEnv().ignition
+        params = ignition.params
+
+        gap = 20.0
+        critical = params.base_critical_density + params.gap_coefficient * gap
+        for density in (0.0, critical - 0.01, critical, critical + 0.005, 1.0):
+            x = params.sigmoid_steepness * (density - critical)
+            expected = 1.0 / (1.0 + np.exp(-x))
+            assert ignition.get_debris_short_probability(gap, density) == pytest.approx(
+                expected, rel=1e-6, abs=1e-300
+            )
+
+        assert ignition.get_debris_short_probability(1.0, 0.0) == 1.0
+
+    def test_short_circuit_pulse_cycle(self):
+        """Test a short in idle delivers an ON-time pulse, then rests for OFF time."""
+        env = WireEDMEnv()
+        env.reset(seed=0)
+        state = env.state
+        state.ON_time, state.OFF_time = 3.0, 5.0
+        state.wire_position = state.workpiece_position - 1.0  # Below hard-short gap
+
+        env.ignition.update(state)
+        assert state.is_short_circuit is True
+        assert state.spark_state == -1
+        assert state.voltage == 0.0
+        assert state.current > 0.0
+
+        spark_states = []
+        for _ in range(8):
+            env.ignition.update(state)
+            spark_states.append(state.spark_state)
+        assert spark_states == [-1, -1, -2, -2, -2, -2, -2, 0]
+
+    def test_random_short_probability_ramp(self):
+        """Test random shorts follow the linear ramp between min and max gap."""
+        params = IgnitionModuleParameters(
+            random_short_max_probability=1.0,
+            random_short_min_gap=2.0,
+            random_short_max_gap=50.0,
+        )
+        env = WireEDMEnv(ignition_params=params)
+        env.reset(seed=0)
+        ignition = env.ignition
+        state = env.state
+        state.wire_position = state.workpiece_position - 10.0  # P = 40 / 48
+
+        # Rolls: debris short (P ≈ 0 at zero density), then random short
+        for roll, expected in ((0.8, True), (0.85, False)):
+            state.spark_state = -2  # Resting, so no ignition roll is consumed
+            ignition._uniform_rng = env.np_random
+            ignition._uniform_buffer = np.array([0.5, roll, 0.5, 0.5])
+            ignition._uniform_index = 0
+            ignition.random_short_remaining = 0
+            ignition.update(state)
+            assert state.is_short_circuit is expected
+
+    def test_short_circuit_status_reuses_dict(self):
+        """Test get_short_circuit_status refreshes and returns one dict."""
+        ignition = WireEDMEnv().ignition
+        first = ignition.get_short_circuit_status()
+        assert first["total_short_remaining_us"] == 0
+
+        ignition.debris_short_remaining = 7
+        second = ignition.get_short_circuit_status()
+        assert second is first
+        assert second["has_debris_short"] is True
+        assert second["total_short_remaining_us"] == 7
@@ -0,0 +1,416 @@
+"""Tests for the simulation logger."""
+
+import json
+
+import numpy as np
+import pytest
+
+from wedm.core.state import EDMState
+from wedm.utils import logger as logger_module
+from wedm.utils.logger import (
+    SimulationLogger,
+    load_blosc2_log,
+    load_json_log,
+    load_msgpack_log,
+    load_npy_log,
+    write_json_metadata,
+)
+
+
+def _run_logger(config, n_steps=5, n_segments=4):
+    """Collect a few steps from a synthetic state and finalize."""
+    sim_logger = SimulationLogger(config)
+    state = EDMState()
+    state.wire_temperature = np.full(n_segments, 293.15, dtype=np.float64)
+    for i in range(n_steps):
+        state.time = i
+        state.wire_position = 0.5 * i
+        state.wire_temperature[0] = 293.15 + i
+        sim_logger.collect(state, {"control_step": i % 2 == 0})
+    sim_logger.finalize()
+    return sim_logger
+
+
+class TestSimulationLogger:
+    """Test SimulationLogger backends."""
+
+    def test_memory_backend(self):
+        """Test memory backend keeps every logged sample."""
+        sim_logger = _run_logger(
+            {
+                "signals_to_log": ["time", "wire_position"],
+                "log_frequency": {"type": "every_step"},
+                "backend": {"type": "memory"},
+            }
+        )
+        data = sim_logger.get_data()
+        assert list(data["time"]) == [0, 1, 2, 3, 4]
+        assert list(data["wire_position"]) == [0.0, 0.5, 1.0, 1.5, 2.0]
+
+    def test_interval_frequency(self):
+        """Test interval logging keeps every N-th collected step."""
+        sim_logger = _run_logger(
+            {
+                "signals_to_log": ["time"],
+                "log_frequency": {"type": "interval", "value": 2},
+                "backend": {"type": "memory"},
+            }
+        )
+        assert list(sim_logger.get_data()["time"]) == [1, 3]
+
+    def test_columns_grow_past_buffer_size(self):
+        """Test columns are preallocated and grow geometrically when full."""
+        sim_logger = _run_logger(
+            {
+                "signals_to_log": ["time", "wire_temperature", "voltage"],
+                "log_frequency": {"type": "every_step"},
+                "backend": {"type": "memory"},
+                "buffer_size": 2,
+            },
+            n_steps=5,
+        )
+        assert sim_logger._capacity == 8
+        data = sim_logger.get_data()
+        assert data["time"].dtype == np.int64
+        assert data["wire_temperature"].shape == (5, 4)
+        assert data["wire_temperature"].dtype == np.float64
+        # Logged arrays are copies, not views of the live state
+        np.testing.assert_allclose(
+            data["wire_temperature"][:, 0], 293.15 + np.arange(5), rtol=1e-6
+        )
+        assert list(data["voltage"]) == [None] * 5
+
+    def test_narrow_columns_promoted_instead_of_truncated(self):
+        """Test a float after ints (or an int after bools) re-types the column."""
+        sim_logger = SimulationLogger(
+            {
+                "signals_to_log": ["time", "is_short_circuit"],
+                "log_frequency": {"type": "every_step"},
+                "backend": {"type": "memory"},
+            }
+        )
+        state = EDMState()
+        for time, flag in [(0, False), (1, True), (2.5, 2), (3, False)]:
+            state.time, state.is_short_circuit = time, flag
+            sim_logger.collect(state)
+        data = sim_logger.get_data()
+        assert data["time"].dtype == np.float64
+        assert list(data["time"]) == [0.0, 1.0, 2.5, 3.0]
+        assert data["is_short_circuit"].dtype == np.int64
+        assert list(data["is_short_circuit"]) == [0, 1, 2, 0]
+
+    def test_unknown_signal_logs_none(self):
+        """Test state fields, properties and unknown names all resolve to values."""
+        sim_logger = _run_logger(
+            {
+                "signals_to_log": ["wire_position", "current_mode_str", "no_such"],
+                "log_frequency": {"type": "every_step"},
+                "backend": {"type": "memory"},
+            },
+            n_steps=2,
+        )
+        data = sim_logger.get_data()
+        assert list(data["wire_position"]) == [0.0, 0.5]
+        assert list(data["current_mode_str"]) == [None, None]
+        assert list(data["no_such"]) == [None, None]
+
+    def test_npy_backend_memory_maps_columns(self, tmp_path):
+        """Test npy backend writes one uncompressed file per signal."""
+        dirpath = tmp_path / "log_npy"
+        sim_logger = _run_logger(
+            {
+                "signals_to_log": ["time", "wire_temperature", "voltage"],
+                "log_frequency": {"type": "every_step"},
+                "backend": {"type": "npy", "filepath": str(dirpath)},
+            }
+        )
+        assert sim_logger.get_data() == str(dirpath)
+        assert sorted(p.name for p in dirpath.iterdir()) == [
+            "time.npy",
+            "voltage.npy",
+            "wire_temperature.npy",
+        ]
+
+        data = load_npy_log(str(dirpath), mmap_mode="r")
+        assert isinstance(data["wire_temperature"], np.memmap)
+        assert data["wire_temperature"].shape == (5, 4)
+        np.testing.assert_array_equal(data["time"], np.arange(5.0))
+        assert list(data["voltage"]) == [None] * 5
+
+    @pytest.mark.parametrize("preallocate", [5, 8])
+    def test_npy_backend_preallocated_memmap(self, tmp_path, preallocate):
+        """Test preallocated npy columns are written through memmaps and trimmed."""
+        dirpath = tmp_path / "log_npy"
+        config = {
+            "signals_to_log": ["time", "wire_temperature"],
+            "log_frequency": {"type": "every_step"},
+            "backend": {"type": "npy", "filepath": str(dirpath)},
+            "preallocate": preallocate,
+        }
+        sim_logger = SimulationLogger(config)
+        state = EDMState()
+        state.wire_temperature = np.full(4, 293.15)
+        for i in range(5):
+            state.time = i
+            sim_logger.collect(state)
+        assert isinstance(sim_logger._columns["wire_temperature"], np.memmap)
+        sim_logger.finalize()
+
+        data = load_npy_log(str(dirpath))
+        np.testing.assert_array_equal(data["time"], np.arange(5.0))
+        assert data["wire_temperature"].shape == (5, 4)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_backend(self, tmp_path, monkeypatch, use_orjson):
+        """Test json backend writes numpy values with and without orjson."""
+        if use_orjson and logger_module.orjson is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(logger_module, "orjson", None)
+
+        filepath = tmp_path / "log.json"
+        sim_logger = _run_logger(
+            {
+                "signals_to_log": ["time", "wire_temperature"],
+                "log_frequency": {"type": "every_step"},
+                "backend": {"type": "json", "filepath": str(filepath)},
+            }
+        )
+        assert sim_logger.get_data() == str(filepath)
+
+        data = json.loads(filepath.read_text())["columns"]
+        assert data["time"] == {"__delta_time__": True, "t0": 0.0, "dt": 1.0, "n": 5}
+        assert len(data["wire_temperature"]) == 5
+        assert data["wire_temperature"][4][0] == pytest.approx(297.15, rel=1e-6)
+
+    def test_json_backend_base64_arrays(self, tmp_path):
+        """Test large float array signals are stored as base64 float32 blobs."""
+        filepath = tmp_path / "log.json"
+        _run_logger(
+            {
+                "signals_to_log": ["time", "wire_temperature"],
+                "log_frequency": {"type": "every_step"},
+                "backend": {"type": "json", "filepath": str(filepath)},
+            },
+            n_segments=64,
+        )
+        raw = json.loads(filepath.read_text())["columns"]["wire_temperature"]
+        assert raw["dtype"] == "float32"
+        assert raw["shape"] == [5, 64]
+
+        data = load_json_log(str(filepath))["columns"]
+        assert data["wire_temperature"].dtype == np.float32
+        np.testing.assert_allclose(
+            data["wire_temperature"][:, 0], 293.15 + np.arange(5), rtol=1e-6
+        )
+        np.testing.assert_array_equal(data["time"], np.arange(5.0))
+
+    def test_json_backend_irregular_time(self, tmp_path):
+        """Test irregular time stamps round-trip through the residuals."""
+        filepath = tmp_path / "log.json"
+        sim_logger = SimulationLogger(
+            {
+                "signals_to_log": ["time"],
+                "log_frequency": {"type": "every_step"},
+                "backend": {"type": "json", "filepath": str(filepath)},
+            }
+        )
+        state = EDMState()
+        times = [0, 50, 100, 175, 200]
+        for t in times:
+            state.time = t
+            sim_logger.collect(state)
+        sim_logger.finalize()
+
+        raw = json.loads(filepath.read_text())["columns"]["time"]
+        assert raw["dt"] == 50.0
+        assert "residuals" in raw
+        data = load_json_log(str(filepath))["columns"]
+        np.testing.assert_allclose(data["time"], times)
+
+    def test_json_backend_rle_flags(self, tmp_path):
+        """Test declared bool/enum signals are run-length encoded."""
+        filepath = tmp_path / "log.json"
+        sim_logger = SimulationLogger(
+            {
+                "signals_to_log": ["is_short_circuit", "wire_position"],
+                "log_frequency": {"type": "every_step"},
+                "backend": {"type": "json", "filepath": str(filepath)},
+                "signal_dtypes": {"is_short_circuit": "bool"},
+            }
+        )
+        state = EDMState()
+        flags = [False] * 50 + [True] * 3 + [False] * 47
+        for flag in flags:
+            state.is_short_circuit = flag
+            sim_logger.collect(state)
+        sim_logger.finalize()
+
+        raw = json.loads(filepath.read_text())["columns"]["is_short_circuit"]
+        assert raw == {
+            "__rle__": True,
+            "values": [False, True, False],
+            "runs": [50, 3, 47],
+        }
+        data = load_json_log(str(filepath))["columns"]
+        np.testing.assert_array_equal(data["is_short_circuit"], flags)
+        assert len(data["wire_position"]) == 100
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_metadata_patched_in_place(self, tmp_path, monkeypatch, use_orjson):
+        """Test the trailing metadata placeholder can be filled after finalize."""
+        if use_orjson and logger_module.orjson is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(logger_module, "orjson", None)
+
+        filepath = tmp_path / "log.json"
+        _run_logger(
+            {
+                "signals_to_log": ["time"],
+                "log_frequency": {"type": "every_step"},
+                "backend": {"type": "json", "filepath": str(filepath)},
+            }
+        )
+        assert json.loads(filepath.read_text())["metadata"] is None
+
+        # Plain dicts that reuse the encoded-column field names stay dicts
+        metadata = {"seed": 0, "mode": "position", "pulse": {"t0": 1, "dt": 2, "n": 3}}
+        write_json_metadata(str(filepath), metadata)
+        data = load_json_log(str(filepath))
+        assert data["metadata"] == metadata
+        np.testing.assert_array_equal(data["columns"]["time"], np.arange(5.0))
+
+        with pytest.raises(ValueError):
+            write_json_metadata(str(filepath), {"seed": 1})
+
+    def test_unknown_frequency_rejected(self):
+        """Test an unknown log frequency type fails at construction."""
+        with pytest.raises(ValueError):
+            SimulationLogger(
+                {
+                    "signals_to_log": ["time"],
+                    "log_frequency": {"type": "sometimes"},
+                    "backend": {"type": "memory"},
+                }
+            )
+
+    @pytest.mark.parametrize(
+        "frequency",
+        [
+            {"type": "interval"},
+            {"type": "interval", "interval": 100},
+            {"type": "interval", "value": 0},
+            {"type": "interval", "value": 2.5},
+        ],
+    )
+    def test_interval_requires_positive_value(self, frequency):
+        """Test interval logging rejects a missing, misspelled or invalid value."""
+        with pytest.raises(ValueError, match="value"):
+            SimulationLogger(
+                {
+                    "signals_to_log": ["time"],
+                    "log_frequency": frequency,
+                    "backend": {"type": "memory"},
+                }
+            )
+
+    def test_json_backend_requires_filepath(self):
+        """Test json backend validation."""
+        with pytest.raises(ValueError):
+            SimulationLogger(
+                {
+                    "signals_to_log": ["time"],
+                    "log_frequency": {"type": "every_step"},
+                    "backend": {"type": "json"},
+                }
+            )
+
+    def test_msgpack_backend_roundtrip(self, tmp_path):
+        """Test msgpack backend stores numeric columns as raw binary arrays."""
+        if logger_module.msgpack is None:
+            pytest.skip("msgpack not installed")
+
+        filepath = tmp_path / "log.msgpack"
+        sim_logger = _run_logger(
+            {
+                "signals_to_log": ["time", "wire_temperature", "voltage"],
+                "log_frequency": {"type": "every_step"},
+                "backend": {"type": "msgpack", "filepath": str(filepath)},
+            }
+        )
+        assert sim_logger.get_data() == str(filepath)
+
+        data = load_msgpack_log(str(filepath))["columns"]
+        np.testing.assert_array_equal(data["time"], np.arange(5.0))
+        assert data["wire_temperature"].dtype == np.float64
+        assert data["wire_temperature"].shape == (5, 4)
+        assert data["voltage"] == [None] * 5
+
+    def test_msgpack_backend_requires_package(self, monkeypatch):
+        """Test msgpack backend fails early when msgpack is missing."""
+        monkeypatch.setattr(logger_module, "msgpack", None)
+        with pytest.raises(ImportError):
+            SimulationLogger(
+                {
+                    "signals_to_log": ["time"],
+                    "log_frequency": {"type": "every_step"},
+                    "backend": {"type": "msgpack", "filepath": "log.msgpack"},
+                }
+            )
+
+    def test_blosc2_backend_roundtrip(self, tmp_path):
+        """Test blosc2 backend compresses numeric columns and keeps object ones."""
+        if logger_module.blosc2 is None:
+            pytest.skip("blosc2 not installed")
+
+        dirpath = tmp_path / "log_b2"
+        sim_logger = _run_logger(
+            {
+                "signals_to_log": ["time", "wire_temperature", "voltage"],
+                "log_frequency": {"type": "every_step"},
+                "backend": {"type": "blosc2", "filepath": str(dirpath)},
+            }
+        )
+        assert sim_logger.get_data() == str(dirpath)
+        assert sorted(p.name for p in dirpath.iterdir()) == [
+            "time.b2frame",
+            "voltage.npy",
+            "wire_temperature.b2frame",
+        ]
+
+        data = load_blosc2_log(str(dirpath))
+        np.testing.assert_array_equal(data["time"], np.arange(5.0))
+        assert data["wire_temperature"].dtype == np.float64
+        assert data["wire_temperature"].shape == (5, 4)
+        assert list(data["voltage"]) == [None] * 5
+
+    def test_blosc2_backend_requires_package(self, monkeypatch):
+        """Test blosc2 backend fails early when blosc2 is missing."""
+        monkeypatch.setattr(logger_module, "blosc2", None)
+        with pytest.raises(ImportError):
+            SimulationLogger(
+                {
+                    "signals_to_log": ["time"],
+                    "log_frequency": {"type": "every_step"},
+                    "backend": {"type": "blosc2", "filepath": "log_b2"},
+                }
+            )
+
+    def test_jsonl_backend_streams_rows(self, tmp_path):
+        """Test jsonl backend writes a metadata header and one record per sample."""
+        filepath = tmp_path / "log.jsonl"
+        sim_logger = _run_logger(
+            {
+                "signals_to_log": ["time", "wire_temperature"],
+                "log_frequency": {"type": "control_step"},
+                "backend": {"type": "jsonl", "filepath": str(filepath)},
+                "metadata": {"seed": 0},
+            }
+        )
+        assert sim_logger.get_data() == str(filepath)
+
+        records = [json.loads(line) for line in filepath.read_text().splitlines()]
+        assert records[0] == {"metadata": {"seed": 0}}
+        assert [r["time"] for r in records[1:]] == [0, 2, 4]
+        assert records[-1]["wire_temperature"][0] == pytest.approx(297.15)
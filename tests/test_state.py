@@ -1,7 +1,10 @@
 """Tests for EDM State."""
 
+import sys
+
 import numpy as np
-from wedm.core.state import EDMState
+import pytest
+from wedm.core.state import EDMState, edm_state_dtype
 
 
 class TestEDMState:
@@ -26,3 +29,46 @@ class TestEDMState:
         assert state.wire_position == 10.0
         assert state.workpiece_position == 15.0
         assert state.target_position == 100.0
+
+    def test_state_record_roundtrip(self):
+        """Test scalar fields pack into edm_state_dtype and load back."""
+        state = EDMState()
+        state.time = 1234
+        state.wire_position = 12.5
+        state.voltage = 80.0
+        state.is_short_circuit = True
+
+        record = state.to_record()
+        assert record.dtype == edm_state_dtype
+        assert record["time"] == 1234
+        assert record["wire_position"] == 12.5
+        assert np.isnan(record["current"])
+
+        restored = EDMState()
+        restored.load_record(record)
+        assert restored.time == 1234
+        assert restored.wire_position == 12.5
+        assert restored.voltage == 80.0
+        assert restored.current is None
+        assert restored.is_short_circuit is True
+
+    def test_spark_status_legacy_view(self):
+        """Test spark_status reads and writes the scalar spark fields."""
+        state = EDMState()
+        assert state.spark_status == [0, None, 0]
+
+        state.spark_status = [1, 2.5, 0]
+        assert state.spark_state == 1
+        assert state.spark_y == 2.5
+        assert state.spark_duration == 0
+
+        state.spark_status = [0, None, 0]
+        assert np.isnan(state.spark_y)
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="needs dataclass slots")
+    def test_state_uses_slots(self):
+        """Test EDMState has no instance __dict__ and rejects unknown attributes."""
+        state = EDMState()
+        assert not hasattr(state, "__dict__")
+        with pytest.raises(AttributeError):
+            state.spark_location = 1.0
@@ -0,0 +1,33 @@
+"""Tests for the wire module."""
+
+import numpy as np
+
+from wedm import WireEDMEnv
+
+
+class TestWireModule:
+    """Test WireModule thermal update."""
+
+    def test_update_tracks_field_maximum(self):
+        """Test the in-kernel threshold flags drive the critical counter and break."""
+        env = WireEDMEnv()
+        env.reset(seed=0)
+        wire = env.wire
+        state = env.state
+        state.current = 60.0
+        state.dielectric_temperature = 293.15
+
+        # A hot spot above the critical temperature, away from the contacts
+        state.wire_temperature[wire.zone_start + 10] = wire.critical_temperature + 50.0
+        wire.update(state)
+        assert state.time_in_critical_temp == 1
+        assert not state.is_wire_broken
+
+        state.wire_temperature[:] = wire.params.spool_T
+        wire.update(state)
+        assert state.time_in_critical_temp == 0
+        assert np.max(state.wire_temperature) < wire.critical_temperature
+
+        state.wire_temperature[-1] = wire.breaking_temperature + 50.0
+        wire.update(state)
+        assert state.is_wire_broken